@@ -19,6 +19,7 @@ logging.basicConfig(
 # Import db from models (models.py creates the SQLAlchemy instance)
 from models import db
 from auth import ha_auth_required
+from utils.json_provider import OrjsonProvider
 
 # Initialize Flask-Migrate
 migrate = Migrate()
@@ -48,6 +49,7 @@ class IngressMiddleware:
 def create_app(config_name=None):
     """Application factory pattern for Flask app creation."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     if config_name is None:
@@ -204,6 +206,18 @@ def register_middleware(app):
                     g.ha_user = None
                     g.api_authenticated = False
 
+    @app.teardown_request
+    def discard_failed_transaction(exc):
+        """Roll back whatever a request left uncommitted when it raised.
+
+        Services commit their own unit of work, once per action; anything
+        still pending when a view raises belongs to the failed action.
+        Rolling back here keeps it from leaking into a later commit when
+        the session outlives the request (tests, CLI commands).
+        """
+        if exc is not None:
+            db.session.rollback()
+
 
 def register_routes(app):
     """Register all application routes."""
@@ -214,13 +228,14 @@ def register_routes(app):
     from routes.rewards import rewards_bp
     from routes.points import points_bp
     from routes.user_mapping import user_mapping_bp
-    from routes.debug import debug_bp
+    from routes.debug import debug_bp, debug_enabled
 
     # Register auth blueprint first (handles login/logout)
     app.register_blueprint(auth_bp)
 
-    # Register debug blueprint (for troubleshooting)
-    app.register_blueprint(debug_bp)
+    # Register debug blueprint (for troubleshooting) only when DEBUG is true
+    if debug_enabled():
+        app.register_blueprint(debug_bp)
 
     # Register UI blueprint (so it handles the root route)
     app.register_blueprint(ui_bp)
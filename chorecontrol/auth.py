@@ -101,6 +101,30 @@ def parent_required(f):
     return decorated_function
 
 
+def require_role(*roles, message='This action requires parent privileges'):
+    """Decorator factory restricting an API route to users with one of roles.
+
+    Use beneath ha_auth_required, which has already rejected requests with
+    no user; the lookup here is served from the per-request cache.
+
+    Args:
+        *roles: Roles allowed to call the route
+        message: Message for the 403 response
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            user = get_current_user()
+            if user is None or user.role not in roles:
+                return jsonify({
+                    'error': 'Forbidden',
+                    'message': message
+                }), 403
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
 def get_current_user():
     """
     Get the current authenticated user from the database.
@@ -19,6 +19,8 @@ class Config:
     DATA_DIR = Path(os.environ.get('DATA_DIR', '/data'))
     SQLALCHEMY_DATABASE_URI = f"sqlite:///{DATA_DIR / 'chorecontrol.db'}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Raise on relationship access without an explicit loader (catches N+1s)
+    SQLALCHEMY_RAISELOAD = False
 
     # APScheduler settings
     SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', 'true').lower() == 'true'
@@ -30,6 +32,9 @@ class Config:
     HA_INGRESS_ENABLED = os.environ.get('INGRESS', 'true').lower() == 'true'
     HA_WEBHOOK_URL = os.environ.get('HA_WEBHOOK_URL')
     # Example: http://homeassistant.local:8123/api/webhook/chorecontrol-abc123
+    # Deliver webhooks from a background thread pool instead of the request
+    WEBHOOK_ASYNC = True
+    WEBHOOK_WORKERS = int(os.environ.get('WEBHOOK_WORKERS', '4'))
 
     # Application settings
     DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
@@ -43,6 +48,7 @@ class DevelopmentConfig(Config):
     SQLALCHEMY_DATABASE_URI = f"sqlite:///{DATA_DIR / 'chorecontrol.db'}"
     # Keep scheduler running in development
     SCHEDULER_ENABLED = True
+    SQLALCHEMY_RAISELOAD = True
 
 
 class ProductionConfig(Config):
@@ -59,6 +65,9 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     # Disable scheduler during tests
     SCHEDULER_ENABLED = False
+    SQLALCHEMY_RAISELOAD = True
+    # Deliver webhooks inline so tests can assert on them
+    WEBHOOK_ASYNC = False
 
 
 # Config dictionary for easy access
@@ -0,0 +1,39 @@
+"""
+Database maintenance job.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def optimize_database():
+    """
+    Refresh SQLite query planner statistics.
+
+    Runs nightly at 02:30. Queries such as due-today filter on
+    "due_date = ? OR due_date IS NULL" alongside status and assignee
+    filters; SQLite already seeks idx_chore_instances_due_date for both OR
+    branches, but whether it prefers that over idx_chore_instances_status
+    depends on sqlite_stat1. PRAGMA optimize runs ANALYZE only on tables
+    whose statistics are missing or stale, so it is cheap when nothing
+    changed.
+    """
+    logger.info("Starting database optimize")
+
+    # Import inside function to avoid circular imports and to get app context
+    from sqlalchemy import text
+    from models import db
+
+    try:
+        if db.engine.dialect.name != 'sqlite':
+            logger.info("Database optimize skipped: not SQLite")
+            return
+        with db.engine.connect() as conn:
+            conn.execute(text('PRAGMA optimize'))
+            conn.commit()
+        logger.info("Database optimize complete")
+
+    except Exception as e:
+        logger.error(f"Error in database optimize: {e}")
+        raise
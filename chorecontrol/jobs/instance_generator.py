@@ -22,6 +22,7 @@ def generate_daily_instances():
     # Import inside function to avoid circular imports and to get app context
     from models import db, Chore
     from utils.instance_generator import generate_instances_for_chore, calculate_lookahead_end_date
+    from utils.webhooks import fire_instance_created_webhooks
 
     try:
         active_chores = Chore.query.filter_by(is_active=True).all()
@@ -38,15 +39,7 @@ def generate_daily_instances():
                 total_instances += len(instances)
 
                 # Fire webhooks only for instances due today or NULL due date
-                for instance in instances:
-                    if instance.due_date == today or instance.due_date is None:
-                        try:
-                            from utils.webhooks import fire_webhook
-                            fire_webhook('chore_instance_created', instance)
-                            webhooks_fired += 1
-                        except ImportError:
-                            # Webhooks not yet implemented
-                            pass
+                webhooks_fired += fire_instance_created_webhooks(instances, today)
 
             except Exception as e:
                 logger.error(f"Error generating instances for chore {chore.id}: {e}")
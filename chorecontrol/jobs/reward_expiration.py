@@ -18,10 +18,15 @@ def expire_pending_rewards():
     logger.info("Checking for expired reward claims")
 
     # Import inside function to avoid circular imports and to get app context
-    from models import db, RewardClaim, User
+    from sqlalchemy.orm import joinedload
+    from models import db, RewardClaim
 
     try:
-        expired = RewardClaim.query.filter(
+        # The claimer and reward are needed for every refund
+        expired = RewardClaim.query.options(
+            joinedload(RewardClaim.user),
+            joinedload(RewardClaim.reward)
+        ).filter(
             RewardClaim.status == 'pending',
             RewardClaim.expires_at <= datetime.utcnow()
         ).all()
@@ -33,7 +38,7 @@ def expire_pending_rewards():
                 claim.status = 'rejected'
 
                 # Refund points
-                user = User.query.get(claim.user_id)
+                user = claim.user
                 if user:
                     user.adjust_points(
                         delta=claim.points_spent,
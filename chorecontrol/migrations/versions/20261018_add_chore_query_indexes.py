@@ -0,0 +1,32 @@
+"""Add composite indexes for chore and chore instance listings
+
+Revision ID: 20261018_chore_indexes
+Revises: 20261018_server_timestamps
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_chore_indexes'
+down_revision = '20261018_server_timestamps'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_chores_active_created', 'chores', ['is_active', 'created_at', 'id']),
+    ('idx_chore_assignments_user_chore', 'chore_assignments', ['user_id', 'chore_id']),
+    ('idx_chore_instances_chore_due', 'chore_instances', ['chore_id', 'due_date', 'id']),
+    ('idx_chore_instances_chore_status_due', 'chore_instances', ['chore_id', 'status', 'due_date']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
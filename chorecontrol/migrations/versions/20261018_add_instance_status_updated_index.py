@@ -0,0 +1,27 @@
+"""Index chore instances by (status, updated_at) for recent activity
+
+Replaces idx_chore_instances_status, which is a prefix of the new index.
+
+Revision ID: 20261018_instance_status_updated
+Revises: 20261018_list_page_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_instance_status_updated'
+down_revision = '20261018_list_page_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('idx_chore_instances_status_updated', 'chore_instances', ['status', 'updated_at'])
+    op.drop_index('idx_chore_instances_status', table_name='chore_instances')
+
+
+def downgrade():
+    op.create_index('idx_chore_instances_status', 'chore_instances', ['status'])
+    op.drop_index('idx_chore_instances_status_updated', table_name='chore_instances')
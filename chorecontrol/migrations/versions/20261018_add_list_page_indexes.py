@@ -0,0 +1,35 @@
+"""Add (created_at, id) indexes for keyset-paginated UI lists
+
+Replaces idx_points_history_user, which is a prefix of the new per-user index.
+
+Revision ID: 20261018_list_page_indexes
+Revises: 20261018_reward_claim_reward_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_list_page_indexes'
+down_revision = '20261018_reward_claim_reward_idx'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_chores_created', 'chores', ['created_at', 'id']),
+    ('idx_rewards_created', 'rewards', ['created_at', 'id']),
+    ('idx_points_history_user_created', 'points_history', ['user_id', 'created_at', 'id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.drop_index('idx_points_history_user', table_name='points_history')
+
+
+def downgrade():
+    op.create_index('idx_points_history_user', 'points_history', ['user_id'])
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""Add counters table for pending approval counts
+
+Revision ID: 20261018_pending_counters
+Revises: 20261018_instance_status_updated
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_pending_counters'
+down_revision = '20261018_instance_status_updated'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    # Backfill counters from existing rows
+    op.execute(
+        "INSERT INTO counters (name, value) "
+        "SELECT 'pending_instances', COUNT(*) FROM chore_instances WHERE status = 'claimed'"
+    )
+    op.execute(
+        "INSERT INTO counters (name, value) "
+        "SELECT 'pending_reward_claims', COUNT(*) FROM reward_claims WHERE status = 'pending'"
+    )
+
+
+def downgrade():
+    op.drop_table('counters')
@@ -0,0 +1,51 @@
+"""Add approved claim counters for rewards
+
+Revision ID: 20261018_reward_counters
+Revises: 20250106_extra
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_reward_counters'
+down_revision = '20250106_extra'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Add running approved claim count to rewards
+    with op.batch_alter_table('rewards', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('approved_claims_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Per-user approved claim counts
+    op.create_table('reward_user_claim_counts',
+        sa.Column('reward_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('approved_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['reward_id'], ['rewards.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('reward_id', 'user_id')
+    )
+
+    # Backfill counters from existing approved claims
+    op.execute(
+        "UPDATE rewards SET approved_claims_count = ("
+        "SELECT COUNT(*) FROM reward_claims "
+        "WHERE reward_claims.reward_id = rewards.id AND reward_claims.status = 'approved')"
+    )
+    op.execute(
+        "INSERT INTO reward_user_claim_counts (reward_id, user_id, approved_count) "
+        "SELECT reward_id, user_id, COUNT(*) FROM reward_claims "
+        "WHERE status = 'approved' GROUP BY reward_id, user_id"
+    )
+
+
+def downgrade():
+    op.drop_table('reward_user_claim_counts')
+
+    with op.batch_alter_table('rewards', schema=None) as batch_op:
+        batch_op.drop_column('approved_claims_count')
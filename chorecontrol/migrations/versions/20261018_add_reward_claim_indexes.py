@@ -0,0 +1,34 @@
+"""Add composite indexes for reward claim lookups
+
+Replaces idx_reward_claims_user, which is a prefix of the new per-user index.
+
+Revision ID: 20261018_reward_claim_indexes
+Revises: 20261018_chore_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_reward_claim_indexes'
+down_revision = '20261018_chore_indexes'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_reward_claims_user_reward_status', 'reward_claims', ['user_id', 'reward_id', 'status', 'claimed_at']),
+    ('idx_reward_claims_status_claimed_at', 'reward_claims', ['status', 'claimed_at']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.drop_index('idx_reward_claims_user', table_name='reward_claims')
+
+
+def downgrade():
+    op.create_index('idx_reward_claims_user', 'reward_claims', ['user_id'])
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,23 @@
+"""Add a (reward_id, status) index on reward claims
+
+Revision ID: 20261018_reward_claim_reward_idx
+Revises: 20261018_reward_timestamps
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_reward_claim_reward_idx'
+down_revision = '20261018_reward_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('idx_reward_claims_reward_status', 'reward_claims', ['reward_id', 'status'])
+
+
+def downgrade():
+    op.drop_index('idx_reward_claims_reward_status', table_name='reward_claims')
@@ -0,0 +1,33 @@
+"""Use database-generated timestamps for rewards
+
+Revision ID: 20261018_reward_timestamps
+Revises: 20261018_reward_claim_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_reward_timestamps'
+down_revision = '20261018_reward_claim_indexes'
+branch_labels = None
+depends_on = None
+
+# Current UTC time with fractional seconds (matches models.sql_utcnow)
+UTCNOW = sa.text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
+
+def upgrade():
+    with op.batch_alter_table('rewards', schema=None) as batch_op:
+        for column in ('created_at', 'updated_at'):
+            batch_op.alter_column(column, existing_type=sa.DateTime(),
+                                  existing_nullable=False, server_default=UTCNOW)
+
+
+def downgrade():
+    with op.batch_alter_table('rewards', schema=None) as batch_op:
+        for column in ('created_at', 'updated_at'):
+            batch_op.alter_column(column, existing_type=sa.DateTime(),
+                                  existing_nullable=False, server_default=None)
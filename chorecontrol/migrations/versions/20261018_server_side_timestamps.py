@@ -0,0 +1,40 @@
+"""Use database-generated timestamps for claims, points history and settings
+
+Revision ID: 20261018_server_timestamps
+Revises: 20261018_reward_counters
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_server_timestamps'
+down_revision = '20261018_reward_counters'
+branch_labels = None
+depends_on = None
+
+# Current UTC time with fractional seconds (matches models.sql_utcnow)
+UTCNOW = sa.text("(strftime('%Y-%m-%d %H:%M:%f', 'now'))")
+
+TIMESTAMP_COLUMNS = [
+    ('reward_claims', 'claimed_at'),
+    ('points_history', 'created_at'),
+    ('settings', 'created_at'),
+    ('settings', 'updated_at'),
+]
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(),
+                                  existing_nullable=False, server_default=UTCNOW)
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(),
+                                  existing_nullable=False, server_default=None)
@@ -5,11 +5,18 @@ This module defines the database models for the chore management system.
 Uses Flask-SQLAlchemy for ORM integration with Flask.
 """
 
+import math
+import time
+from collections import namedtuple
 from datetime import datetime, date, timedelta
 from typing import Optional, List
+from flask import current_app, has_app_context
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import CheckConstraint, UniqueConstraint, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import CheckConstraint, UniqueConstraint, Index, event, inspect, func, select, update, bindparam, and_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import aliased, relationship, column_property, object_session
+from sqlalchemy.orm.attributes import set_committed_value
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from utils.timezone import local_today
@@ -17,6 +24,16 @@ from utils.timezone import local_today
 db = SQLAlchemy()
 
 
+def sql_utcnow():
+    """SQL expression for the current UTC time, evaluated by the database.
+
+    CURRENT_TIMESTAMP on SQLite only has whole-second precision, which would
+    tie the ordering of rows written within the same second, so keep the
+    fractional seconds.
+    """
+    return func.strftime('%Y-%m-%d %H:%M:%f', 'now')
+
+
 class User(db.Model):
     """User model representing both parents and kids in the system."""
 
@@ -99,7 +116,8 @@ class User(db.Model):
         return self.points == calculated
 
     def adjust_points(self, delta: int, reason: str, created_by_id: Optional[int] = None,
-                     chore_instance_id: Optional[int] = None, reward_claim_id: Optional[int] = None) -> None:
+                     chore_instance_id: Optional[int] = None, reward_claim_id: Optional[int] = None,
+                     reward_claim: Optional['RewardClaim'] = None) -> None:
         """
         Adjust user's points and create history entry.
 
@@ -109,6 +127,9 @@ class User(db.Model):
             created_by_id: User ID of who made the adjustment
             chore_instance_id: Optional reference to chore instance
             reward_claim_id: Optional reference to reward claim
+            reward_claim: Optional reward claim object; use instead of reward_claim_id
+                for a claim that has not been flushed yet so both rows are inserted
+                in the same flush
 
         """
         import logging
@@ -124,6 +145,8 @@ class User(db.Model):
             chore_instance_id=chore_instance_id,
             reward_claim_id=reward_claim_id
         )
+        if reward_claim is not None:
+            history.reward_claim = reward_claim
         db.session.add(history)
         db.session.flush()  # Flush so history is visible to the query
 
@@ -134,6 +157,141 @@ class User(db.Model):
         if self.points != calculated:
             logger.warning(f"Points mismatch detected for user {self.id}: stored={self.points}, calculated={calculated}")
 
+    def spend_points(self, amount: int, reason: str, created_by_id: Optional[int] = None,
+                     reward_claim: Optional['RewardClaim'] = None) -> bool:
+        """
+        Deduct points only if the balance covers them, and create history entry.
+
+        The balance check and the deduction are a single
+        UPDATE ... WHERE points >= amount, so concurrent spends cannot take the
+        balance below zero. The history entry is left for the caller's commit
+        to flush.
+
+        Args:
+            amount: Points to deduct (positive)
+            reason: Description of why points were spent
+            created_by_id: User ID of who made the adjustment
+            reward_claim: Optional reward claim the points were spent on
+
+        Returns:
+            bool: True if the points were deducted, False if the balance was too low
+        """
+        row = db.session.execute(
+            update(User)
+            .where(User.id == self.id, User.points >= amount)
+            .values(points=User.points - amount)
+            .returning(User.points, User.updated_at),
+            execution_options={'synchronize_session': False}
+        ).first()
+        if row is None:
+            return False
+
+        # Already written, so record the new values without another UPDATE
+        set_committed_value(self, 'points', row.points)
+        set_committed_value(self, 'updated_at', row.updated_at)
+        history = PointsHistory(
+            user_id=self.id,
+            points_delta=-amount,
+            reason=reason,
+            created_by=created_by_id
+        )
+        history.reward_claim = reward_claim
+        db.session.add(history)
+        return True
+
+    def update_profile(self, username: Optional[str] = None, role: Optional[str] = None,
+                       password: Optional[str] = None) -> bool:
+        """
+        Change username, role and/or password in a single UPDATE.
+
+        The username is only written if no other user has it: the check is a
+        NOT EXISTS in the UPDATE's WHERE clause, so two concurrent renames
+        cannot both take the same name. A parent changed to a kid starts
+        with 0 points.
+
+        Args:
+            username: New username, or None to keep the current one
+            role: New role, or None to keep the current one
+            password: New plaintext password, or None to keep the current one
+
+        Returns:
+            bool: True if the user was updated, False if the username was taken
+        """
+        values = {}
+        if username is not None:
+            values['username'] = username
+        if role is not None:
+            if self.role == 'parent' and role == 'kid':
+                values['points'] = 0
+            values['role'] = role
+        if password is not None:
+            values['password_hash'] = generate_password_hash(password)
+        if not values:
+            return True
+
+        stmt = update(User).where(User.id == self.id)
+        if username is not None:
+            other = aliased(User)
+            stmt = stmt.where(~select(other.id).where(
+                other.username == username, other.id != self.id
+            ).exists())
+        row = db.session.execute(
+            stmt.values(**values).returning(User.updated_at),
+            execution_options={'synchronize_session': False}
+        ).first()
+        if row is None:
+            return False
+
+        # Already written, so record the new values without another UPDATE
+        for key, value in values.items():
+            set_committed_value(self, key, value)
+        set_committed_value(self, 'updated_at', row.updated_at)
+
+        # A bulk UPDATE skips the after_update event that clears this
+        if username is not None or role is not None:
+            current_app.extensions.pop(_KID_OPTIONS_KEY, None)
+        return True
+
+    @staticmethod
+    def kid_options() -> List['KidOption']:
+        """Id and username of every kid, by username, for dropdowns.
+
+        Cached per app for KID_OPTIONS_CACHE_TTL seconds. Inserting, deleting
+        or renaming a user (or changing a role) in this worker clears it.
+        """
+        now = time.monotonic()
+        entry = current_app.extensions.get(_KID_OPTIONS_KEY)
+        if entry is None or entry[0] <= now:
+            rows = db.session.execute(
+                select(User.id, User.username).where(User.role == 'kid').order_by(User.username)
+            ).all()
+            entry = (now + KID_OPTIONS_CACHE_TTL, [KidOption(*row) for row in rows])
+            current_app.extensions[_KID_OPTIONS_KEY] = entry
+        return entry[1]
+
+
+# Lightweight kid row for filter and assignment dropdowns
+KidOption = namedtuple('KidOption', ['id', 'username'])
+
+# How long a worker trusts its cached kid list. Other gunicorn workers see
+# user changes once their entry expires.
+KID_OPTIONS_CACHE_TTL = 60  # seconds
+_KID_OPTIONS_KEY = 'chorecontrol_kid_options'
+
+
+@event.listens_for(User, 'after_insert')
+@event.listens_for(User, 'after_delete')
+def _evict_kid_options(mapper, connection, target):
+    if has_app_context():
+        current_app.extensions.pop(_KID_OPTIONS_KEY, None)
+
+
+@event.listens_for(User, 'after_update')
+def _evict_kid_options_on_change(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.role.history.has_changes() or state.attrs.username.history.has_changes():
+        _evict_kid_options(mapper, connection, target)
+
 
 class Chore(db.Model):
     """Chore model representing a chore template (recurring or one-off)."""
@@ -184,11 +342,28 @@ class Chore(db.Model):
                        name='check_recurrence_type'),
         CheckConstraint("assignment_type IN ('individual', 'shared') OR assignment_type IS NULL",
                        name='check_assignment_type'),
+        # list_chores filters on is_active and pages by (created_at, id)
+        Index('idx_chores_active_created', 'is_active', 'created_at', 'id'),
+        # The UI chores list pages by (created_at, id) with no is_active filter
+        Index('idx_chores_created', 'created_at', 'id'),
     )
 
     def __repr__(self):
         return f'<Chore {self.name}>'
 
+    @hybrid_property
+    def is_work_together(self) -> bool:
+        """Shared chore that several kids may claim and complete together.
+
+        Also usable in queries (Chore.is_work_together), so list projections
+        can select it as a single column.
+        """
+        return self.assignment_type == 'shared' and bool(self.allow_work_together)
+
+    @is_work_together.expression
+    def is_work_together(cls):
+        return and_(cls.assignment_type == 'shared', cls.allow_work_together == True)  # noqa: E712
+
     def to_dict(self) -> dict:
         """Serialize Chore to dictionary for JSON/webhook responses."""
         return {
@@ -301,6 +476,7 @@ class ChoreAssignment(db.Model):
     __table_args__ = (
         UniqueConstraint('chore_id', 'user_id', 'due_date', name='unique_chore_user_date'),
         Index('idx_chore_assignments_chore_user', 'chore_id', 'user_id'),
+        Index('idx_chore_assignments_user_chore', 'user_id', 'chore_id'),
     )
 
     def __repr__(self):
@@ -318,7 +494,11 @@ class ChoreInstance(db.Model):
     assigned_to = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
 
     # Status tracking
-    status = db.Column(db.String(20), default='assigned', nullable=False)
+    # active_history so status transitions are visible to the counter events
+    status = column_property(
+        db.Column(db.String(20), default='assigned', nullable=False),
+        active_history=True
+    )
 
     # Who did what when
     claimed_by = db.Column(db.Integer, db.ForeignKey('users.id'))
@@ -354,9 +534,13 @@ class ChoreInstance(db.Model):
     __table_args__ = (
         CheckConstraint("status IN ('assigned', 'claimed', 'claiming_closed', 'approved', 'rejected', 'missed')",
                        name='check_instance_status'),
-        Index('idx_chore_instances_status', 'status'),
+        # Status filters; updated_at bounds the dashboard's recent activity
+        Index('idx_chore_instances_status_updated', 'status', 'updated_at'),
         Index('idx_chore_instances_due_date', 'due_date'),
         Index('idx_chore_instances_assigned_to', 'assigned_to'),
+        # Per-chore instance listings, with and without a status filter
+        Index('idx_chore_instances_chore_due', 'chore_id', 'due_date', 'id'),
+        Index('idx_chore_instances_chore_status_due', 'chore_id', 'status', 'due_date'),
     )
 
     def __repr__(self):
@@ -398,8 +582,7 @@ class ChoreInstance(db.Model):
 
     def is_work_together(self) -> bool:
         """Check if this is a work-together instance."""
-        return (self.chore.assignment_type == 'shared' and
-                self.chore.allow_work_together)
+        return self.chore.is_work_together
 
     def can_claim(self, user_id: int) -> bool:
         """
@@ -436,11 +619,11 @@ class ChoreInstance(db.Model):
             if self.claiming_closed_at is not None:
                 return False
             # Check if user already claimed
-            existing_claim = ChoreInstanceClaim.query.filter_by(
+            already_claimed = db.session.query(ChoreInstanceClaim.query.filter_by(
                 chore_instance_id=self.id,
                 user_id=user_id
-            ).first()
-            if existing_claim:
+            ).exists()).scalar()
+            if already_claimed:
                 return False
             # Check if user is eligible (assigned to the chore)
             return self._is_user_assigned(user_id)
@@ -455,21 +638,17 @@ class ChoreInstance(db.Model):
             return self._is_user_assigned(user_id)
 
         # For individual chores without assigned_to, check ChoreAssignment
-        assignment = ChoreAssignment.query.filter_by(
+        return db.session.query(ChoreAssignment.query.filter_by(
             chore_id=self.chore_id,
             user_id=user_id
-        ).first()
-        return assignment is not None
+        ).exists()).scalar()
 
     def _is_user_assigned(self, user_id: int) -> bool:
         """Check if user is assigned to this chore (for shared chores)."""
         if self.chore.assignments:
-            # If assignments exist, only those kids can claim
-            assignment = ChoreAssignment.query.filter_by(
-                chore_id=self.chore_id,
-                user_id=user_id
-            ).first()
-            return assignment is not None
+            # If assignments exist, only those kids can claim; they are
+            # already loaded, so no query is needed
+            return any(a.user_id == user_id for a in self.chore.assignments)
         else:
             # No specific assignments = ALL kids can claim
             user = db.session.get(User, user_id)
@@ -699,6 +878,11 @@ class ChoreInstanceClaim(db.Model):
             )
 
 
+# Serialized rewards by id: {reward_id: (updated_at, to_dict() result)}
+REWARD_DICT_CACHE_SIZE = 2048
+_reward_dict_cache: dict[int, tuple[datetime, dict]] = {}
+
+
 class Reward(db.Model):
     """Reward that can be claimed by kids using points."""
 
@@ -715,19 +899,39 @@ class Reward(db.Model):
     max_claims_per_kid = db.Column(db.Integer)  # NULL means unlimited
     requires_approval = db.Column(db.Boolean, default=False, nullable=False)
 
+    # Denormalized count of approved claims, maintained by RewardClaim events
+    approved_claims_count = db.Column(db.Integer, default=0, nullable=False)
+
     is_active = db.Column(db.Boolean, default=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=sql_utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=sql_utcnow(), onupdate=sql_utcnow(), nullable=False)
 
     # Relationships
     claims = relationship('RewardClaim', back_populates='reward', cascade='all, delete-orphan')
 
+    # The UI rewards list pages by (created_at, id)
+    __table_args__ = (
+        Index('idx_rewards_created', 'created_at', 'id'),
+    )
+
+    # Fetch the database-generated timestamps back on flush (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
+
     def __repr__(self):
         return f'<Reward {self.name} ({self.points_cost} pts)>'
 
     def to_dict(self) -> dict:
-        """Serialize Reward to dictionary for JSON/webhook responses."""
-        return {
+        """
+        Serialize Reward to dictionary for JSON/webhook responses.
+
+        Results are cached per process keyed by (id, updated_at); every change
+        to a reward bumps updated_at, so a stale entry is never returned.
+        """
+        cached = _reward_dict_cache.get(self.id)
+        if cached is not None and self.updated_at is not None and cached[0] == self.updated_at:
+            return dict(cached[1])
+
+        data = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
@@ -741,6 +945,14 @@ class Reward(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+        if self.id is not None and self.updated_at is not None:
+            if len(_reward_dict_cache) >= REWARD_DICT_CACHE_SIZE:
+                _reward_dict_cache.clear()
+            _reward_dict_cache[self.id] = (self.updated_at, data)
+
+        # Callers extend the dict (e.g. webhook payloads), so never hand out the cached one
+        return dict(data)
+
     def can_claim(self, user_id: int) -> tuple[bool, Optional[str]]:
         """
         Check if a user can claim this reward.
@@ -751,45 +963,86 @@ class Reward(db.Model):
         Returns:
             tuple: (can_claim: bool, reason: str if False)
         """
+        allowed, reason, _details = self.check_claim(user_id)
+        return allowed, reason
+
+    def check_claim(self, user_id: int) -> tuple[bool, Optional[str], dict]:
+        """
+        Check if a user can claim this reward, with the numbers behind a refusal.
+
+        Args:
+            user_id: ID of user attempting to claim
+
+        Returns:
+            tuple: (can_claim: bool, reason: str if False, details: dict) where
+            details holds 'required'/'current' for insufficient points or
+            'cooldown_days_remaining' for a cooldown, and is empty otherwise
+        """
+        # Only role and points are needed, so skip loading the full User row
+        user = db.session.execute(
+            select(User.role, User.points).where(User.id == user_id)
+        ).first()
+
+        # Both the per-kid limit and the cooldown depend on the user's approved
+        # claims; a user with none cannot be on cooldown
+        user_claims = 0
+        last_claimed_at = None
+        if user is not None and (self.max_claims_per_kid is not None or self.cooldown_days is not None):
+            user_claims = RewardUserClaimCount.get_count(self.id, user_id)
+            if self.cooldown_days is not None and user_claims > 0:
+                last_claimed_at = db.session.execute(
+                    _LAST_APPROVED_CLAIM_STMT, {'reward_id': self.id, 'user_id': user_id}
+                ).scalar()
+
+        return self.check_claim_using(user, user_claims, last_claimed_at)
+
+    def check_claim_using(self, user: Optional['User'], user_claims: int,
+                          last_claimed_at: Optional[datetime]) -> tuple[bool, Optional[str], dict]:
+        """
+        Check if a user can claim this reward using prefetched claim stats.
+
+        This is where the claim rules live; check_claim fetches the stats for
+        one user, and the reward list gets them from listable_for.
+
+        Args:
+            user: User (or row with role and points) attempting to claim, None if not found
+            user_claims: Number of the user's approved claims for this reward
+            last_claimed_at: Time of the user's most recent approved claim, if any
+
+        Returns:
+            tuple: (can_claim: bool, reason: str if False, details: dict) as
+            returned by check_claim
+        """
         if not self.is_active:
-            return False, "Reward is not active"
+            return False, "Reward is not active", {}
 
-        user = db.session.get(User, user_id)
-        if not user:
-            return False, "User not found"
+        if user is None:
+            return False, "User not found", {}
 
         if user.role not in ('kid', 'claim_only'):
-            return False, "Only kids can claim rewards"
+            return False, "Only kids can claim rewards", {}
 
         if user.points < self.points_cost:
-            return False, f"Insufficient points (need {self.points_cost}, have {user.points})"
+            return (False, f"Insufficient points (need {self.points_cost}, have {user.points})",
+                    {'required': self.points_cost, 'current': user.points})
 
         # Check max claims total
         if self.max_claims_total is not None:
-            total_claims = RewardClaim.query.filter_by(
-                reward_id=self.id,
-                status='approved'
-            ).count()
-            if total_claims >= self.max_claims_total:
-                return False, "Reward has reached maximum claims"
+            if self.approved_claims_count >= self.max_claims_total:
+                return False, "Reward has reached maximum claims", {}
 
         # Check max claims per kid
         if self.max_claims_per_kid is not None:
-            user_claims = RewardClaim.query.filter_by(
-                reward_id=self.id,
-                user_id=user_id,
-                status='approved'
-            ).count()
             if user_claims >= self.max_claims_per_kid:
-                return False, "You have reached maximum claims for this reward"
+                return False, "You have reached maximum claims for this reward", {}
 
         # Check cooldown
-        if self.cooldown_days is not None:
-            cooldown_result, cooldown_msg = self.is_on_cooldown(user_id)
-            if cooldown_result:
-                return False, cooldown_msg
+        days_left = self._cooldown_days_left(last_claimed_at)
+        if days_left is not None:
+            return (False, self._cooldown_message(days_left),
+                    {'cooldown_days_remaining': days_left})
 
-        return True, None
+        return True, None, {}
 
     def is_on_cooldown(self, user_id: int) -> tuple[bool, Optional[str]]:
         """
@@ -801,22 +1054,84 @@ class Reward(db.Model):
         Returns:
             tuple: (is_on_cooldown: bool, message: str if on cooldown)
         """
-        if self.cooldown_days is None:
+        days_left = self.cooldown_days_remaining(user_id)
+        if days_left is None:
             return False, None
+        return True, self._cooldown_message(days_left)
+
+    def cooldown_days_remaining(self, user_id: int) -> Optional[int]:
+        """
+        Get the whole days left on this reward's cooldown for a user.
+
+        Args:
+            user_id: ID of user to check cooldown for
+
+        Returns:
+            int: Days remaining, rounded up, or None if not on cooldown
+        """
+        if self.cooldown_days is None:
+            return None
 
-        last_claim = RewardClaim.query.filter_by(
-            reward_id=self.id,
-            user_id=user_id,
-            status='approved'
-        ).order_by(RewardClaim.claimed_at.desc()).first()
+        last_claimed_at = db.session.execute(
+            _LAST_APPROVED_CLAIM_STMT, {'reward_id': self.id, 'user_id': user_id}
+        ).scalar()
+
+        return self._cooldown_days_left(last_claimed_at)
 
-        if last_claim:
-            cooldown_end = last_claim.claimed_at + timedelta(days=self.cooldown_days)
-            if datetime.utcnow() < cooldown_end:
-                days_left = (cooldown_end - datetime.utcnow()).days + 1
-                return True, f"Reward is on cooldown for {days_left} more days"
+    def _cooldown_days_left(self, last_claimed_at: Optional[datetime]) -> Optional[int]:
+        """Days left on the cooldown given the user's most recent approved claim time."""
+        if self.cooldown_days is None or last_claimed_at is None:
+            return None
 
-        return False, None
+        now = datetime.utcnow()
+        cooldown_end = last_claimed_at + timedelta(days=self.cooldown_days)
+        if now < cooldown_end:
+            # Round partial days up: 4.2 days left reads as 5
+            return math.ceil((cooldown_end - now).total_seconds() / 86400)
+
+        return None
+
+    @staticmethod
+    def _cooldown_message(days_left: int) -> str:
+        """Human-readable refusal reason for a cooldown."""
+        return f"Reward is on cooldown for {days_left} more days"
+
+    @staticmethod
+    def listable_for(user_id: Optional[int]):
+        """
+        Query rewards together with a user's claim stats in a single statement.
+
+        Rows are (reward, user_approved_count, user_last_claimed_at), the
+        stats check_claim_using expects. Callers may add filters and ordering.
+
+        Args:
+            user_id: ID of user to collect per-user stats for
+        """
+        last_claims = db.session.query(
+            RewardClaim.reward_id,
+            func.max(RewardClaim.claimed_at).label('last_claimed_at')
+        ).filter(
+            RewardClaim.user_id == user_id,
+            RewardClaim.status == 'approved'
+        ).group_by(RewardClaim.reward_id).subquery()
+
+        return db.session.query(
+            Reward,
+            func.coalesce(RewardUserClaimCount.approved_count, 0),
+            last_claims.c.last_claimed_at
+        ).outerjoin(
+            RewardUserClaimCount,
+            and_(RewardUserClaimCount.reward_id == Reward.id,
+                 RewardUserClaimCount.user_id == user_id)
+        ).outerjoin(
+            last_claims, last_claims.c.reward_id == Reward.id
+        )
+
+
+@event.listens_for(Reward, 'after_update')
+@event.listens_for(Reward, 'after_delete')
+def _evict_reward_dict(mapper, connection, target):
+    _reward_dict_cache.pop(target.id, None)
 
 
 class RewardClaim(db.Model):
@@ -828,11 +1143,15 @@ class RewardClaim(db.Model):
     reward_id = db.Column(db.Integer, db.ForeignKey('rewards.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     points_spent = db.Column(db.Integer, nullable=False)
-    claimed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    claimed_at = db.Column(db.DateTime, server_default=sql_utcnow(), nullable=False)
     expires_at = db.Column(db.DateTime, nullable=True)
 
     # Approval workflow (optional for rewards)
-    status = db.Column(db.String(20), default='approved', nullable=False)
+    # active_history so status transitions are visible to the counter events
+    status = column_property(
+        db.Column(db.String(20), default='approved', nullable=False),
+        active_history=True
+    )
     approved_by = db.Column(db.Integer, db.ForeignKey('users.id'))
     approved_at = db.Column(db.DateTime)
 
@@ -846,10 +1165,18 @@ class RewardClaim(db.Model):
     __table_args__ = (
         CheckConstraint("status IN ('pending', 'approved', 'rejected')",
                        name='check_reward_claim_status'),
-        Index('idx_reward_claims_user', 'user_id'),
         Index('idx_reward_claims_claimed_at', 'claimed_at'),
+        # Covers the per-user cooldown lookups (latest approved claim per reward)
+        Index('idx_reward_claims_user_reward_status', 'user_id', 'reward_id', 'status', 'claimed_at'),
+        # Status-filtered listings ordered by claim time (pending queue, list_claims)
+        Index('idx_reward_claims_status_claimed_at', 'status', 'claimed_at'),
+        # Per-reward claim counts by status (rewards list page)
+        Index('idx_reward_claims_reward_status', 'reward_id', 'status'),
     )
 
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
+
     def __repr__(self):
         return f'<RewardClaim reward_id={self.reward_id} user_id={self.user_id}>'
 
@@ -872,6 +1199,168 @@ class RewardClaim(db.Model):
         }
 
 
+class RewardUserClaimCount(db.Model):
+    """Denormalized count of approved claims per reward and user.
+
+    Maintained by the RewardClaim events below so per-kid claim limits can be
+    checked with a single primary key lookup.
+    """
+
+    __tablename__ = 'reward_user_claim_counts'
+
+    reward_id = db.Column(db.Integer, db.ForeignKey('rewards.id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    approved_count = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<RewardUserClaimCount reward_id={self.reward_id} user_id={self.user_id}>'
+
+    @staticmethod
+    def get_count(reward_id: int, user_id: int) -> int:
+        """Get the number of approved claims a user has for a reward."""
+        count = db.session.execute(
+            _USER_CLAIM_COUNT_STMT, {'reward_id': reward_id, 'user_id': user_id}
+        ).scalar()
+        return count or 0
+
+
+# Statements used by the per-claim checks, built once at import; only the
+# parameters are bound per call so SQLAlchemy reuses the compiled SQL.
+_USER_CLAIM_COUNT_STMT = select(RewardUserClaimCount.approved_count).where(
+    RewardUserClaimCount.reward_id == bindparam('reward_id'),
+    RewardUserClaimCount.user_id == bindparam('user_id')
+)
+
+_LAST_APPROVED_CLAIM_STMT = select(RewardClaim.claimed_at).where(
+    RewardClaim.reward_id == bindparam('reward_id'),
+    RewardClaim.user_id == bindparam('user_id'),
+    RewardClaim.status == 'approved'
+).order_by(RewardClaim.claimed_at.desc()).limit(1)
+
+
+def _adjust_approved_claim_counts(connection, claim: RewardClaim, delta: int) -> None:
+    """Apply delta to the approved claim counters for the claim's reward and user."""
+    rewards = Reward.__table__
+    connection.execute(
+        rewards.update()
+        .where(rewards.c.id == claim.reward_id)
+        .values(approved_claims_count=rewards.c.approved_claims_count + delta)
+    )
+
+    counts = RewardUserClaimCount.__table__
+    upsert = sqlite_insert(counts).values(
+        reward_id=claim.reward_id,
+        user_id=claim.user_id,
+        approved_count=max(delta, 0)
+    ).on_conflict_do_update(
+        index_elements=[counts.c.reward_id, counts.c.user_id],
+        set_={'approved_count': counts.c.approved_count + delta}
+    )
+    connection.execute(upsert)
+
+    # Keep an already-loaded Reward in step with the UPDATE above
+    session = object_session(claim)
+    if session is not None:
+        reward = session.identity_map.get(session.identity_key(Reward, claim.reward_id))
+        if reward is not None and 'approved_claims_count' in reward.__dict__:
+            set_committed_value(
+                reward, 'approved_claims_count', reward.approved_claims_count + delta
+            )
+
+
+@event.listens_for(RewardClaim, 'after_insert')
+def _reward_claim_inserted(mapper, connection, target):
+    if target.status == 'approved':
+        _adjust_approved_claim_counts(connection, target, 1)
+
+
+@event.listens_for(RewardClaim, 'after_update')
+def _reward_claim_updated(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if not history.has_changes():
+        return
+    was_approved = 'approved' in history.deleted
+    is_approved = target.status == 'approved'
+    if was_approved != is_approved:
+        _adjust_approved_claim_counts(connection, target, 1 if is_approved else -1)
+
+
+@event.listens_for(RewardClaim, 'before_delete')
+def _reward_claim_deleted(mapper, connection, target):
+    if target.status == 'approved':
+        _adjust_approved_claim_counts(connection, target, -1)
+
+
+class Counter(db.Model):
+    """Denormalized named counters.
+
+    Holds the number of claimed chore instances and pending reward claims,
+    maintained by the status events below so the nav badge reads two primary
+    key rows instead of counting either table.
+    """
+
+    __tablename__ = 'counters'
+
+    PENDING_INSTANCES = 'pending_instances'
+    PENDING_REWARD_CLAIMS = 'pending_reward_claims'
+
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<Counter {self.name}={self.value}>'
+
+    @staticmethod
+    def adjust(connection, name: str, delta: int) -> None:
+        """Add delta to a counter, creating its row on first use."""
+        counters = Counter.__table__
+        upsert = sqlite_insert(counters).values(
+            name=name, value=delta
+        ).on_conflict_do_update(
+            index_elements=[counters.c.name],
+            set_={'value': counters.c.value + delta}
+        )
+        connection.execute(upsert)
+
+    @staticmethod
+    def pending_total() -> int:
+        """Get the number of claimed chore instances plus pending reward claims."""
+        return db.session.execute(_PENDING_TOTAL_STMT).scalar() or 0
+
+
+_PENDING_TOTAL_STMT = select(func.sum(Counter.value)).where(
+    Counter.name.in_([Counter.PENDING_INSTANCES, Counter.PENDING_REWARD_CLAIMS])
+)
+
+
+def _count_status(model, status: str, counter_name: str) -> None:
+    """Keep counter_name equal to the number of model rows in status."""
+
+    @event.listens_for(model, 'after_insert')
+    def _inserted(mapper, connection, target):
+        if target.status == status:
+            Counter.adjust(connection, counter_name, 1)
+
+    @event.listens_for(model, 'after_update')
+    def _updated(mapper, connection, target):
+        history = inspect(target).attrs.status.history
+        if not history.has_changes():
+            return
+        was_counted = status in history.deleted
+        is_counted = target.status == status
+        if was_counted != is_counted:
+            Counter.adjust(connection, counter_name, 1 if is_counted else -1)
+
+    @event.listens_for(model, 'before_delete')
+    def _deleted(mapper, connection, target):
+        if target.status == status:
+            Counter.adjust(connection, counter_name, -1)
+
+
+_count_status(ChoreInstance, 'claimed', Counter.PENDING_INSTANCES)
+_count_status(RewardClaim, 'pending', Counter.PENDING_REWARD_CLAIMS)
+
+
 class PointsHistory(db.Model):
     """Audit log of all point changes."""
 
@@ -887,7 +1376,7 @@ class PointsHistory(db.Model):
     reward_claim_id = db.Column(db.Integer, db.ForeignKey('reward_claims.id'))
 
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))  # Who made the change
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=sql_utcnow(), nullable=False)
 
     # Relationships
     user = relationship('User', foreign_keys=[user_id], back_populates='points_history')
@@ -897,10 +1386,13 @@ class PointsHistory(db.Model):
 
     # Indexes
     __table_args__ = (
-        Index('idx_points_history_user', 'user_id'),
+        # Per-user history, paged by (created_at, id)
+        Index('idx_points_history_user_created', 'user_id', 'created_at', 'id'),
         Index('idx_points_history_created_at', 'created_at'),
     )
 
+    __mapper_args__ = {'eager_defaults': True}
+
     def __repr__(self):
         return f'<PointsHistory user_id={self.user_id} delta={self.points_delta}>'
 
@@ -918,35 +1410,62 @@ class PointsHistory(db.Model):
         }
 
 
+# How long a worker trusts its cached settings. Settings.set refreshes the
+# local entry immediately; other gunicorn workers see the change once their
+# entry expires.
+SETTINGS_CACHE_TTL = 30  # seconds
+
+
+def _settings_cache() -> dict:
+    """Per-app settings cache: {key: (expires_at, found, value)}."""
+    return current_app.extensions.setdefault('chorecontrol_settings_cache', {})
+
+
 class Settings(db.Model):
     """System settings and configuration."""
 
     __tablename__ = 'settings'
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # unique + index emit a single UNIQUE INDEX (ix_settings_key), no separate
+    # constraint; Settings.set's ON CONFLICT (key) relies on it
     key = db.Column(db.String(255), unique=True, nullable=False, index=True)
     value = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=sql_utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=sql_utcnow(), onupdate=sql_utcnow(), nullable=False)
+
+    __mapper_args__ = {'eager_defaults': True}
 
     def __repr__(self):
         return f'<Settings {self.key}>'
 
     @staticmethod
     def get(key: str, default: Optional[str] = None) -> Optional[str]:
-        """Get a setting value by key."""
-        setting = Settings.query.filter_by(key=key).first()
-        return setting.value if setting else default
+        """Get a setting value by key (cached for SETTINGS_CACHE_TTL seconds)."""
+        cache = _settings_cache()
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is None or entry[0] <= now:
+            row = db.session.execute(
+                select(Settings.value).where(Settings.key == key)
+            ).first()
+            entry = (now + SETTINGS_CACHE_TTL, row is not None, row.value if row else None)
+            cache[key] = entry
+
+        _, found, value = entry
+        return value if found else default
 
     @staticmethod
     def set(key: str, value: str) -> 'Settings':
-        """Set a setting value (creates or updates)."""
-        setting = Settings.query.filter_by(key=key).first()
-        if setting:
-            setting.value = value
-            setting.updated_at = datetime.utcnow()
-        else:
-            setting = Settings(key=key, value=value)
-            db.session.add(setting)
+        """Set a setting value (creates or updates) with a single upsert."""
+        stmt = sqlite_insert(Settings).values(key=key, value=value)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Settings.key],
+            set_={'value': stmt.excluded.value, 'updated_at': sql_utcnow()}
+        ).returning(Settings)
+        setting = db.session.scalars(
+            stmt, execution_options={'populate_existing': True}
+        ).one()
         db.session.commit()
+        _settings_cache()[key] = (time.monotonic() + SETTINGS_CACHE_TTL, True, value)
         return setting
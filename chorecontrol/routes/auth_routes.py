@@ -1,6 +1,8 @@
 """Authentication routes for ChoreControl web interface."""
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, g
+from sqlalchemy import select
+from werkzeug.security import check_password_hash
 from models import db, User
 from auth import login_user, logout_user, get_current_user
 
@@ -23,14 +25,21 @@ def login():
         if not username or not password:
             error = 'Username and password are required'
         else:
-            # Find user by username
-            user = User.query.filter_by(username=username).first()
+            # Find user by username, loading only what login needs
+            user = db.session.execute(
+                select(User.id, User.ha_user_id, User.username, User.password_hash)
+                .where(User.username == username)
+            ).first()
+
+            # End the read transaction so the connection goes back to the
+            # pool before the (slow) password hash check
+            db.session.commit()
 
             if user is None:
                 error = 'Invalid username or password'
-            elif not user.has_password():
+            elif not user.password_hash:
                 error = 'This user cannot log in with a password'
-            elif not user.check_password(password):
+            elif not check_password_hash(user.password_hash, password):
                 error = 'Invalid username or password'
             else:
                 # Successful login
@@ -1,19 +1,28 @@
 """Chore Management API endpoints for ChoreControl (Stream 2)."""
 
 from flask import Blueprint, request, jsonify, g
-from sqlalchemy.orm import joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import func, select, tuple_
 from datetime import datetime, date
+from operator import attrgetter
 
-from models import db, Chore, ChoreAssignment, ChoreInstance, User
+from models import db, Chore, ChoreAssignment, ChoreInstance, Counter, User
 from schemas import validate_recurrence_pattern
 from auth import ha_auth_required, get_current_user as auth_get_current_user
 from utils.instance_generator import generate_instances_for_chore, regenerate_instances_for_chore
+from utils.json_provider import json_response, stream_json_page
+from utils.loading import with_raiseload
+from utils.pagination import encode_cursor, decode_cursor, due_date_keyset_filter
 from utils.timezone import local_today
-from utils.webhooks import fire_webhook
+from utils.webhooks import fire_instance_created_webhooks
 
 chores_bp = Blueprint('chores', __name__, url_prefix='/api/chores')
 
+# Allowed values for enum-style request fields
+_RECURRENCE_TYPES = frozenset(('none', 'simple', 'complex'))
+_ASSIGNMENT_TYPES = frozenset(('individual', 'shared'))
+_INSTANCE_STATUSES = frozenset(('assigned', 'claimed', 'approved', 'rejected'))
+
 
 def get_current_user():
     """Get current User object from g.ha_user."""
@@ -72,6 +81,58 @@ def _parse_int(value, allow_none=True):
     raise ValueError(f"Cannot convert {type(value).__name__} to int")
 
 
+def _parse_date(value):
+    """Parse an ISO date string, returning None for empty values.
+
+    Plain YYYY-MM-DD strings go straight through date.fromisoformat; longer
+    strings (a full datetime) fall back to datetime.fromisoformat.
+
+    Raises:
+        ValueError: If value is not an ISO 8601 date
+    """
+    if not value:
+        return None
+    if len(value) == 10:
+        return date.fromisoformat(value)
+    return datetime.fromisoformat(value).date()
+
+
+# Optional integer fields: (name, minimum, allow_none). Empty values become
+# None when allowed, otherwise 0.
+_INT_FIELDS = (
+    ('late_points', 0, True),
+    ('early_claim_days', 0, False),
+    ('grace_period_days', 0, False),
+    ('expires_after_days', 1, True),
+)
+
+
+def _parse_int_fields(data, partial=False):
+    """Parse and range-check the optional integer chore fields.
+
+    Args:
+        data: Request body
+        partial: Only parse fields present in data (for updates)
+
+    Returns:
+        tuple: (values: dict of field -> int/None, error_message: str if invalid)
+    """
+    values = {}
+    for name, minimum, allow_none in _INT_FIELDS:
+        if partial and name not in data:
+            continue
+        try:
+            value = _parse_int(data.get(name), allow_none=allow_none)
+        except (ValueError, TypeError):
+            return values, f'{name} must be a valid integer'
+        if value is not None and value < minimum:
+            if minimum == 0:
+                return values, f'{name} must be non-negative'
+            return values, f'{name} must be at least {minimum}'
+        values[name] = value
+    return values, None
+
+
 def error_response(message, status_code=400, details=None):
     """Generate consistent error response."""
     response = {
@@ -91,42 +152,123 @@ def success_response(data, message="Success", status_code=200):
     }), status_code
 
 
-def serialize_chore(chore, include_assignments=True, include_counts=False):
-    """Serialize a Chore object to dictionary."""
-    result = {
-        'id': chore.id,
-        'name': chore.name,
-        'description': chore.description,
-        'points': chore.points,
-        'recurrence_type': chore.recurrence_type,
-        'recurrence_pattern': chore.recurrence_pattern,
-        'start_date': chore.start_date.isoformat() if chore.start_date else None,
-        'end_date': chore.end_date.isoformat() if chore.end_date else None,
-        'assignment_type': chore.assignment_type,
-        'allow_work_together': chore.allow_work_together,
-        'extra': chore.extra,
-        'requires_approval': chore.requires_approval,
-        'auto_approve_after_hours': chore.auto_approve_after_hours,
-        'allow_late_claims': chore.allow_late_claims,
-        'late_points': chore.late_points,
-        'is_active': chore.is_active,
-        'created_by': chore.created_by,
-        'created_at': chore.created_at.isoformat() if chore.created_at else None,
-        'updated_at': chore.updated_at.isoformat() if chore.updated_at else None
+def _lookup_usernames(user_ids):
+    """Check that all user IDs exist with a single query.
+
+    Returns:
+        tuple: (usernames: dict of user_id -> username,
+                error_message: names the missing user(s), or None if all exist)
+    """
+    if not user_ids:
+        return {}, None
+
+    usernames = dict(
+        db.session.query(User.id, User.username).filter(User.id.in_(user_ids)).all()
+    )
+    missing = [user_id for user_id in user_ids if user_id not in usernames]
+    if not missing:
+        return usernames, None
+    if len(missing) == 1:
+        return usernames, f"User {missing[0]} not found"
+    return usernames, f"Users not found: {', '.join(str(user_id) for user_id in missing)}"
+
+
+def _insert_assignments(chore_id, user_ids):
+    """Insert ChoreAssignment rows with one multi-row Core INSERT.
+
+    Skips ORM object construction.
+
+    Returns:
+        List of (id, user_id, due_date) rows for the new assignments
+    """
+    if not user_ids:
+        return []
+    table = ChoreAssignment.__table__
+    return db.session.execute(
+        table.insert().returning(table.c.id, table.c.user_id, table.c.due_date),
+        [{'chore_id': chore_id, 'user_id': user_id} for user_id in user_ids]
+    ).all()
+
+
+def _serialize_assignment_rows(rows, usernames):
+    """Serialize (id, user_id, due_date) rows the way serialize_chore does."""
+    return [
+        {
+            'id': assignment_id,
+            'user_id': user_id,
+            'username': usernames.get(user_id),
+            'due_date': due_date
+        }
+        for assignment_id, user_id, due_date in sorted(rows)
+    ]
+
+
+def _chore_counts(chore_ids):
+    """Count assignments and instances for several chores in one query.
+
+    Returns:
+        Dict mapping chore_id to {'assignment_count', 'instance_count'},
+        ready to pass as serialize_chore(counts=...)
+    """
+    if not chore_ids:
+        return {}
+
+    assignment_count = select(func.count(ChoreAssignment.id)).where(
+        ChoreAssignment.chore_id == Chore.id
+    ).correlate(Chore).scalar_subquery()
+    instance_count = select(func.count(ChoreInstance.id)).where(
+        ChoreInstance.chore_id == Chore.id
+    ).correlate(Chore).scalar_subquery()
+
+    rows = db.session.query(Chore.id, assignment_count, instance_count).filter(
+        Chore.id.in_(chore_ids)
+    )
+    return {
+        chore_id: {'assignment_count': assignments, 'instance_count': instances}
+        for chore_id, assignments, instances in rows
     }
 
-    if include_assignments and chore.assignments:
+
+_CHORE_FIELDS = (
+    'id', 'name', 'description', 'points', 'recurrence_type',
+    'recurrence_pattern', 'start_date', 'end_date', 'assignment_type',
+    'allow_work_together', 'extra', 'requires_approval',
+    'auto_approve_after_hours', 'allow_late_claims', 'late_points',
+    'is_active', 'created_by', 'created_at', 'updated_at',
+)
+_get_chore_fields = attrgetter(*_CHORE_FIELDS)
+
+
+def serialize_chore(chore, include_assignments=True, include_counts=False, assignments=None,
+                    counts=None):
+    """Serialize a Chore object to dictionary.
+
+    Dates are left as date/datetime objects; the app's JSON provider renders
+    them as ISO 8601 strings. counts may be an entry from _chore_counts(),
+    which is copied in instead of loading chore.assignments/chore.instances
+    (as include_counts does) just to take their len(). assignments may be a
+    list already built by _serialize_assignment_rows(), which avoids
+    reloading chore.assignments after a write.
+    """
+    result = dict(zip(_CHORE_FIELDS, _get_chore_fields(chore), strict=True))
+
+    if include_assignments and assignments is not None:
+        if assignments:
+            result['assignments'] = assignments
+    elif include_assignments and chore.assignments:
         result['assignments'] = [
             {
                 'id': a.id,
                 'user_id': a.user_id,
                 'username': a.user.username if a.user else None,
-                'due_date': a.due_date.isoformat() if a.due_date else None
+                'due_date': a.due_date
             }
             for a in chore.assignments
         ]
 
-    if include_counts:
+    if counts is not None:
+        result.update(counts)
+    elif include_counts:
         result['assignment_count'] = len(chore.assignments) if chore.assignments else 0
         result['instance_count'] = len(chore.instances) if chore.instances else 0
 
@@ -144,7 +286,8 @@ def list_chores():
     - assigned_to (int): Filter by user_id assigned to chore
     - recurrence_type (str): Filter by recurrence type (none, simple, complex)
     - limit (int): Number of results per page (default: 50)
-    - offset (int): Offset for pagination (default: 0)
+    - cursor (str): next_cursor from the previous page (keyset pagination)
+    - offset (int): Offset for pagination (default: 0, ignored when cursor is given)
     """
     try:
         # Parse query parameters
@@ -153,15 +296,20 @@ def list_chores():
         recurrence_type = request.args.get('recurrence_type')
         limit = request.args.get('limit', default=50, type=int)
         offset = request.args.get('offset', default=0, type=int)
+        cursor = request.args.get('cursor')
 
         # Validate limit
+        if limit < 1:
+            return error_response("Invalid limit. Must be at least 1")
         if limit > 100:
             limit = 100
 
-        # Build query with eager loading
-        query = Chore.query.options(
-            joinedload(Chore.assignments).joinedload(ChoreAssignment.user)
-        )
+        # Build query with eager loading. Assignments come from a second
+        # WHERE chore_id IN (...) query so the paged chore rows aren't
+        # duplicated per assignment.
+        query = Chore.query.options(*with_raiseload(
+            selectinload(Chore.assignments).joinedload(ChoreAssignment.user)
+        ))
 
         # Apply filters
         if active is not None:
@@ -173,26 +321,48 @@ def list_chores():
             )
 
         if recurrence_type:
-            if recurrence_type not in ['none', 'simple', 'complex']:
+            if recurrence_type not in _RECURRENCE_TYPES:
                 return error_response("Invalid recurrence_type. Must be 'none', 'simple', or 'complex'")
             query = query.filter(Chore.recurrence_type == recurrence_type)
 
-        # Get total count
-        total = query.count()
+        # Seek past the last chore of the previous page
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = decode_cursor(cursor, 2)
+                cursor_key = tuple_(datetime.fromisoformat(cursor_created_at), int(cursor_id))
+            except (ValueError, TypeError):
+                return error_response("Invalid cursor")
+            query = query.filter(tuple_(Chore.created_at, Chore.id) < cursor_key)
+            offset = 0
+
+        # Apply pagination and fetch one extra row to detect a following page
+        chores = query.order_by(
+            Chore.created_at.desc(), Chore.id.desc()
+        ).limit(limit + 1).offset(offset).all()
+
+        has_more = len(chores) > limit
+        chores = chores[:limit]
+        next_cursor = None
+        if has_more and chores:
+            next_cursor = encode_cursor(chores[-1].created_at, chores[-1].id)
 
-        # Apply pagination and fetch
-        chores = query.order_by(Chore.created_at.desc()).limit(limit).offset(offset).all()
+        # Count assignments and instances for the whole page in one query
+        counts = _chore_counts([chore.id for chore in chores])
 
         # Serialize results
-        chores_data = [serialize_chore(chore, include_assignments=True, include_counts=True) for chore in chores]
+        chores_data = [
+            serialize_chore(chore, include_assignments=True, counts=counts[chore.id])
+            for chore in chores
+        ]
 
-        return jsonify({
+        return json_response({
             'data': chores_data,
-            'total': total,
+            'has_more': has_more,
             'limit': limit,
             'offset': offset,
+            'next_cursor': next_cursor,
             'message': f'Retrieved {len(chores_data)} chore(s)'
-        }), 200
+        })
 
     except Exception as e:
         return error_response(f"Failed to retrieve chores: {str(e)}", 500)
@@ -243,54 +413,18 @@ def create_chore():
 
         # Validate recurrence_type
         if 'recurrence_type' in data and data['recurrence_type']:
-            if data['recurrence_type'] not in ['none', 'simple', 'complex']:
+            if data['recurrence_type'] not in _RECURRENCE_TYPES:
                 return error_response("recurrence_type must be 'none', 'simple', or 'complex'")
 
         # Validate assignment_type
         if 'assignment_type' in data and data['assignment_type']:
-            if data['assignment_type'] not in ['individual', 'shared']:
+            if data['assignment_type'] not in _ASSIGNMENT_TYPES:
                 return error_response("assignment_type must be 'individual' or 'shared'")
 
         # Validate and convert numeric fields (form data comes as strings)
-        if data.get('late_points') is not None and data.get('late_points') != '':
-            try:
-                data['late_points'] = int(data['late_points'])
-                if data['late_points'] < 0:
-                    return error_response('late_points must be non-negative')
-            except (ValueError, TypeError):
-                return error_response('late_points must be a valid integer')
-        elif data.get('late_points') == '':
-            data['late_points'] = None
-
-        if data.get('early_claim_days') is not None and data.get('early_claim_days') != '':
-            try:
-                data['early_claim_days'] = int(data['early_claim_days'])
-                if data['early_claim_days'] < 0:
-                    return error_response('early_claim_days must be non-negative')
-            except (ValueError, TypeError):
-                return error_response('early_claim_days must be a valid integer')
-        elif data.get('early_claim_days') == '':
-            data['early_claim_days'] = 0
-
-        if data.get('grace_period_days') is not None and data.get('grace_period_days') != '':
-            try:
-                data['grace_period_days'] = int(data['grace_period_days'])
-                if data['grace_period_days'] < 0:
-                    return error_response('grace_period_days must be non-negative')
-            except (ValueError, TypeError):
-                return error_response('grace_period_days must be a valid integer')
-        elif data.get('grace_period_days') == '':
-            data['grace_period_days'] = 0
-
-        if data.get('expires_after_days') is not None and data.get('expires_after_days') != '':
-            try:
-                data['expires_after_days'] = int(data['expires_after_days'])
-                if data['expires_after_days'] < 1:
-                    return error_response('expires_after_days must be at least 1')
-            except (ValueError, TypeError):
-                return error_response('expires_after_days must be a valid integer')
-        elif data.get('expires_after_days') == '':
-            data['expires_after_days'] = None
+        int_values, int_error = _parse_int_fields(data)
+        if int_error:
+            return error_response(int_error)
 
         # Get current user for created_by
         current_user = get_current_user()
@@ -302,19 +436,16 @@ def create_chore():
             points=_parse_int(data['points'], allow_none=False),
             recurrence_type=data.get('recurrence_type'),
             recurrence_pattern=data.get('recurrence_pattern'),
-            start_date=datetime.fromisoformat(data['start_date']).date() if data.get('start_date') else None,
-            end_date=datetime.fromisoformat(data['end_date']).date() if data.get('end_date') else None,
+            start_date=_parse_date(data.get('start_date')),
+            end_date=_parse_date(data.get('end_date')),
             assignment_type=data.get('assignment_type'),
             allow_work_together=_parse_bool(data.get('allow_work_together', False)),
             extra=_parse_bool(data.get('extra', False)),
             requires_approval=_parse_bool(data.get('requires_approval', True)),
             auto_approve_after_hours=_parse_int(data.get('auto_approve_after_hours')),
             allow_late_claims=data.get('allow_late_claims', False),
-            late_points=_parse_int(data.get('late_points')),
-            early_claim_days=_parse_int(data.get('early_claim_days', 0), allow_none=False),
-            grace_period_days=_parse_int(data.get('grace_period_days', 0), allow_none=False),
-            expires_after_days=_parse_int(data.get('expires_after_days')),
-            created_by=current_user.id if current_user else None
+            created_by=current_user.id if current_user else None,
+            **int_values
         )
 
         db.session.add(chore)
@@ -337,37 +468,28 @@ def create_chore():
                     return error_response("Each assignment must have 'user_id'")
                 assignment_user_ids.append(assignment_data['user_id'])
 
-        for user_id in assignment_user_ids:
-            # Verify user exists
-            user = User.query.get(user_id)
-            if not user:
-                db.session.rollback()
-                return error_response(f"User {user_id} not found")
+        # Verify all users exist in one query
+        usernames, missing_error = _lookup_usernames(assignment_user_ids)
+        if missing_error:
+            db.session.rollback()
+            return error_response(missing_error)
 
-            assignment = ChoreAssignment(
-                chore_id=chore.id,
-                user_id=user_id
-            )
-            db.session.add(assignment)
+        assignments = _serialize_assignment_rows(
+            _insert_assignments(chore.id, assignment_user_ids), usernames
+        )
 
         db.session.commit()
 
         # Generate instances for the chore
-        today = local_today()
         instances = generate_instances_for_chore(chore)
 
         # Fire webhooks for instances due today
-        for instance in instances:
-            if instance.due_date == today or instance.due_date is None:
-                fire_webhook('chore_instance_created', instance)
-
-        # Reload with relationships
-        chore = Chore.query.options(
-            joinedload(Chore.assignments).joinedload(ChoreAssignment.user)
-        ).get(chore.id)
+        fire_instance_created_webhooks(instances, local_today())
 
+        # The assignments were just written, so serialize them from the
+        # insert results instead of reloading the chore with its assignments
         return success_response(
-            serialize_chore(chore, include_assignments=True),
+            serialize_chore(chore, include_assignments=True, assignments=assignments),
             "Chore created successfully",
             201
         )
@@ -387,17 +509,17 @@ def get_chore(chore_id):
     GET /api/chores/{id} - Get chore details with assignments and instance counts.
     """
     try:
-        # Query with eager loading
-        chore = Chore.query.options(
-            joinedload(Chore.assignments).joinedload(ChoreAssignment.user),
-            joinedload(Chore.instances)
-        ).get(chore_id)
+        # Query with eager loading (instances are only counted, not loaded)
+        chore = Chore.query.options(*with_raiseload(
+            joinedload(Chore.assignments).joinedload(ChoreAssignment.user)
+        )).get(chore_id)
 
         if not chore:
             return error_response(f"Chore {chore_id} not found", 404)
 
         return success_response(
-            serialize_chore(chore, include_assignments=True, include_counts=True),
+            serialize_chore(chore, include_assignments=True,
+                            counts=_chore_counts([chore_id])[chore_id]),
             "Chore retrieved successfully"
         )
 
@@ -414,7 +536,7 @@ def update_chore(chore_id):
     Request Body: Partial chore object with fields to update.
     """
     try:
-        chore = Chore.query.get(chore_id)
+        chore = db.session.get(Chore, chore_id)
 
         if not chore:
             return error_response(f"Chore {chore_id} not found", 404)
@@ -443,7 +565,7 @@ def update_chore(chore_id):
 
         # Update recurrence_type
         if 'recurrence_type' in data:
-            if data['recurrence_type'] not in ['none', 'simple', 'complex', None]:
+            if data['recurrence_type'] is not None and data['recurrence_type'] not in _RECURRENCE_TYPES:
                 return error_response("recurrence_type must be 'none', 'simple', or 'complex'")
             chore.recurrence_type = data['recurrence_type']
 
@@ -457,14 +579,14 @@ def update_chore(chore_id):
 
         # Update dates
         if 'start_date' in data:
-            chore.start_date = datetime.fromisoformat(data['start_date']).date() if data['start_date'] else None
+            chore.start_date = _parse_date(data['start_date'])
 
         if 'end_date' in data:
-            chore.end_date = datetime.fromisoformat(data['end_date']).date() if data['end_date'] else None
+            chore.end_date = _parse_date(data['end_date'])
 
         # Update assignment_type
         if 'assignment_type' in data:
-            if data['assignment_type'] not in ['individual', 'shared', None]:
+            if data['assignment_type'] is not None and data['assignment_type'] not in _ASSIGNMENT_TYPES:
                 return error_response("assignment_type must be 'individual' or 'shared'")
             chore.assignment_type = data['assignment_type']
 
@@ -486,41 +608,11 @@ def update_chore(chore_id):
         if 'allow_late_claims' in data:
             chore.allow_late_claims = data['allow_late_claims']
 
-        if 'late_points' in data:
-            try:
-                parsed_value = _parse_int(data['late_points'])
-                if parsed_value is not None and parsed_value < 0:
-                    return error_response('late_points must be non-negative')
-                chore.late_points = parsed_value
-            except (ValueError, TypeError):
-                return error_response('late_points must be a valid integer')
-
-        if 'early_claim_days' in data:
-            try:
-                parsed_value = _parse_int(data['early_claim_days'], allow_none=False)
-                if parsed_value < 0:
-                    return error_response('early_claim_days must be non-negative')
-                chore.early_claim_days = parsed_value
-            except (ValueError, TypeError):
-                return error_response('early_claim_days must be a valid integer')
-
-        if 'grace_period_days' in data:
-            try:
-                parsed_value = _parse_int(data['grace_period_days'], allow_none=False)
-                if parsed_value < 0:
-                    return error_response('grace_period_days must be non-negative')
-                chore.grace_period_days = parsed_value
-            except (ValueError, TypeError):
-                return error_response('grace_period_days must be a valid integer')
-
-        if 'expires_after_days' in data:
-            try:
-                parsed_value = _parse_int(data['expires_after_days'])
-                if parsed_value is not None and parsed_value < 1:
-                    return error_response('expires_after_days must be at least 1')
-                chore.expires_after_days = parsed_value
-            except (ValueError, TypeError):
-                return error_response('expires_after_days must be a valid integer')
+        int_values, int_error = _parse_int_fields(data, partial=True)
+        if int_error:
+            return error_response(int_error)
+        for name, value in int_values.items():
+            setattr(chore, name, value)
 
         if 'is_active' in data:
             chore.is_active = data['is_active']
@@ -542,26 +634,40 @@ def update_chore(chore_id):
                     return error_response("Each assignment must have 'user_id'")
                 assignment_user_ids.append(assignment_data['user_id'])
 
-        if assignment_user_ids is not None:
-            # Clear existing assignments
-            ChoreAssignment.query.filter_by(chore_id=chore.id).delete()
-
-            # Add new assignments
-            for user_id in assignment_user_ids:
-                # Verify user exists
-                user = User.query.get(user_id)
-                if not user:
-                    db.session.rollback()
-                    return error_response(f"User {user_id} not found")
+        assignments = None
 
-                assignment = ChoreAssignment(
-                    chore_id=chore.id,
-                    user_id=user_id
-                )
-                db.session.add(assignment)
+        if assignment_user_ids is not None:
+            # Verify all users exist in one query
+            usernames, missing_error = _lookup_usernames(assignment_user_ids)
+            if missing_error:
+                db.session.rollback()
+                return error_response(missing_error)
+
+            # Diff against the current assignments so an unchanged set
+            # costs no writes and does not regenerate instances
+            current_rows = db.session.query(
+                ChoreAssignment.id, ChoreAssignment.user_id, ChoreAssignment.due_date
+            ).filter(ChoreAssignment.chore_id == chore.id).all()
+            current = {row.user_id for row in current_rows}
+            desired = set(assignment_user_ids)
+            to_add = desired - current
+            to_remove = current - desired
+
+            if to_remove:
+                ChoreAssignment.query.filter(
+                    ChoreAssignment.chore_id == chore.id,
+                    ChoreAssignment.user_id.in_(to_remove)
+                ).delete(synchronize_session='fetch')
+
+            added_rows = _insert_assignments(chore.id, sorted(to_add))
+            assignments = _serialize_assignment_rows(
+                [row for row in current_rows if row.user_id in desired] + added_rows,
+                usernames
+            )
 
-            # Mark pattern as changed to regenerate instances with new assignments
-            pattern_changed = True
+            if to_add or to_remove:
+                # Regenerate instances with the new assignments
+                pattern_changed = True
 
         # Update timestamp
         chore.updated_at = datetime.utcnow()
@@ -570,21 +676,20 @@ def update_chore(chore_id):
 
         # Regenerate instances if pattern changed
         if pattern_changed:
-            today = local_today()
             instances = regenerate_instances_for_chore(chore)
 
             # Fire webhooks for new instances due today
-            for instance in instances:
-                if instance.due_date == today or instance.due_date is None:
-                    fire_webhook('chore_instance_created', instance)
+            fire_instance_created_webhooks(instances, local_today())
 
-        # Reload with relationships
-        chore = Chore.query.options(
-            joinedload(Chore.assignments).joinedload(ChoreAssignment.user)
-        ).get(chore_id)
+        # Reload assignments only when this request did not already build them
+        if assignments is None:
+            chore = Chore.query.options(*with_raiseload(
+                joinedload(Chore.assignments).joinedload(ChoreAssignment.user)
+            )).get(chore_id)
 
         return success_response(
-            serialize_chore(chore, include_assignments=True, include_counts=True),
+            serialize_chore(chore, include_assignments=True, assignments=assignments,
+                            counts=_chore_counts([chore_id])[chore_id]),
             "Chore updated successfully"
         )
 
@@ -605,7 +710,7 @@ def delete_chore(chore_id):
     Note: This does not delete the database record or associated instances.
     """
     try:
-        chore = Chore.query.get(chore_id)
+        chore = db.session.get(Chore, chore_id)
 
         if not chore:
             return error_response(f"Chore {chore_id} not found", 404)
@@ -639,15 +744,19 @@ def permanently_delete_chore(chore_id):
     Use with caution - this cannot be undone.
     """
     try:
-        chore = Chore.query.get(chore_id)
+        chore = db.session.get(Chore, chore_id)
 
         if not chore:
             return error_response(f"Chore {chore_id} not found", 404)
 
         chore_name = chore.name
 
-        # Delete all associated instances first
+        # Delete all associated instances first; the bulk delete skips the
+        # ORM events, so take any claimed ones off the pending counter here
+        claimed = ChoreInstance.query.filter_by(chore_id=chore_id, status='claimed').count()
         ChoreInstance.query.filter_by(chore_id=chore_id).delete()
+        if claimed:
+            Counter.adjust(db.session.connection(), Counter.PENDING_INSTANCES, -claimed)
 
         # Delete all assignments
         ChoreAssignment.query.filter_by(chore_id=chore_id).delete()
@@ -665,6 +774,28 @@ def permanently_delete_chore(chore_id):
         return error_response(f"Failed to permanently delete chore: {str(e)}", 500)
 
 
+_INSTANCE_FIELDS = (
+    'id', 'chore_id', 'due_date', 'status', 'claimed_by', 'claimed_at',
+    'approved_by', 'approved_at', 'rejected_by', 'rejected_at',
+    'rejection_reason', 'points_awarded',
+)
+_get_instance_fields = attrgetter(*_INSTANCE_FIELDS)
+
+
+def _serialize_chore_instance(instance):
+    """Serialize a ChoreInstance row for the chore instances listing.
+
+    Plain columns are read with a single attrgetter call; dates stay as
+    date/datetime objects for the JSON provider to render.
+    """
+    result = dict(zip(_INSTANCE_FIELDS, _get_instance_fields(instance), strict=True))
+    chore, claimer, approver = instance.chore, instance.claimer, instance.approver
+    result['chore_name'] = chore.name if chore else None
+    result['claimed_by_username'] = claimer.username if claimer else None
+    result['approved_by_username'] = approver.username if approver else None
+    return result
+
+
 @chores_bp.route('/<int:chore_id>/instances', methods=['GET'])
 @ha_auth_required
 def get_chore_instances(chore_id):
@@ -674,11 +805,12 @@ def get_chore_instances(chore_id):
     Query Parameters:
     - status (str): Filter by status (assigned, claimed, approved, rejected)
     - limit (int): Number of results per page (default: 50)
-    - offset (int): Offset for pagination (default: 0)
+    - cursor (str): next_cursor from the previous page (keyset pagination)
+    - offset (int): Offset for pagination (default: 0, ignored when cursor is given)
     """
     try:
         # Verify chore exists
-        chore = Chore.query.get(chore_id)
+        chore = db.session.get(Chore, chore_id)
         if not chore:
             return error_response(f"Chore {chore_id} not found", 404)
 
@@ -686,59 +818,51 @@ def get_chore_instances(chore_id):
         status = request.args.get('status')
         limit = request.args.get('limit', default=50, type=int)
         offset = request.args.get('offset', default=0, type=int)
+        cursor = request.args.get('cursor')
 
         # Validate limit
+        if limit < 1:
+            return error_response("Invalid limit. Must be at least 1")
         if limit > 100:
             limit = 100
 
         # Build query
-        query = ChoreInstance.query.filter_by(chore_id=chore_id).options(
+        query = ChoreInstance.query.filter_by(chore_id=chore_id).options(*with_raiseload(
             joinedload(ChoreInstance.chore),
             joinedload(ChoreInstance.claimer),
             joinedload(ChoreInstance.approver)
-        )
+        ))
 
         # Apply status filter
         if status:
-            if status not in ['assigned', 'claimed', 'approved', 'rejected']:
+            if status not in _INSTANCE_STATUSES:
                 return error_response("Invalid status. Must be 'assigned', 'claimed', 'approved', or 'rejected'")
             query = query.filter(ChoreInstance.status == status)
 
-        # Get total count
-        total = query.count()
-
-        # Apply pagination and fetch
-        instances = query.order_by(ChoreInstance.due_date.desc()).limit(limit).offset(offset).all()
-
-        # Serialize instances
-        instances_data = [
-            {
-                'id': instance.id,
-                'chore_id': instance.chore_id,
-                'chore_name': instance.chore.name if instance.chore else None,
-                'due_date': instance.due_date.isoformat() if instance.due_date else None,
-                'status': instance.status,
-                'claimed_by': instance.claimed_by,
-                'claimed_by_username': instance.claimer.username if instance.claimer else None,
-                'claimed_at': instance.claimed_at.isoformat() if instance.claimed_at else None,
-                'approved_by': instance.approved_by,
-                'approved_by_username': instance.approver.username if instance.approver else None,
-                'approved_at': instance.approved_at.isoformat() if instance.approved_at else None,
-                'rejected_by': instance.rejected_by,
-                'rejected_at': instance.rejected_at.isoformat() if instance.rejected_at else None,
-                'rejection_reason': instance.rejection_reason,
-                'points_awarded': instance.points_awarded
+        # Seek past the last instance of the previous page
+        if cursor:
+            try:
+                query = query.filter(due_date_keyset_filter(ChoreInstance, cursor))
+            except ValueError:
+                return error_response("Invalid cursor")
+            offset = 0
+
+        # Fetch one extra row to detect a following page, and stream rows
+        # out as they are read rather than building the whole page first
+        rows = query.order_by(
+            ChoreInstance.due_date.desc(), ChoreInstance.id.desc()
+        ).limit(limit + 1).offset(offset).yield_per(50)
+
+        def build_meta(count, has_more, last):
+            return {
+                'has_more': has_more,
+                'limit': limit,
+                'offset': offset,
+                'next_cursor': encode_cursor(last.due_date, last.id) if has_more else None,
+                'message': f'Retrieved {count} instance(s) for chore {chore_id}'
             }
-            for instance in instances
-        ]
 
-        return jsonify({
-            'data': instances_data,
-            'total': total,
-            'limit': limit,
-            'offset': offset,
-            'message': f'Retrieved {len(instances_data)} instance(s) for chore {chore_id}'
-        }), 200
+        return stream_json_page(rows, _serialize_chore_instance, limit, build_meta)
 
     except Exception as e:
         return error_response(f"Failed to retrieve chore instances: {str(e)}", 500)
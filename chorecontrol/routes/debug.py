@@ -6,14 +6,23 @@ import os
 debug_bp = Blueprint('debug', __name__, url_prefix='/debug')
 
 
+def debug_enabled() -> bool:
+    """Whether DEBUG is "true"; run.sh always exports it, as "true" or "false"."""
+    return os.environ.get('DEBUG', 'false').lower() == 'true'
+
+
+# Headers that carry credentials are never echoed back
+_SENSITIVE_HEADERS = frozenset(('cookie', 'authorization'))
+
+
 @debug_bp.route('/headers')
 def show_headers():
-    """Show all request headers (only in debug mode)."""
-    if not os.environ.get('DEBUG'):
-        return jsonify({'error': 'Debug mode not enabled'}), 403
-
+    """Show request headers (blueprint is only registered in debug mode)."""
     return jsonify({
-        'headers': dict(request.headers),
+        'headers': {
+            name: value for name, value in request.headers.items()
+            if name.lower() not in _SENSITIVE_HEADERS
+        },
         'cookies': list(request.cookies.keys()),
-        'environ_keys': [k for k in request.environ.keys() if not k.startswith('_')]
+        'environ_keys': [k for k in request.environ if not k.startswith('_')]
     })
@@ -11,12 +11,23 @@ After rejection: rejected → assigned (can re-claim)
 """
 
 import logging
-from datetime import datetime, date
-from flask import Blueprint, jsonify, request, g
-from sqlalchemy import and_, or_
-from models import db, ChoreInstance, User
+from collections import defaultdict
+from itertools import islice
+from functools import wraps
+from dataclasses import dataclass
+from datetime import date
+from operator import attrgetter, itemgetter
+from typing import Optional
+from flask import Blueprint, current_app, jsonify, request, g
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from models import db, Chore, ChoreInstance, ChoreInstanceClaim, User
 from auth import ha_auth_required, get_current_user as auth_get_current_user
-from services.instance_service import InstanceService, InstanceServiceError
+from services.instance_service import BadRequestError, InstanceService, InstanceServiceError
+from utils.etag import compute_etag, not_modified, with_etag
+from utils.json_provider import stream_json_page
+from utils.loading import with_raiseload
+from utils.pagination import encode_cursor, due_date_keyset_filter
 from utils.timezone import local_today
 
 instances_bp = Blueprint('instances', __name__, url_prefix='/api/instances')
@@ -28,9 +39,217 @@ def get_current_user() -> User:
     return auth_get_current_user()
 
 
+class UnidentifiedUserError(InstanceServiceError):
+    """Neither the request body nor the session identifies the acting user."""
+
+    error_label = 'Unauthorized'
+
+    def __init__(self):
+        super().__init__('Could not identify current user', 401)
+
+
+def _acting_user_id(explicit_id: int = None) -> int:
+    """Return explicit_id, falling back to the authenticated user's id.
+
+    get_current_user() caches the user on g, so this costs at most one
+    query per request.
+
+    Raises:
+        UnidentifiedUserError: If no user can be determined
+    """
+    if explicit_id:
+        return explicit_id
+    current_user = get_current_user()
+    if not current_user:
+        raise UnidentifiedUserError()
+    return current_user.id
+
+
+def wrap_service_errors(action: str):
+    """Translate exceptions from a workflow route into JSON error responses.
+
+    - InstanceServiceError -> its status code and error_label (rolled back)
+    - ValueError -> 400 Bad Request (rolled back)
+    - anything else -> logged, rolled back, 500 "Failed to <action>"
+
+    Args:
+        action: What the route does, for the 500 message (e.g. 'claim chore')
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except InstanceServiceError as e:
+                # The service may have staged changes before refusing
+                db.session.rollback()
+                return jsonify({
+                    'error': e.error_label,
+                    'message': e.message
+                }), e.status_code
+            except ValueError as e:
+                db.session.rollback()
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': str(e)
+                }), 400
+            except Exception as e:
+                logger.error(f"Failed to {action} ({kwargs}): {e}", exc_info=True)
+                db.session.rollback()
+                return jsonify({
+                    'error': 'Internal Server Error',
+                    'message': f'Failed to {action}',
+                    'details': str(e)
+                }), 500
+        return decorated_function
+    return decorator
+
+
+def _json_body() -> dict:
+    """Return the request's JSON object body, or {} when the body is empty.
+
+    Every action route treats its body as optional, so no Content-Type is
+    required. The raw bytes go straight to the app's orjson provider.
+
+    Raises:
+        BadRequestError: If the body is not a JSON object
+    """
+    raw = request.get_data(cache=True)
+    if not raw:
+        return {}
+    try:
+        data = current_app.json.loads(raw)
+    except ValueError as e:
+        raise BadRequestError('Request body must be valid JSON') from e
+    if not isinstance(data, dict):
+        raise BadRequestError('Request body must be a JSON object')
+    return data
+
+
+def _instance_detail_options():
+    """Loader options covering everything serialize_instance(include_details=True) reads.
+
+    Many-to-one relationships are joined; claims are fetched with one extra
+    IN query for the whole result set.
+    """
+    return with_raiseload(
+        joinedload(ChoreInstance.chore),
+        joinedload(ChoreInstance.claimer),
+        joinedload(ChoreInstance.approver),
+        joinedload(ChoreInstance.rejecter),
+        selectinload(ChoreInstance.claims).joinedload(ChoreInstanceClaim.user)
+    )
+
+
+def _load_instance(instance_id: int):
+    """Load an instance with its serialization relationships eagerly loaded.
+
+    populate_existing refreshes an instance the service layer already has in
+    the session, so the detail options apply to it as well.
+    """
+    return db.session.get(ChoreInstance, instance_id,
+                          options=_instance_detail_options(), populate_existing=True)
+
+
+_INSTANCE_FIELDS = (
+    'id', 'chore_id', 'due_date', 'status', 'assigned_to', 'claimed_by',
+    'claimed_at', 'claimed_late', 'approved_by', 'approved_at', 'rejected_by',
+    'rejected_at', 'rejection_reason', 'points_awarded', 'claiming_closed_at',
+    'created_at', 'updated_at',
+)
+_get_instance_fields = attrgetter(*_INSTANCE_FIELDS)
+
+
+def _serialize_claims(claims) -> dict:
+    """Serialize a work-together instance's claims along with their counts.
+
+    The claim list is part of the response, so the rows are loaded anyway;
+    both counts are taken in the same pass that serializes them.
+    """
+    serialized = []
+    pending = 0
+    for claim in claims:
+        serialized.append(claim.to_dict())
+        if claim.status == 'claimed':
+            pending += 1
+    return {
+        'claims': serialized,
+        'claims_count': len(serialized),
+        'pending_claims_count': pending,
+    }
+
+
+# Chore and user fields embedded by the detail serializers
+_CHORE_DETAIL_FIELDS = ('id', 'name', 'description', 'points', 'requires_approval')
+_USER_DETAIL_FIELDS = ('id', 'username', 'role')
+_get_chore_detail_fields = attrgetter(*_CHORE_DETAIL_FIELDS)
+_get_user_detail_fields = attrgetter(*_USER_DETAIL_FIELDS)
+_DETAIL_USER_KEYS = ('claimer', 'approver', 'rejecter')
+_get_detail_users = attrgetter(*_DETAIL_USER_KEYS)
+
+
+def _build_instance_dict(instance_values, is_work_together: bool, claims=None,
+                         chore_values=None, user_values=()) -> dict:
+    """Assemble an instance response dict from already-read field values.
+
+    Both the ORM serializers and _serialize_instance_rows() build their
+    output here, so the two cannot drift apart.
+
+    Args:
+        instance_values: Values for _INSTANCE_FIELDS, in order
+        is_work_together: Whether the instance's chore is work-together
+        claims: The instance's claims (only read for work-together instances)
+        chore_values: Values for _CHORE_DETAIL_FIELDS, or None to omit 'chore'
+        user_values: (key, values for _USER_DETAIL_FIELDS or None) pairs
+    """
+    data = dict(zip(_INSTANCE_FIELDS, instance_values, strict=True))
+    data['is_work_together'] = is_work_together
+
+    if is_work_together:
+        data.update(_serialize_claims(claims))
+
+    if chore_values is not None:
+        data['chore'] = dict(zip(_CHORE_DETAIL_FIELDS, chore_values, strict=True))
+
+    for key, values in user_values:
+        if values is not None:
+            data[key] = dict(zip(_USER_DETAIL_FIELDS, values, strict=True))
+    return data
+
+
+def _serialize_instance_summary(instance: ChoreInstance) -> dict:
+    """Instance columns, plus claims for work-together instances."""
+    is_work_together = instance.is_work_together()
+    return _build_instance_dict(
+        _get_instance_fields(instance), is_work_together,
+        instance.claims if is_work_together else None
+    )
+
+
+def _serialize_instance_full(instance: ChoreInstance) -> dict:
+    """Summary plus embedded chore and claimer/approver/rejecter details."""
+    is_work_together = instance.is_work_together()
+    chore = instance.chore
+    return _build_instance_dict(
+        _get_instance_fields(instance), is_work_together,
+        instance.claims if is_work_together else None,
+        _get_chore_detail_fields(chore) if chore else None,
+        [(key, _get_user_detail_fields(user) if user else None)
+         for key, user in zip(_DETAIL_USER_KEYS, _get_detail_users(instance), strict=True)]
+    )
+
+
+_SERIALIZERS = {False: _serialize_instance_summary, True: _serialize_instance_full}
+
+
 def serialize_instance(instance: ChoreInstance, include_details: bool = False) -> dict:
     """Serialize a ChoreInstance to JSON.
 
+    Dispatches to a summary or full serializer so neither re-checks
+    include_details. Column values are read with attrgetter calls; dates are
+    left as date/datetime objects for the app's JSON provider to render as
+    ISO 8601.
+
     Args:
         instance: ChoreInstance object to serialize
         include_details: If True, include full chore and user details
@@ -38,67 +257,117 @@ def serialize_instance(instance: ChoreInstance, include_details: bool = False) -
     Returns:
         dict: Serialized instance data
     """
-    data = {
-        'id': instance.id,
-        'chore_id': instance.chore_id,
-        'due_date': instance.due_date.isoformat() if instance.due_date else None,
-        'status': instance.status,
-        'assigned_to': instance.assigned_to,
-        'claimed_by': instance.claimed_by,
-        'claimed_at': instance.claimed_at.isoformat() if instance.claimed_at else None,
-        'claimed_late': instance.claimed_late if hasattr(instance, 'claimed_late') else False,
-        'approved_by': instance.approved_by,
-        'approved_at': instance.approved_at.isoformat() if instance.approved_at else None,
-        'rejected_by': instance.rejected_by,
-        'rejected_at': instance.rejected_at.isoformat() if instance.rejected_at else None,
-        'rejection_reason': instance.rejection_reason,
-        'points_awarded': instance.points_awarded,
-        'claiming_closed_at': instance.claiming_closed_at.isoformat() if instance.claiming_closed_at else None,
-        'is_work_together': instance.is_work_together(),
-        'created_at': instance.created_at.isoformat() if instance.created_at else None,
-        'updated_at': instance.updated_at.isoformat() if instance.updated_at else None
-    }
+    return _SERIALIZERS[bool(include_details)](instance)
 
-    # Include claims for work-together instances
-    if instance.is_work_together():
-        data['claims'] = [c.to_dict() for c in instance.claims]
-        data['claims_count'] = len(instance.claims)
-        data['pending_claims_count'] = len([c for c in instance.claims if c.status == 'claimed'])
-
-    if include_details:
-        # Include chore details
-        if instance.chore:
-            data['chore'] = {
-                'id': instance.chore.id,
-                'name': instance.chore.name,
-                'description': instance.chore.description,
-                'points': instance.chore.points,
-                'requires_approval': instance.chore.requires_approval
-            }
-
-        # Include user details
-        if instance.claimer:
-            data['claimer'] = {
-                'id': instance.claimer.id,
-                'username': instance.claimer.username,
-                'role': instance.claimer.role
-            }
-
-        if instance.approver:
-            data['approver'] = {
-                'id': instance.approver.id,
-                'username': instance.approver.username,
-                'role': instance.approver.role
-            }
-
-        if instance.rejecter:
-            data['rejecter'] = {
-                'id': instance.rejecter.id,
-                'username': instance.rejecter.username,
-                'role': instance.rejecter.role
-            }
 
-    return data
+# Column projection used by the list endpoints: one flat row per instance
+# carrying the chore and user fields serialize_instance would otherwise read
+# from hydrated ORM objects
+_DETAIL_USERS = (
+    ('claimer', aliased(User, name='claimer'), ChoreInstance.claimed_by),
+    ('approver', aliased(User, name='approver'), ChoreInstance.approved_by),
+    ('rejecter', aliased(User, name='rejecter'), ChoreInstance.rejected_by),
+)
+
+
+# Rows fetched and serialized per step when streaming list responses
+_STREAM_BATCH_SIZE = 50
+
+_CHORE_ROW_FIELDS = _CHORE_DETAIL_FIELDS + ('is_work_together',)
+
+
+def _row_slices():
+    """Positions of each field group within an _instance_list_query() row."""
+    bounds = {}
+    position = 0
+    for key, width in (('instance', len(_INSTANCE_FIELDS)),
+                       ('chore', len(_CHORE_ROW_FIELDS)),
+                       *((key, len(_USER_DETAIL_FIELDS)) for key, _user, _fk in _DETAIL_USERS)):
+        bounds[key] = slice(position, position + width)
+        position += width
+    return bounds
+
+
+_ROW_SLICES = _row_slices()
+
+
+def _instance_list_query():
+    """Build a column-tuple query over instances joined to chore and users.
+
+    Filters and ordering on ChoreInstance columns apply as usual; rows are
+    turned into response dicts by _serialize_instance_rows(). Extra columns
+    may be appended after the projected ones.
+    """
+    columns = [getattr(ChoreInstance, field) for field in _INSTANCE_FIELDS]
+    columns += [getattr(Chore, field).label(f'chore__{field}') for field in _CHORE_ROW_FIELDS]
+    for key, user, _fk in _DETAIL_USERS:
+        columns += [getattr(user, field).label(f'{key}__{field}') for field in _USER_DETAIL_FIELDS]
+
+    query = db.session.query(*columns).select_from(ChoreInstance).outerjoin(
+        Chore, Chore.id == ChoreInstance.chore_id
+    )
+    for _key, user, fk in _DETAIL_USERS:
+        query = query.outerjoin(user, user.id == fk)
+    return query
+
+
+def _serialize_instance_rows(rows) -> list:
+    """Serialize rows from _instance_list_query() like serialize_instance(include_details=True).
+
+    Rows are tuples in a fixed column order, so each field group is taken
+    with one slice and handed to _build_instance_dict() rather than looked
+    up by name.
+    Claims for work-together instances are loaded with one IN query for the
+    whole page.
+    """
+    instance_slice = _ROW_SLICES['instance']
+    chore_slice = _ROW_SLICES['chore']
+    user_slices = [(key, _ROW_SLICES[key]) for key, _user, _fk in _DETAIL_USERS]
+    chore_width = len(_CHORE_DETAIL_FIELDS)
+
+    work_together_ids = [
+        row.id for row in rows
+        if row.chore__is_work_together
+    ]
+    claims_by_instance = defaultdict(list)
+    if work_together_ids:
+        claims = ChoreInstanceClaim.query.options(
+            *with_raiseload(joinedload(ChoreInstanceClaim.user))
+        ).filter(
+            ChoreInstanceClaim.chore_instance_id.in_(work_together_ids)
+        ).order_by(ChoreInstanceClaim.id)
+        for claim in claims:
+            claims_by_instance[claim.chore_instance_id].append(claim)
+
+    result = []
+    for row in rows:
+        chore = row[chore_slice]
+        is_work_together = bool(chore[-1])
+        user_values = []
+        for key, user_slice in user_slices:
+            user = row[user_slice]
+            user_values.append((key, user if user[0] is not None else None))
+        result.append(_build_instance_dict(
+            row[instance_slice], is_work_together,
+            claims_by_instance[row.id] if is_work_together else None,
+            chore[:chore_width] if chore[0] is not None else None,
+            user_values
+        ))
+    return result
+
+
+def _iter_instance_rows(rows, batch_size: int = _STREAM_BATCH_SIZE):
+    """Yield (row, serialized) pairs for streamed list responses.
+
+    Rows are serialized a batch at a time so work-together claims still take
+    one IN query per batch rather than one per row.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield from zip(batch, _serialize_instance_rows(batch), strict=True)
 
 
 @instances_bp.route('/test', methods=['GET', 'POST'])
@@ -114,6 +383,93 @@ def test_json_response():
     }), 200
 
 
+def _parse_iso_date(value: str) -> date:
+    """Parse a strict YYYY-MM-DD string.
+
+    date.fromisoformat also accepts compact and week forms on Python 3.11+,
+    so the length check keeps the documented format the only one allowed.
+
+    Raises:
+        ValueError: If value is not a YYYY-MM-DD date
+    """
+    if len(value) != 10:
+        raise ValueError(f'Invalid date: {value}')
+    return date.fromisoformat(value)
+
+
+@dataclass(slots=True)
+class InstanceListParams:
+    """Query parameters accepted by list_instances, parsed and validated."""
+
+    status: Optional[str] = None
+    user_id: Optional[int] = None
+    chore_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    limit: int = 50
+    offset: int = 0
+    cursor: Optional[str] = None
+
+    @classmethod
+    def from_args(cls, args) -> 'InstanceListParams':
+        """Build params from request.args in one pass.
+
+        Raises:
+            ValueError: With a client-facing message if a value is malformed
+        """
+        values = args.to_dict()
+        params = cls(status=values.get('status') or None, cursor=values.get('cursor') or None)
+
+        for name in ('user_id', 'chore_id', 'limit', 'offset'):
+            raw = values.get(name)
+            if raw:
+                try:
+                    setattr(params, name, int(raw))
+                except ValueError:
+                    raise ValueError(f'Invalid {name}. Must be an integer') from None
+
+        for name in ('start_date', 'end_date'):
+            raw = values.get(name)
+            if raw:
+                try:
+                    setattr(params, name, _parse_iso_date(raw))
+                except ValueError:
+                    raise ValueError(f'Invalid {name} format. Use YYYY-MM-DD') from None
+
+        if params.limit < 1:
+            raise ValueError('Invalid limit. Must be at least 1')
+
+        # Limit max results to 200; a cursor replaces offset
+        params.limit = min(params.limit, 200)
+        if params.cursor:
+            params.offset = 0
+        return params
+
+    def conditions(self) -> list:
+        """WHERE clauses for the filters that were given.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        conds = []
+        if self.status:
+            conds.append(ChoreInstance.status == self.status)
+        if self.user_id:
+            conds.append(ChoreInstance.claimed_by == self.user_id)
+        if self.chore_id:
+            conds.append(ChoreInstance.chore_id == self.chore_id)
+        if self.start_date:
+            conds.append(ChoreInstance.due_date >= self.start_date)
+        if self.end_date:
+            conds.append(ChoreInstance.due_date <= self.end_date)
+        if self.cursor:
+            try:
+                conds.append(due_date_keyset_filter(ChoreInstance, self.cursor))
+            except ValueError:
+                raise ValueError('Invalid cursor') from None
+        return conds
+
+
 @instances_bp.route('', methods=['GET'])
 @ha_auth_required
 def list_instances():
@@ -127,67 +483,96 @@ def list_instances():
         - end_date: Filter by due_date <= end_date (YYYY-MM-DD)
         - limit: Maximum number of results (default 50)
         - offset: Number of results to skip (default 0)
+        - cursor: next_cursor from the previous page (keyset pagination;
+          replaces offset and omits total)
 
     Returns:
-        JSON: {data: [instances], total: int, limit: int, offset: int}
+        JSON: {data: [instances], total: int, limit: int, offset: int,
+               has_more: bool, next_cursor: str|null}
     """
-    query = ChoreInstance.query
+    try:
+        params = InstanceListParams.from_args(request.args)
+        conds = params.conditions()
+    except ValueError as e:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': str(e)
+        }), 400
+    limit, offset, cursor = params.limit, params.offset, params.cursor
+
+    query = _instance_list_query()
+    if conds:
+        query = query.filter(and_(*conds))
+
+    page = query
+    if not cursor:
+        # Offset page: the window count carries the filtered total on every
+        # row, so no separate COUNT query is needed
+        page = page.add_columns(func.count().over().label('total'))
+
+    # Fetch one extra row to detect a following page, and stream rows out
+    # as they are read rather than building the whole page first
+    rows = page.order_by(
+        ChoreInstance.due_date.desc(), ChoreInstance.id.desc()
+    ).limit(limit + 1).offset(offset).yield_per(_STREAM_BATCH_SIZE)
+
+    def build_meta(count, has_more, last):
+        meta = {
+            'limit': limit,
+            'offset': offset,
+            'has_more': has_more,
+            'next_cursor': None,
+        }
+        if has_more and last is not None:
+            meta['next_cursor'] = encode_cursor(last[0].due_date, last[0].id)
+        if cursor:
+            meta['message'] = f'Found {count} instances'
+            return meta
 
-    # Apply filters
-    status = request.args.get('status')
-    if status:
-        query = query.filter(ChoreInstance.status == status)
+        if last is not None:
+            total = last[0].total
+        else:
+            # Past the last page the window has no rows to report on
+            total = query.count() if offset else 0
+        meta['total'] = total
+        meta['message'] = f'Found {total} instances'
+        return meta
 
-    user_id = request.args.get('user_id', type=int)
-    if user_id:
-        query = query.filter(ChoreInstance.claimed_by == user_id)
-
-    chore_id = request.args.get('chore_id', type=int)
-    if chore_id:
-        query = query.filter(ChoreInstance.chore_id == chore_id)
-
-    start_date = request.args.get('start_date')
-    if start_date:
-        try:
-            start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
-            query = query.filter(ChoreInstance.due_date >= start_date_obj)
-        except ValueError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid start_date format. Use YYYY-MM-DD'
-            }), 400
-
-    end_date = request.args.get('end_date')
-    if end_date:
-        try:
-            end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
-            query = query.filter(ChoreInstance.due_date <= end_date_obj)
-        except ValueError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid end_date format. Use YYYY-MM-DD'
-            }), 400
-
-    # Get total count before pagination
-    total = query.count()
-
-    # Apply pagination
-    limit = request.args.get('limit', 50, type=int)
-    offset = request.args.get('offset', 0, type=int)
-
-    # Limit max results to 200
-    if limit > 200:
-        limit = 200
-
-    instances = query.order_by(ChoreInstance.due_date.desc()).limit(limit).offset(offset).all()
+    return stream_json_page(_iter_instance_rows(rows), itemgetter(1), limit, build_meta)
+
+
+def _instance_etag(instance: ChoreInstance) -> str:
+    """ETag for serialize_instance(instance, include_details=True).
+
+    Covers every row the detail response reads, all of which
+    _instance_detail_options() has already loaded.
+    """
+    users = (instance.claimer, instance.approver, instance.rejecter)
+    return compute_etag(
+        instance.id, instance.updated_at,
+        instance.chore.updated_at if instance.chore else None,
+        *(user.updated_at if user else None for user in users),
+        *((c.id, c.updated_at, c.user.updated_at if c.user else None) for c in instance.claims)
+    )
 
-    return jsonify({
-        'data': [serialize_instance(instance, include_details=True) for instance in instances],
-        'total': total,
-        'limit': limit,
-        'offset': offset,
-        'message': f'Found {total} instances'
-    }), 200
+
+def _due_today_version(query) -> tuple:
+    """Aggregate the rows behind a filtered _instance_list_query().
+
+    Returns the instance count plus the latest updated_at of the instances,
+    their chores and claims, and of any user (the users table is small, and
+    usernames appear on several joined rows).
+    """
+    return tuple(query.with_entities(
+        func.count(func.distinct(ChoreInstance.id)),
+        func.max(ChoreInstance.updated_at),
+        func.max(Chore.updated_at),
+        func.count(ChoreInstanceClaim.id),
+        func.max(ChoreInstanceClaim.updated_at),
+        select(func.max(User.updated_at)).scalar_subquery()
+    ).outerjoin(
+        ChoreInstanceClaim, ChoreInstanceClaim.chore_instance_id == ChoreInstance.id
+    ).one())
 
 
 @instances_bp.route('/<int:instance_id>', methods=['GET'])
@@ -201,7 +586,7 @@ def get_instance(instance_id: int):
     Returns:
         JSON: {data: instance_details, message: str}
     """
-    instance = ChoreInstance.query.get(instance_id)
+    instance = _load_instance(instance_id)
 
     if not instance:
         return jsonify({
@@ -209,10 +594,15 @@ def get_instance(instance_id: int):
             'message': f'Chore instance {instance_id} not found'
         }), 404
 
-    return jsonify({
+    etag = _instance_etag(instance)
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+
+    return with_etag(jsonify({
         'data': serialize_instance(instance, include_details=True),
         'message': 'Instance details retrieved successfully'
-    }), 200
+    }), etag), 200
 
 
 @instances_bp.route('/due-today', methods=['GET'])
@@ -230,7 +620,7 @@ def get_instances_due_today():
     """
     today = local_today()
 
-    query = ChoreInstance.query.filter(
+    query = _instance_list_query().filter(
         or_(
             ChoreInstance.due_date == today,
             ChoreInstance.due_date.is_(None)
@@ -251,17 +641,25 @@ def get_instances_due_today():
     if status:
         query = query.filter(ChoreInstance.status == status)
 
-    instances = query.all()
+    # One aggregate over the same rows versions the whole response, so an
+    # unchanged list is answered before the main query runs
+    etag = compute_etag(today, *_due_today_version(query))
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
 
-    return jsonify({
-        'date': today.isoformat(),
-        'count': len(instances),
-        'instances': [serialize_instance(instance, include_details=True) for instance in instances]
-    }), 200
+    rows = query.yield_per(_STREAM_BATCH_SIZE)
+
+    def build_meta(count, _has_more, _last):
+        return {'date': today.isoformat(), 'count': count}
+
+    return with_etag(stream_json_page(_iter_instance_rows(rows), itemgetter(1), None, build_meta,
+                                      key='instances'), etag)
 
 
 @instances_bp.route('/<int:instance_id>/claim', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('claim chore')
 def claim_instance(instance_id: int):
     """Kid claims completion of a chore instance.
 
@@ -278,41 +676,20 @@ def claim_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    data = request.get_json() or {}
-    user_id = data.get('user_id')
-
-    if not user_id:
-        current_user = get_current_user()
-        if not current_user:
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Could not identify current user'
-            }), 401
-        user_id = current_user.id
+    data = _json_body()
+    user_id = _acting_user_id(data.get('user_id'))
 
-    try:
-        instance = InstanceService.claim(instance_id, user_id)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': 'Chore claimed successfully'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to claim instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to claim chore',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.claim(instance_id, user_id)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': 'Chore claimed successfully'
+    }), 200
 
 
 @instances_bp.route('/<int:instance_id>/approve', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('approve chore')
 def approve_instance(instance_id: int):
     """Parent approves a claimed chore instance and awards points.
 
@@ -330,49 +707,22 @@ def approve_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    data = request.get_json() or {}
-    approver_id = data.get('approver_id')
+    data = _json_body()
+    approver_id = _acting_user_id(data.get('approver_id'))
     custom_points = data.get('points')
 
-    if not approver_id:
-        current_user = get_current_user()
-        if not current_user:
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Could not identify current user'
-            }), 401
-        approver_id = current_user.id
-
-    try:
-        instance = InstanceService.approve(instance_id, approver_id, custom_points)
-        points_awarded = instance.points_awarded or instance.chore.points
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': f'Chore approved successfully, {points_awarded} points awarded'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except ValueError as e:
-        db.session.rollback()
-        return jsonify({
-            'error': 'Bad Request',
-            'message': str(e)
-        }), 400
-    except Exception as e:
-        logger.error(f"Failed to approve instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to approve chore',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.approve(instance_id, approver_id, custom_points)
+    instance = _load_instance(instance.id)
+    points_awarded = instance.points_awarded or instance.chore.points
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': f'Chore approved successfully, {points_awarded} points awarded'
+    }), 200
 
 
 @instances_bp.route('/<int:instance_id>/reject', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('reject chore')
 def reject_instance(instance_id: int):
     """Parent rejects a claimed chore instance with a reason.
 
@@ -391,42 +741,23 @@ def reject_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    data = request.get_json() or {}
+    data = _json_body()
     rejecter_id = data.get('approver_id')
     reason = data.get('reason', '')
 
-    if not rejecter_id:
-        current_user = get_current_user()
-        if not current_user:
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Could not identify current user'
-            }), 401
-        rejecter_id = current_user.id
+    rejecter_id = _acting_user_id(rejecter_id)
 
-    try:
-        instance = InstanceService.reject(instance_id, rejecter_id, reason)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': 'Chore rejected. Status set back to "assigned" to allow re-claim.'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to reject instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to reject chore',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.reject(instance_id, rejecter_id, reason)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': 'Chore rejected. Status set back to "assigned" to allow re-claim.'
+    }), 200
 
 
 @instances_bp.route('/<int:instance_id>/unclaim', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('unclaim chore')
 def unclaim_instance(instance_id: int):
     """Unclaim a chore instance (before approval).
 
@@ -443,41 +774,20 @@ def unclaim_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    data = request.get_json() or {}
-    user_id = data.get('user_id')
-
-    if not user_id:
-        current_user = get_current_user()
-        if not current_user:
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Could not identify current user'
-            }), 401
-        user_id = current_user.id
+    data = _json_body()
+    user_id = _acting_user_id(data.get('user_id'))
 
-    try:
-        instance = InstanceService.unclaim(instance_id, user_id)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': 'Chore unclaimed successfully'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to unclaim instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to unclaim chore',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.unclaim(instance_id, user_id)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': 'Chore unclaimed successfully'
+    }), 200
 
 
 @instances_bp.route('/<int:instance_id>/reassign', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('reassign chore')
 def reassign_instance(instance_id: int):
     """Reassign a chore instance to a different kid (parents only).
 
@@ -493,7 +803,7 @@ def reassign_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    data = request.get_json() or {}
+    data = _json_body()
     new_user_id = data.get('new_user_id')
     reassigned_by = data.get('reassigned_by')
 
@@ -503,39 +813,19 @@ def reassign_instance(instance_id: int):
             'message': 'new_user_id is required'
         }), 400
 
-    if not reassigned_by:
-        current_user = get_current_user()
-        if not current_user:
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Could not identify current user'
-            }), 401
-        reassigned_by = current_user.id
+    reassigned_by = _acting_user_id(reassigned_by)
 
-    try:
-        instance = InstanceService.reassign(instance_id, new_user_id, reassigned_by)
-        new_user = db.session.get(User, new_user_id)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': f'Chore reassigned to {new_user.username}'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to reassign instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to reassign chore',
-            'details': str(e)
-        }), 500
+    instance, new_username = InstanceService.reassign(instance_id, new_user_id, reassigned_by)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': f'Chore reassigned to {new_username}'
+    }), 200
 
 
 @instances_bp.route('/<int:instance_id>/reset', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('reset chore instance')
 def reset_instance(instance_id: int):
     """Reset an approved one-time chore instance to allow re-claiming.
 
@@ -550,38 +840,21 @@ def reset_instance(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    current_user = get_current_user()
-    if not current_user:
-        return jsonify({
-            'error': 'Unauthorized',
-            'message': 'Could not identify current user'
-        }), 401
+    current_user_id = _acting_user_id()
 
-    try:
-        instance = InstanceService.reset(instance_id, current_user.id)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': 'Chore instance reset successfully. It can now be claimed again.'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to reset instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to reset chore instance',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.reset(instance_id, current_user_id)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': 'Chore instance reset successfully. It can now be claimed again.'
+    }), 200
 
 
 # Work-together endpoints
 
 @instances_bp.route('/<int:instance_id>/close-claiming', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('close claiming')
 def close_claiming(instance_id: int):
     """Close claiming for a work-together instance (parent action).
 
@@ -594,36 +867,19 @@ def close_claiming(instance_id: int):
     Returns:
         JSON: {data: updated_instance, message: str}
     """
-    current_user = get_current_user()
-    if not current_user:
-        return jsonify({
-            'error': 'Unauthorized',
-            'message': 'Could not identify current user'
-        }), 401
+    current_user_id = _acting_user_id()
 
-    try:
-        instance = InstanceService.close_claiming(instance_id, current_user.id)
-        return jsonify({
-            'data': serialize_instance(instance, include_details=True),
-            'message': 'Claiming closed successfully. You can now approve individual claims.'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to close claiming for instance {instance_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to close claiming',
-            'details': str(e)
-        }), 500
+    instance = InstanceService.close_claiming(instance_id, current_user_id)
+    instance = _load_instance(instance.id)
+    return jsonify({
+        'data': serialize_instance(instance, include_details=True),
+        'message': 'Claiming closed successfully. You can now approve individual claims.'
+    }), 200
 
 
 @instances_bp.route('/claims/<int:claim_id>/approve', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('approve claim')
 def approve_claim(claim_id: int):
     """Approve an individual claim for a work-together chore.
 
@@ -640,39 +896,21 @@ def approve_claim(claim_id: int):
     Returns:
         JSON: {data: claim_details, message: str}
     """
-    data = request.get_json() or {}
+    data = _json_body()
     custom_points = data.get('points')
 
-    current_user = get_current_user()
-    if not current_user:
-        return jsonify({
-            'error': 'Unauthorized',
-            'message': 'Could not identify current user'
-        }), 401
+    current_user_id = _acting_user_id()
 
-    try:
-        claim = InstanceService.approve_claim(claim_id, current_user.id, custom_points)
-        return jsonify({
-            'data': claim.to_dict(),
-            'message': f'Claim approved, {claim.points_awarded} points awarded to {claim.user.username}'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to approve claim {claim_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to approve claim',
-            'details': str(e)
-        }), 500
+    claim = InstanceService.approve_claim(claim_id, current_user_id, custom_points)
+    return jsonify({
+        'data': claim.to_dict(),
+        'message': f'Claim approved, {claim.points_awarded} points awarded to {claim.user.username}'
+    }), 200
 
 
 @instances_bp.route('/claims/<int:claim_id>/reject', methods=['POST'])
 @ha_auth_required
+@wrap_service_errors('reject claim')
 def reject_claim(claim_id: int):
     """Reject an individual claim for a work-together chore.
 
@@ -687,32 +925,13 @@ def reject_claim(claim_id: int):
     Returns:
         JSON: {data: claim_details, message: str}
     """
-    data = request.get_json() or {}
+    data = _json_body()
     reason = data.get('reason', '')
 
-    current_user = get_current_user()
-    if not current_user:
-        return jsonify({
-            'error': 'Unauthorized',
-            'message': 'Could not identify current user'
-        }), 401
+    current_user_id = _acting_user_id()
 
-    try:
-        claim = InstanceService.reject_claim(claim_id, current_user.id, reason)
-        return jsonify({
-            'data': claim.to_dict(),
-            'message': f'Claim from {claim.user.username} rejected'
-        }), 200
-    except InstanceServiceError as e:
-        return jsonify({
-            'error': e.__class__.__name__.replace('Error', ' Error'),
-            'message': e.message
-        }), e.status_code
-    except Exception as e:
-        logger.error(f"Failed to reject claim {claim_id}: {e}", exc_info=True)
-        db.session.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'Failed to reject claim',
-            'details': str(e)
-        }), 500
+    claim = InstanceService.reject_claim(claim_id, current_user_id, reason)
+    return jsonify({
+        'data': claim.to_dict(),
+        'message': f'Claim from {claim.user.username} rejected'
+    }), 200
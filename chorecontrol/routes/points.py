@@ -3,7 +3,7 @@
 from flask import Blueprint, jsonify, request, g
 from sqlalchemy import desc
 from models import db, User, PointsHistory
-from auth import ha_auth_required, get_current_user as auth_get_current_user
+from auth import ha_auth_required, require_role, get_current_user as auth_get_current_user
 from utils.webhooks import fire_webhook
 
 points_bp = Blueprint('points', __name__, url_prefix='/api/points')
@@ -16,14 +16,10 @@ def get_current_user():
 
 @points_bp.route('/adjust', methods=['POST'])
 @ha_auth_required
+@require_role('parent', message='Only parents can manually adjust points')
 def adjust_points():
     """Manual point adjustment (parent only)."""
     current_user = get_current_user()
-    if not current_user or current_user.role != 'parent':
-        return jsonify({
-            'error': 'Forbidden',
-            'message': 'Only parents can manually adjust points'
-        }), 403
 
     data = request.get_json(force=True, silent=True)
 
@@ -52,7 +48,7 @@ def adjust_points():
 
     # Get target user
     user_id = data['user_id']
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -100,7 +96,7 @@ def adjust_points():
 @ha_auth_required
 def get_points_history(user_id):
     """Get paginated points history for a user."""
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -164,7 +160,7 @@ def get_points_history(user_id):
 
         # Add creator info if available
         if entry.created_by:
-            creator = User.query.get(entry.created_by)
+            creator = db.session.get(User, entry.created_by)
             if creator:
                 entry_dict['created_by'] = {
                     'id': creator.id,
@@ -2,11 +2,16 @@
 
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
 from flask import Blueprint, jsonify, request, g
-from sqlalchemy import desc
-from models import db, Reward, RewardClaim, User
-from auth import ha_auth_required, get_current_user as auth_get_current_user
+from sqlalchemy import desc, func
+from sqlalchemy.orm import joinedload
+from models import db, Reward, RewardClaim, RewardUserClaimCount, User
+from auth import ha_auth_required, require_role, get_current_user as auth_get_current_user
 from services.reward_service import RewardService, RewardServiceError
+from utils.etag import compute_etag, not_modified, with_etag
+from utils.json_provider import stream_json_page
+from utils.loading import commit_keep_loaded, with_raiseload
 
 logger = logging.getLogger(__name__)
 
@@ -18,58 +23,136 @@ def get_current_user():
     return auth_get_current_user()
 
 
+def _claim_list_options():
+    """Loader options for the reward, user and approver names claim listings show.
+
+    All three are many-to-one, so they are joined into the page query.
+    """
+    return with_raiseload(
+        joinedload(RewardClaim.reward),
+        joinedload(RewardClaim.user),
+        joinedload(RewardClaim.approver)
+    )
+
+
+def _claim_listing_dict(claim):
+    """Serialize a claim for the claim listings (names loaded by _claim_list_options).
+
+    Datetimes are left for the orjson provider to encode.
+    """
+    return {
+        'id': claim.id,
+        'reward_id': claim.reward_id,
+        'reward_name': claim.reward.name if claim.reward else 'Unknown',
+        'user_id': claim.user_id,
+        'username': claim.user.username if claim.user else 'Unknown',
+        'points_spent': claim.points_spent,
+        'claimed_at': claim.claimed_at,
+        'status': claim.status,
+        'approved_by': claim.approved_by,
+        'approver_name': claim.approver.username if claim.approver else None,
+        'approved_at': claim.approved_at
+    }
+
+
+def _parse_points_cost(value) -> tuple[Optional[int], Optional[str]]:
+    """Parse a points_cost field, returning (points_cost, error_message)."""
+    try:
+        points_cost = int(value)
+    except (ValueError, TypeError):
+        return None, 'points_cost must be a valid integer'
+    if points_cost <= 0:
+        return None, 'points_cost must be greater than 0'
+    return points_cost, None
+
+
+def _serialize_claim_row(row):
+    """Serialize a (claim, total) row from a windowed claim listing query."""
+    return _claim_listing_dict(row[0])
+
+
+def _reward_list_version(is_active: Optional[bool], user: Optional[User]) -> tuple:
+    """Aggregate the rows behind a list_rewards response.
+
+    Returns the reward count, latest updated_at and approved claim total. For
+    a claiming user it adds their points and, per reward they have claimed,
+    the approved count and whole days since the last claim, which is what
+    moves a cooldown countdown.
+    """
+    rewards = db.session.query(
+        func.count(Reward.id),
+        func.max(Reward.updated_at),
+        func.sum(Reward.approved_claims_count)
+    )
+    if is_active is not None:
+        rewards = rewards.filter(Reward.is_active == is_active)
+    version = tuple(rewards.one())
+    if user is None:
+        return version
+
+    now = datetime.utcnow()
+    claims = db.session.query(
+        RewardClaim.reward_id,
+        func.count(),
+        func.max(RewardClaim.claimed_at)
+    ).filter(
+        RewardClaim.user_id == user.id,
+        RewardClaim.status == 'approved'
+    ).group_by(RewardClaim.reward_id).order_by(RewardClaim.reward_id).all()
+
+    return version + (user.id, user.points) + tuple(
+        (reward_id, count, (now - last_claimed_at) // timedelta(days=1))
+        for reward_id, count, last_claimed_at in claims
+    )
+
+
 @rewards_bp.route('', methods=['GET'])
 @ha_auth_required
 def list_rewards():
     """List all rewards with optional filtering by active status."""
     active_filter = request.args.get('active')
-
-    query = Reward.query
-
+    is_active = None
     if active_filter is not None:
         is_active = active_filter.lower() in ('true', '1', 'yes')
-        query = query.filter_by(is_active=is_active)
 
-    rewards = query.order_by(Reward.points_cost).all()
+    user = get_current_user()
+    can_claim_rewards = user is not None and user.role in ('kid', 'claim_only')
+
+    etag = compute_etag(is_active, can_claim_rewards,
+                        *_reward_list_version(is_active, user if can_claim_rewards else None))
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+
+    # Rewards and the current user's claim stats come back in one query
+    query = Reward.listable_for(user.id if user else None)
+
+    if is_active is not None:
+        query = query.filter(Reward.is_active == is_active)
+
+    rows = query.order_by(Reward.points_cost).all()
 
     # Add claim counts to each reward
     rewards_data = []
-    for reward in rewards:
-        reward_dict = {
-            'id': reward.id,
-            'name': reward.name,
-            'description': reward.description,
-            'points_cost': reward.points_cost,
-            'cooldown_days': reward.cooldown_days,
-            'max_claims_total': reward.max_claims_total,
-            'max_claims_per_kid': reward.max_claims_per_kid,
-            'is_active': reward.is_active,
-            'created_at': reward.created_at.isoformat(),
-            'updated_at': reward.updated_at.isoformat(),
-            'total_claims': RewardClaim.query.filter_by(
-                reward_id=reward.id,
-                status='approved'
-            ).count()
-        }
+    for reward, user_claims, last_claimed_at in rows:
+        reward_dict = reward.to_dict()
+        reward_dict['total_claims'] = reward.approved_claims_count
+        if can_claim_rewards:
+            reward_dict['can_claim'], reward_dict['can_claim_reason'], _details = \
+                reward.check_claim_using(user, user_claims, last_claimed_at)
         rewards_data.append(reward_dict)
 
-    return jsonify({
+    return with_etag(jsonify({
         'data': rewards_data,
         'message': f'Found {len(rewards_data)} rewards'
-    })
+    }), etag)
 
 
 @rewards_bp.route('', methods=['POST'])
 @ha_auth_required
+@require_role('parent', message='Only parents can create rewards')
 def create_reward():
     """Create a new reward."""
-    user = get_current_user()
-    if not user or user.role != 'parent':
-        return jsonify({
-            'error': 'Forbidden',
-            'message': 'Only parents can create rewards'
-        }), 403
-
     data = request.get_json()
 
     # Validate required fields
@@ -79,19 +162,9 @@ def create_reward():
             'message': 'Missing required fields: name, points_cost'
         }), 400
 
-    # Validate points_cost is positive
-    try:
-        points_cost = int(data['points_cost'])
-        if points_cost <= 0:
-            return jsonify({
-                'error': 'BadRequest',
-                'message': 'points_cost must be greater than 0'
-            }), 400
-    except (ValueError, TypeError):
-        return jsonify({
-            'error': 'BadRequest',
-            'message': 'points_cost must be a valid integer'
-        }), 400
+    points_cost, error = _parse_points_cost(data['points_cost'])
+    if error:
+        return jsonify({'error': 'BadRequest', 'message': error}), 400
 
     # Create reward
     reward = Reward(
@@ -106,21 +179,10 @@ def create_reward():
     )
 
     db.session.add(reward)
-    db.session.commit()
+    commit_keep_loaded()
 
     return jsonify({
-        'data': {
-            'id': reward.id,
-            'name': reward.name,
-            'description': reward.description,
-            'points_cost': reward.points_cost,
-            'cooldown_days': reward.cooldown_days,
-            'max_claims_total': reward.max_claims_total,
-            'max_claims_per_kid': reward.max_claims_per_kid,
-            'is_active': reward.is_active,
-            'created_at': reward.created_at.isoformat(),
-            'updated_at': reward.updated_at.isoformat()
-        },
+        'data': reward.to_dict(),
         'message': 'Reward created successfully'
     }), 201
 
@@ -129,7 +191,7 @@ def create_reward():
 @ha_auth_required
 def get_reward(reward_id):
     """Get reward details with claim counts and cooldown status."""
-    reward = Reward.query.get(reward_id)
+    reward = db.session.get(Reward, reward_id)
 
     if not reward:
         return jsonify({
@@ -139,46 +201,23 @@ def get_reward(reward_id):
 
     user = get_current_user()
 
-    # Calculate claim counts
-    total_claims = RewardClaim.query.filter_by(
-        reward_id=reward.id,
-        status='approved'
-    ).count()
+    # Claim counts come from the denormalized counters list_rewards uses,
+    # not per-request COUNT queries
+    total_claims = reward.approved_claims_count
 
     # Check if on cooldown for current user
-    is_on_cooldown_for_user = False
     cooldown_days_remaining = None
     if user and user.role == 'kid':
-        on_cooldown, cooldown_msg = reward.is_on_cooldown(user.id)
-        is_on_cooldown_for_user = on_cooldown
-        if on_cooldown and cooldown_msg:
-            # Extract days from message like "Reward is on cooldown for 3 more days"
-            import re
-            match = re.search(r'(\d+)', cooldown_msg)
-            if match:
-                cooldown_days_remaining = int(match.group(1))
+        cooldown_days_remaining = reward.cooldown_days_remaining(user.id)
+    is_on_cooldown_for_user = cooldown_days_remaining is not None
 
     # Get user's claim count
     user_claims = 0
     if user and user.role == 'kid':
-        user_claims = RewardClaim.query.filter_by(
-            reward_id=reward.id,
-            user_id=user.id,
-            status='approved'
-        ).count()
+        user_claims = RewardUserClaimCount.get_count(reward.id, user.id)
 
     return jsonify({
-        'data': {
-            'id': reward.id,
-            'name': reward.name,
-            'description': reward.description,
-            'points_cost': reward.points_cost,
-            'cooldown_days': reward.cooldown_days,
-            'max_claims_total': reward.max_claims_total,
-            'max_claims_per_kid': reward.max_claims_per_kid,
-            'is_active': reward.is_active,
-            'created_at': reward.created_at.isoformat(),
-            'updated_at': reward.updated_at.isoformat(),
+        'data': reward.to_dict() | {
             'total_claims': total_claims,
             'user_claims': user_claims,
             'is_on_cooldown_for_user': is_on_cooldown_for_user,
@@ -190,16 +229,10 @@ def get_reward(reward_id):
 
 @rewards_bp.route('/<int:reward_id>', methods=['PUT'])
 @ha_auth_required
+@require_role('parent', message='Only parents can update rewards')
 def update_reward(reward_id):
     """Update an existing reward."""
-    user = get_current_user()
-    if not user or user.role != 'parent':
-        return jsonify({
-            'error': 'Forbidden',
-            'message': 'Only parents can update rewards'
-        }), 403
-
-    reward = Reward.query.get(reward_id)
+    reward = db.session.get(Reward, reward_id)
 
     if not reward:
         return jsonify({
@@ -221,19 +254,10 @@ def update_reward(reward_id):
     if 'description' in data:
         reward.description = data['description']
     if 'points_cost' in data:
-        try:
-            points_cost = int(data['points_cost'])
-            if points_cost <= 0:
-                return jsonify({
-                    'error': 'BadRequest',
-                    'message': 'points_cost must be greater than 0'
-                }), 400
-            reward.points_cost = points_cost
-        except (ValueError, TypeError):
-            return jsonify({
-                'error': 'BadRequest',
-                'message': 'points_cost must be a valid integer'
-            }), 400
+        points_cost, error = _parse_points_cost(data['points_cost'])
+        if error:
+            return jsonify({'error': 'BadRequest', 'message': error}), 400
+        reward.points_cost = points_cost
     if 'cooldown_days' in data:
         reward.cooldown_days = data['cooldown_days']
     if 'max_claims_total' in data:
@@ -245,38 +269,20 @@ def update_reward(reward_id):
     if 'is_active' in data:
         reward.is_active = data['is_active']
 
-    reward.updated_at = datetime.utcnow()
-    db.session.commit()
+    commit_keep_loaded()
 
     return jsonify({
-        'data': {
-            'id': reward.id,
-            'name': reward.name,
-            'description': reward.description,
-            'points_cost': reward.points_cost,
-            'cooldown_days': reward.cooldown_days,
-            'max_claims_total': reward.max_claims_total,
-            'max_claims_per_kid': reward.max_claims_per_kid,
-            'is_active': reward.is_active,
-            'created_at': reward.created_at.isoformat(),
-            'updated_at': reward.updated_at.isoformat()
-        },
+        'data': reward.to_dict(),
         'message': 'Reward updated successfully'
     })
 
 
 @rewards_bp.route('/<int:reward_id>', methods=['DELETE'])
 @ha_auth_required
+@require_role('parent', message='Only parents can delete rewards')
 def delete_reward(reward_id):
     """Soft delete a reward (set is_active to False)."""
-    user = get_current_user()
-    if not user or user.role != 'parent':
-        return jsonify({
-            'error': 'Forbidden',
-            'message': 'Only parents can delete rewards'
-        }), 403
-
-    reward = Reward.query.get(reward_id)
+    reward = db.session.get(Reward, reward_id)
 
     if not reward:
         return jsonify({
@@ -285,7 +291,6 @@ def delete_reward(reward_id):
         }), 404
 
     reward.is_active = False
-    reward.updated_at = datetime.utcnow()
     db.session.commit()
 
     return '', 204
@@ -328,15 +333,15 @@ def claim_reward(reward_id):
                 'points_spent': reward.points_cost,
                 'old_balance': old_balance,
                 'new_balance': user.points,
-                'claimed_at': claim.claimed_at.isoformat(),
+                'claimed_at': claim.claimed_at,
                 'status': claim.status,
-                'expires_at': claim.expires_at.isoformat() if claim.expires_at else None
+                'expires_at': claim.expires_at
             },
             'message': message
         }), 201
     except RewardServiceError as e:
         return jsonify({
-            'error': e.__class__.__name__.replace('Error', ''),
+            'error': e.error_label,
             'message': e.message,
             'details': e.details
         }), e.status_code
@@ -372,7 +377,7 @@ def unclaim_reward(claim_id):
         }), 200
     except RewardServiceError as e:
         return jsonify({
-            'error': e.__class__.__name__.replace('Error', ''),
+            'error': e.error_label,
             'message': e.message
         }), e.status_code
     except Exception as e:
@@ -405,13 +410,13 @@ def approve_reward_claim(claim_id):
                 'user_id': claim.user_id,
                 'status': claim.status,
                 'approved_by': claim.approved_by,
-                'approved_at': claim.approved_at.isoformat()
+                'approved_at': claim.approved_at
             },
             'message': 'Reward claim approved'
         }), 200
     except RewardServiceError as e:
         return jsonify({
-            'error': e.__class__.__name__.replace('Error', ''),
+            'error': e.error_label,
             'message': e.message
         }), e.status_code
     except Exception as e:
@@ -434,14 +439,15 @@ def claim_history():
     user_id = request.args.get('user_id', type=int)
     status_filter = request.args.get('status')  # 'approved', 'rejected', or None for both
 
-    # Limit per_page to reasonable bounds
+    # Limit page and per_page to reasonable bounds
+    page = max(page, 1)
     per_page = min(max(per_page, 1), 50)
 
     # Calculate date cutoff
     cutoff_date = datetime.utcnow() - timedelta(days=days)
 
     # Build query - only approved and rejected claims (not pending)
-    query = RewardClaim.query.filter(
+    query = RewardClaim.query.options(*_claim_list_options()).filter(
         RewardClaim.status.in_(['approved', 'rejected']),
         RewardClaim.claimed_at >= cutoff_date
     )
@@ -453,44 +459,38 @@ def claim_history():
     if status_filter and status_filter in ('approved', 'rejected'):
         query = query.filter(RewardClaim.status == status_filter)
 
-    # Order by most recent first
-    query = query.order_by(desc(RewardClaim.claimed_at))
-
-    # Paginate
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Order by most recent first. The window count carries the filtered
+    # total on every row, so no separate COUNT query is needed
+    offset = (page - 1) * per_page
+    rows = query.add_columns(func.count().over().label('total')).order_by(
+        desc(RewardClaim.claimed_at)
+    ).offset(offset).limit(per_page).yield_per(per_page)
 
-    # Build response data
-    claims_data = []
-    for claim in pagination.items:
-        claim_dict = {
-            'id': claim.id,
-            'reward_id': claim.reward_id,
-            'reward_name': claim.reward.name if claim.reward else 'Unknown',
-            'user_id': claim.user_id,
-            'username': claim.user.username if claim.user else 'Unknown',
-            'points_spent': claim.points_spent,
-            'claimed_at': claim.claimed_at.isoformat(),
-            'status': claim.status,
-            'approved_by': claim.approved_by,
-            'approver_name': claim.approver.username if claim.approver else None,
-            'approved_at': claim.approved_at.isoformat() if claim.approved_at else None
+    def build_meta(count, _has_more, last):
+        if last is not None:
+            total = last.total
+        else:
+            # Past the last page the window has no rows to report on
+            total = query.count() if offset else 0
+        pages = -(-total // per_page)
+        has_prev = page > 1
+        has_next = page < pages
+        return {
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'pages': pages,
+                'has_prev': has_prev,
+                'has_next': has_next,
+                'prev_page': page - 1 if has_prev else None,
+                'next_page': page + 1 if has_next else None
+            },
+            'message': f'Found {count} claims'
         }
-        claims_data.append(claim_dict)
 
-    return jsonify({
-        'data': claims_data,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_prev': pagination.has_prev,
-            'has_next': pagination.has_next,
-            'prev_page': page - 1 if pagination.has_prev else None,
-            'next_page': page + 1 if pagination.has_next else None
-        },
-        'message': f'Found {len(claims_data)} claims'
-    })
+    # Rows are serialized and sent as they are read
+    return stream_json_page(rows, _serialize_claim_row, None, build_meta)
 
 
 @rewards_bp.route('/claims', methods=['GET'])
@@ -512,7 +512,7 @@ def list_claims():
     limit = min(request.args.get('limit', 50, type=int), 100)
     offset = request.args.get('offset', 0, type=int)
 
-    query = RewardClaim.query
+    query = RewardClaim.query.options(*_claim_list_options())
 
     if status_filter:
         if status_filter not in ('pending', 'approved', 'rejected'):
@@ -525,32 +525,23 @@ def list_claims():
     if user_id:
         query = query.filter(RewardClaim.user_id == user_id)
 
-    # Order by most recent first
-    query = query.order_by(desc(RewardClaim.claimed_at))
-
-    # Get total count before pagination
-    total = query.count()
-
-    # Apply pagination
-    claims = query.offset(offset).limit(limit).all()
+    # The window count returns the filtered total with the page rows, so no
+    # separate COUNT query is needed
+    rows = query.add_columns(func.count().over().label('total')).order_by(
+        desc(RewardClaim.claimed_at)
+    ).offset(offset).limit(limit).all()
+    if rows:
+        total = rows[0].total
+    else:
+        # Past the last page the window has no rows to report on
+        total = query.count() if offset else 0
 
     claims_data = []
-    for claim in claims:
-        claims_data.append({
-            'id': claim.id,
-            'claim_id': claim.id,  # Alias for clarity
-            'reward_id': claim.reward_id,
-            'reward_name': claim.reward.name if claim.reward else 'Unknown',
-            'user_id': claim.user_id,
-            'username': claim.user.username if claim.user else 'Unknown',
-            'points_spent': claim.points_spent,
-            'claimed_at': claim.claimed_at.isoformat(),
-            'status': claim.status,
-            'expires_at': claim.expires_at.isoformat() if claim.expires_at else None,
-            'approved_by': claim.approved_by,
-            'approver_name': claim.approver.username if claim.approver else None,
-            'approved_at': claim.approved_at.isoformat() if claim.approved_at else None
-        })
+    for claim, _total in rows:
+        claim_dict = _claim_listing_dict(claim)
+        claim_dict['claim_id'] = claim.id  # Alias for clarity
+        claim_dict['expires_at'] = claim.expires_at
+        claims_data.append(claim_dict)
 
     return jsonify({
         'data': claims_data,
@@ -582,14 +573,14 @@ def reject_reward_claim(claim_id):
                 'user_id': claim.user_id,
                 'status': claim.status,
                 'approved_by': claim.approved_by,
-                'approved_at': claim.approved_at.isoformat(),
+                'approved_at': claim.approved_at,
                 'points_refunded': claim.points_spent
             },
             'message': 'Reward claim rejected, points refunded'
         }), 200
     except RewardServiceError as e:
         return jsonify({
-            'error': e.__class__.__name__.replace('Error', ''),
+            'error': e.error_label,
             'message': e.message
         }), e.status_code
     except Exception as e:
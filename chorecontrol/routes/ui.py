@@ -1,22 +1,39 @@
 """UI routes for ChoreControl web interface."""
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, g
-from sqlalchemy import func, and_, or_
-from datetime import datetime, date, timedelta
-from functools import wraps
-from auth import ha_auth_required
-from models import db, User, Chore, ChoreInstance, Reward, RewardClaim, PointsHistory, ChoreAssignment
+import secrets
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from sqlalchemy import func, and_, or_, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload
+from datetime import datetime, date, time, timedelta
+from functools import cache, wraps
+from werkzeug.local import LocalProxy
+from auth import ha_auth_required, get_current_user as auth_get_current_user
+from models import (
+    db, User, Chore, ChoreInstance, ChoreInstanceClaim, Reward, RewardClaim, PointsHistory, ChoreAssignment,
+    Counter
+)
 from utils.timezone import local_today, local_now
+from utils.loading import with_raiseload
+from utils.pagination import (
+    encode_cursor, created_at_sort_key, created_at_keyset_filter, due_date_keyset_filter
+)
 
 ui_bp = Blueprint('ui', __name__)
 
+# Calendar event colors by instance status
+_STATUS_COLORS = {
+    'assigned': '#1e88e5',   # blue
+    'claimed': '#fb8c00',    # warning/orange
+    'approved': '#4caf50',   # green
+    'rejected': '#e53935',   # red
+    'missed': '#757575'      # gray
+}
+
 
 def get_current_user():
-    """Get the current authenticated user from Flask g."""
-    if not hasattr(g, 'ha_user') or not g.ha_user:
-        return None
-    user = User.query.filter_by(ha_user_id=g.ha_user).first()
-    return user
+    """Get the current authenticated user (looked up once per request)."""
+    return auth_get_current_user()
 
 
 def redirect_claim_only_to_today(f):
@@ -41,18 +58,78 @@ def redirect_claim_only_to_today(f):
 
 
 def get_pending_count():
-    """Get total count of pending approvals (chores + rewards)."""
-    pending_instances = ChoreInstance.query.filter_by(status='claimed').count()
-    pending_claims = RewardClaim.query.filter_by(status='pending').count()
-    return pending_instances + pending_claims
+    """Get total count of pending approvals (chores + rewards) from the counters."""
+    return Counter.pending_total()
+
+
+def _keyset_paginate(query, sort_key, id_column, keyset_filter, per_page=20, total=None):
+    """Fetch one page of a list ordered by sort_key DESC, id DESC.
+
+    The Next link carries the last row's (sort_key, id) as an `after`
+    cursor, so later pages seek past it instead of scanning an OFFSET.
+    A bare ?page= (first page, Previous links, old bookmarks) or a
+    malformed cursor falls back to OFFSET.
+
+    Args:
+        query: Filtered query for the listed model
+        sort_key: Column expression the list is ordered by
+        id_column: Primary key column breaking ties
+        keyset_filter: Callable(cursor) returning the WHERE clause for
+            rows after the cursor, raising ValueError if malformed
+        per_page: Rows per page
+        total: Row count of query, if the caller already has it
+
+    Returns:
+        Tuple of (items, pagination dict for the template or None)
+    """
+    page = max(request.args.get('page', 1, type=int), 1)
+    after = request.args.get('after')
+
+    if total is None:
+        total = query.order_by(None).count()
+
+    rows = query.add_columns(sort_key, id_column)\
+        .order_by(sort_key.desc(), id_column.desc())
+
+    seek = None
+    if after and page > 1:
+        try:
+            seek = keyset_filter(after)
+        except ValueError:
+            seek = None
+    rows = rows.filter(seek) if seek is not None else rows.offset((page - 1) * per_page)
+
+    # Fetch one extra row to detect a following page
+    rows = rows.limit(per_page + 1).all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+
+    pagination = {
+        'page': page,
+        'total': total,
+        'start': (page - 1) * per_page + 1,
+        'end': min(page * per_page, total),
+        'has_prev': page > 1,
+        'has_next': has_next,
+        'prev_page': page - 1,
+        'next_page': page + 1,
+        'next_cursor': encode_cursor(*rows[-1][1:]) if has_next else None
+    } if total > 0 else None
+
+    return [row[0] for row in rows], pagination
 
 
 @ui_bp.context_processor
 def inject_globals():
-    """Inject global variables into all templates."""
+    """Inject global variables into all templates.
+
+    Both are proxies resolved on first use, so templates that never show the
+    nav (login, error pages) skip the lookups; each is queried at most once
+    per render.
+    """
     return {
-        'current_user': get_current_user(),
-        'pending_count': get_pending_count()
+        'current_user': LocalProxy(cache(get_current_user)),
+        'pending_count': LocalProxy(cache(get_pending_count))
     }
 
 
@@ -67,7 +144,7 @@ def dashboard():
     pending_approvals = ChoreInstance.query.filter_by(status='claimed').count()
     pending_rewards = RewardClaim.query.filter_by(status='pending').count()
 
-    today_start = datetime.combine(local_today(), datetime.min.time())
+    today_start = datetime.combine(local_today(), time.min)
     today_completed = ChoreInstance.query.filter(
         ChoreInstance.status == 'approved',
         ChoreInstance.approved_at >= today_start
@@ -93,15 +170,13 @@ def dashboard():
 
     # Get recent activity (approved, rejected, or missed in last 7 days)
     # Exclude missed unassigned "anytime" chores (due_date=None) as they're not truly missed
+    # Approving, rejecting or missing an instance bumps updated_at, so one
+    # range on its index covers approved_at/rejected_at too
     week_ago = datetime.utcnow() - timedelta(days=7)
     recent_activity = ChoreInstance.query.filter(
         and_(
             ChoreInstance.status.in_(['approved', 'rejected', 'missed']),
-            or_(
-                ChoreInstance.approved_at >= week_ago,
-                ChoreInstance.rejected_at >= week_ago,
-                ChoreInstance.updated_at >= week_ago
-            ),
+            ChoreInstance.updated_at >= week_ago,
             # Exclude missed unassigned anytime chores
             or_(
                 ChoreInstance.status != 'missed',
@@ -131,11 +206,20 @@ def chores_list():
     # Get filters from query params
     active_filter = request.args.get('active')
     assigned_to = request.args.get('assigned_to')
-    page = request.args.get('page', 1, type=int)
-    per_page = 20
 
-    # Build query
-    query = Chore.query
+    # Build query with just the columns the list shows; each row lists its
+    # assigned kids, so load the page's assignments and their users in one
+    # IN query
+    query = Chore.query.options(*with_raiseload(
+        load_only(
+            Chore.name, Chore.description, Chore.points, Chore.late_points,
+            Chore.recurrence_pattern, Chore.assignment_type, Chore.is_active
+        ),
+        selectinload(Chore.assignments)
+        .load_only(ChoreAssignment.chore_id, ChoreAssignment.user_id)
+        .joinedload(ChoreAssignment.user)
+        .load_only(User.username)
+    ))
 
     if active_filter == 'true':
         query = query.filter_by(is_active=True)
@@ -146,30 +230,17 @@ def chores_list():
         query = query.join(ChoreAssignment).filter(ChoreAssignment.user_id == int(assigned_to))
 
     # Paginate
-    pagination_obj = query.order_by(Chore.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    chores, pagination = _keyset_paginate(
+        query, created_at_sort_key(Chore), Chore.id,
+        lambda cursor: created_at_keyset_filter(Chore, cursor)
     )
 
-    chores = pagination_obj.items
-
     # Add assigned users to each chore
     for chore in chores:
         chore.assigned_users = [assignment.user_id for assignment in chore.assignments]
 
-    # Pagination info
-    pagination = {
-        'page': page,
-        'total': pagination_obj.total,
-        'start': (page - 1) * per_page + 1,
-        'end': min(page * per_page, pagination_obj.total),
-        'has_prev': pagination_obj.has_prev,
-        'has_next': pagination_obj.has_next,
-        'prev_page': page - 1,
-        'next_page': page + 1
-    } if pagination_obj.total > 0 else None
-
     # Get kids for filter dropdown
-    kids = User.query.filter_by(role='kid').order_by(User.username).all()
+    kids = User.kid_options()
 
     return render_template('chores/list.html',
                          chores=chores,
@@ -182,37 +253,26 @@ def chores_list():
 @redirect_claim_only_to_today
 def chore_detail(id):
     """View single chore with instances."""
-    chore = Chore.query.get_or_404(id)
+    chore = db.get_or_404(Chore, id)
 
-    # Get instance stats
-    total_instances = ChoreInstance.query.filter_by(chore_id=id).count()
-    completed_instances = ChoreInstance.query.filter_by(chore_id=id, status='approved').count()
+    # Get instance stats in one pass over the chore's instances
+    counts = db.session.query(
+        func.count(ChoreInstance.id).label('total'),
+        func.sum(case((ChoreInstance.status == 'approved', 1), else_=0)).label('completed')
+    ).filter(ChoreInstance.chore_id == id).one()
 
     instance_stats = {
-        'total': total_instances,
-        'completed': completed_instances
+        'total': counts.total,
+        'completed': counts.completed or 0
     }
 
-    # Get instances with pagination
-    page = request.args.get('page', 1, type=int)
-    per_page = 20
-
-    pagination_obj = ChoreInstance.query.filter_by(chore_id=id)\
-        .order_by(ChoreInstance.due_date.desc())\
-        .paginate(page=page, per_page=per_page, error_out=False)
-
-    instances = pagination_obj.items
-
-    pagination = {
-        'page': page,
-        'total': pagination_obj.total,
-        'start': (page - 1) * per_page + 1,
-        'end': min(page * per_page, pagination_obj.total),
-        'has_prev': pagination_obj.has_prev,
-        'has_next': pagination_obj.has_next,
-        'prev_page': page - 1,
-        'next_page': page + 1
-    } if pagination_obj.total > 0 else None
+    # Get instances with pagination (the total doubles as the page count)
+    instances, pagination = _keyset_paginate(
+        ChoreInstance.query.filter_by(chore_id=id),
+        ChoreInstance.due_date, ChoreInstance.id,
+        lambda cursor: due_date_keyset_filter(ChoreInstance, cursor),
+        total=counts.total
+    )
 
     return render_template('chores/detail.html',
                          chore=chore,
@@ -228,12 +288,14 @@ def chore_form(id=None):
     """Create or edit chore form."""
     chore = None
     if id:
-        chore = Chore.query.get_or_404(id)
+        chore = db.get_or_404(Chore, id, options=[
+            selectinload(Chore.assignments).load_only(ChoreAssignment.chore_id, ChoreAssignment.user_id)
+        ])
         # Add assigned users list
         chore.assigned_users = [assignment.user_id for assignment in chore.assignments]
 
     # Get kids for assignment
-    kids = User.query.filter_by(role='kid').order_by(User.username).all()
+    kids = User.kid_options()
 
     return render_template('chores/form.html', chore=chore, kids=kids)
 
@@ -247,56 +309,63 @@ def calendar():
     kid_id = request.args.get('kid_id', type=int)
 
     # Get all kids for the dropdown
-    kids = User.query.filter_by(role='kid').order_by(User.username).all()
-
-    # Build query for instances with due dates
-    query = ChoreInstance.query.filter(ChoreInstance.due_date.isnot(None))
+    kids = User.kid_options()
+
+    # Select just the columns each event needs; rows are plain tuples, so no
+    # ChoreInstance/Chore/User objects are built for the (largest) dated list
+    query = db.session.query(
+        ChoreInstance.id,
+        ChoreInstance.due_date,
+        ChoreInstance.status,
+        Chore.name,
+        Chore.points,
+        Chore.assignment_type,
+        User.username
+    ).join(Chore, ChoreInstance.chore_id == Chore.id)\
+        .outerjoin(User, ChoreInstance.assigned_to == User.id)\
+        .filter(ChoreInstance.due_date.isnot(None))
 
     # Filter by kid if selected
     if kid_id:
-        query = query.filter(ChoreInstance.assignee_id == kid_id)
-
-    instances_with_dates = query.all()
+        query = query.filter(ChoreInstance.assigned_to == kid_id)
 
     # Format instances for FullCalendar
     calendar_events = []
-    for instance in instances_with_dates:
-        # Get assigned user name
-        assigned_user = instance.assignee.username if instance.assignee else 'Unassigned'
-
-        # Get assignment type from chore
-        assignment_type = instance.chore.assignment_type if instance.chore else 'individual'
-
-        # Map status to colors
-        status_colors = {
-            'assigned': '#1e88e5',   # blue
-            'claimed': '#fb8c00',    # warning/orange
-            'approved': '#4caf50',   # green
-            'rejected': '#e53935',   # red
-            'missed': '#757575'      # gray
-        }
+    for row in query:
+        assigned_user = row.username or 'Unassigned'
+        color = _STATUS_COLORS.get(row.status, '#1e88e5')
 
         calendar_events.append({
-            'id': instance.id,
-            'title': f"{instance.chore.name} - {assigned_user}",
-            'start': instance.due_date.isoformat(),
-            'backgroundColor': status_colors.get(instance.status, '#1e88e5'),
-            'borderColor': status_colors.get(instance.status, '#1e88e5'),
+            'id': row.id,
+            'title': f"{row.name} - {assigned_user}",
+            'start': row.due_date.isoformat(),
+            'backgroundColor': color,
+            'borderColor': color,
             'extendedProps': {
-                'choreName': instance.chore.name,
+                'choreName': row.name,
                 'assignedTo': assigned_user,
-                'status': instance.status,
-                'points': instance.chore.points,
-                'assignmentType': assignment_type
+                'status': row.status,
+                'points': row.points,
+                'assignmentType': row.assignment_type or 'individual'
             }
         })
 
-    # Build query for instances without due dates
-    query_without_dates = ChoreInstance.query.filter(ChoreInstance.due_date.is_(None))
+    # Build query for instances without due dates, with the assigned kids
+    # that shared chores list as eligible
+    query_without_dates = ChoreInstance.query.options(*with_raiseload(
+        load_only(ChoreInstance.chore_id, ChoreInstance.assigned_to, ChoreInstance.status),
+        joinedload(ChoreInstance.chore)
+        .load_only(Chore.name, Chore.points, Chore.assignment_type)
+        .selectinload(Chore.assignments)
+        .load_only(ChoreAssignment.chore_id, ChoreAssignment.user_id)
+        .joinedload(ChoreAssignment.user)
+        .load_only(User.username),
+        joinedload(ChoreInstance.assignee).load_only(User.username)
+    )).filter(ChoreInstance.due_date.is_(None))
 
     # Filter by kid if selected
     if kid_id:
-        query_without_dates = query_without_dates.filter(ChoreInstance.assignee_id == kid_id)
+        query_without_dates = query_without_dates.filter(ChoreInstance.assigned_to == kid_id)
 
     instances_without_dates = query_without_dates.order_by(ChoreInstance.created_at.desc()).all()
 
@@ -326,11 +395,12 @@ def rewards_list():
     """List all rewards with filters."""
     # Get filters
     active_filter = request.args.get('active')
-    page = request.args.get('page', 1, type=int)
-    per_page = 20
 
-    # Build query
-    query = Reward.query
+    # Build query with just the columns the list shows
+    query = Reward.query.options(load_only(
+        Reward.name, Reward.description, Reward.points_cost,
+        Reward.cooldown_days, Reward.is_active
+    ))
 
     if active_filter == 'true':
         query = query.filter_by(is_active=True)
@@ -338,27 +408,24 @@ def rewards_list():
         query = query.filter_by(is_active=False)
 
     # Paginate
-    pagination_obj = query.order_by(Reward.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    rewards, pagination = _keyset_paginate(
+        query, created_at_sort_key(Reward), Reward.id,
+        lambda cursor: created_at_keyset_filter(Reward, cursor)
     )
 
-    rewards = pagination_obj.items
+    # Add claim counts for this page in one grouped query
+    claim_counts = db.session.query(
+        RewardClaim.reward_id,
+        func.count(RewardClaim.id).label('total'),
+        func.sum(case((RewardClaim.status == 'pending', 1), else_=0)).label('pending')
+    ).filter(
+        RewardClaim.reward_id.in_([reward.id for reward in rewards])
+    ).group_by(RewardClaim.reward_id).all()
 
-    # Add claim counts
+    # Build lookup: {reward_id: (total, pending)}
+    counts_by_reward = {r.reward_id: (r.total, r.pending) for r in claim_counts}
     for reward in rewards:
-        reward.total_claims = RewardClaim.query.filter_by(reward_id=reward.id).count()
-        reward.pending_claims = RewardClaim.query.filter_by(reward_id=reward.id, status='pending').count()
-
-    pagination = {
-        'page': page,
-        'total': pagination_obj.total,
-        'start': (page - 1) * per_page + 1,
-        'end': min(page * per_page, pagination_obj.total),
-        'has_prev': pagination_obj.has_prev,
-        'has_next': pagination_obj.has_next,
-        'prev_page': page - 1,
-        'next_page': page + 1
-    } if pagination_obj.total > 0 else None
+        reward.total_claims, reward.pending_claims = counts_by_reward.get(reward.id, (0, 0))
 
     # Get pending claims
     pending_claims = RewardClaim.query.filter_by(status='pending')\
@@ -379,7 +446,7 @@ def reward_form(id=None):
     """Create or edit reward form."""
     reward = None
     if id:
-        reward = Reward.query.get_or_404(id)
+        reward = db.get_or_404(Reward, id)
 
     return render_template('rewards/form.html', reward=reward)
 
@@ -389,29 +456,36 @@ def reward_form(id=None):
 @redirect_claim_only_to_today
 def approval_queue():
     """Show all pending approvals (chores and rewards)."""
-    # Get pending chore instances (regular claimed chores)
-    pending_instances = ChoreInstance.query.filter_by(status='claimed')\
+    # Get pending chore instances (regular claimed chores) with the chore
+    # and claimer each card shows
+    pending_instances = ChoreInstance.query.options(*with_raiseload(
+        joinedload(ChoreInstance.chore),
+        joinedload(ChoreInstance.claimer)
+    )).filter_by(status='claimed')\
         .order_by(ChoreInstance.claimed_at.desc())\
         .all()
 
-    # Get work-together instances with closed claiming and pending claim approvals
+    # Get work-together instances with closed claiming and pending claim
+    # approvals, with every claim and its kid for the per-kid rows
     work_together_pending = ChoreInstance.query\
         .join(Chore)\
+        .options(*with_raiseload(
+            contains_eager(ChoreInstance.chore),
+            selectinload(ChoreInstance.claims).joinedload(ChoreInstanceClaim.user)
+        ))\
         .filter(
             Chore.allow_work_together == True,
-            ChoreInstance.status == 'claiming_closed'
+            ChoreInstance.status == 'claiming_closed',
+            ChoreInstance.claims.any(ChoreInstanceClaim.status == 'claimed')
         )\
         .order_by(ChoreInstance.claiming_closed_at.desc())\
         .all()
 
-    # Filter to only those with pending claims
-    work_together_pending = [
-        i for i in work_together_pending
-        if any(c.status == 'claimed' for c in i.claims)
-    ]
-
-    # Get pending reward claims
-    pending_claims = RewardClaim.query.filter_by(status='pending')\
+    # Get pending reward claims with their reward and claimer
+    pending_claims = RewardClaim.query.options(*with_raiseload(
+        joinedload(RewardClaim.reward),
+        joinedload(RewardClaim.user)
+    )).filter_by(status='pending')\
         .order_by(RewardClaim.claimed_at.desc())\
         .all()
 
@@ -444,7 +518,7 @@ def users_list():
 @redirect_claim_only_to_today
 def user_detail(id):
     """View single user with details."""
-    user = User.query.get_or_404(id)
+    user = db.get_or_404(User, id)
 
     stats = {}
     points_history = []
@@ -452,43 +526,36 @@ def user_detail(id):
     pagination = None
 
     if user.role == 'kid':
-        # Get stats
-        stats['total_completed'] = ChoreInstance.query.filter_by(
-            claimed_by=id,
-            status='approved'
-        ).count()
-
-        stats['total_points_earned'] = db.session.query(func.sum(PointsHistory.points_delta))\
-            .filter(
-                PointsHistory.user_id == id,
-                PointsHistory.points_delta > 0
-            ).scalar() or 0
-
-        stats['total_rewards_claimed'] = RewardClaim.query.filter_by(
-            user_id=id,
-            status='approved'
-        ).count()
+        # Get stats: one points history pass (also sizing the history
+        # pages), with the chore and reward counts as scalar subqueries
+        completed_chores = db.session.query(func.count(ChoreInstance.id)).filter(
+            ChoreInstance.claimed_by == id,
+            ChoreInstance.status == 'approved'
+        ).scalar_subquery()
+
+        approved_rewards = db.session.query(func.count(RewardClaim.id)).filter(
+            RewardClaim.user_id == id,
+            RewardClaim.status == 'approved'
+        ).scalar_subquery()
+
+        counts = db.session.query(
+            func.count(PointsHistory.id).label('history'),
+            func.sum(case((PointsHistory.points_delta > 0, PointsHistory.points_delta), else_=0)).label('earned'),
+            completed_chores.label('completed'),
+            approved_rewards.label('rewards')
+        ).filter(PointsHistory.user_id == id).one()
+
+        stats['total_completed'] = counts.completed
+        stats['total_points_earned'] = counts.earned or 0
+        stats['total_rewards_claimed'] = counts.rewards
 
         # Get points history with pagination
-        page = request.args.get('page', 1, type=int)
-        per_page = 20
-
-        pagination_obj = PointsHistory.query.filter_by(user_id=id)\
-            .order_by(PointsHistory.created_at.desc())\
-            .paginate(page=page, per_page=per_page, error_out=False)
-
-        points_history = pagination_obj.items
-
-        pagination = {
-            'page': page,
-            'total': pagination_obj.total,
-            'start': (page - 1) * per_page + 1,
-            'end': min(page * per_page, pagination_obj.total),
-            'has_prev': pagination_obj.has_prev,
-            'has_next': pagination_obj.has_next,
-            'prev_page': page - 1,
-            'next_page': page + 1
-        } if pagination_obj.total > 0 else None
+        points_history, pagination = _keyset_paginate(
+            PointsHistory.query.filter_by(user_id=id),
+            created_at_sort_key(PointsHistory), PointsHistory.id,
+            lambda cursor: created_at_keyset_filter(PointsHistory, cursor),
+            total=counts.history
+        )
 
         # Get assigned chores
         assigned_chores = Chore.query.join(ChoreAssignment)\
@@ -531,29 +598,31 @@ def create_user():
         flash(f'Username "{username}" already exists.', 'error')
         return redirect(url_for('ui.users_list'))
 
-    # Generate a unique ha_user_id for local users
+    # Local users get ha_user_id local-<username>. The unique index on
+    # ha_user_id catches a collision (e.g. "Sam" after "sam"), in which case
+    # a random suffix is added instead of probing for a free counter.
     ha_user_id = f'local-{username.lower().replace(" ", "-")}'
 
-    # Ensure ha_user_id is unique
-    counter = 1
-    original_ha_user_id = ha_user_id
-    while User.query.filter_by(ha_user_id=ha_user_id).first():
-        ha_user_id = f'{original_ha_user_id}-{counter}'
-        counter += 1
-
-    # Create user
-    new_user = User(
-        ha_user_id=ha_user_id,
-        username=username,
-        role=role,
-        points=0
-    )
-
-    if password:
-        new_user.set_password(password)
+    for suffix in ('', f'-{secrets.token_hex(3)}'):
+        new_user = User(
+            ha_user_id=ha_user_id + suffix,
+            username=username,
+            role=role,
+            points=0
+        )
 
-    db.session.add(new_user)
-    db.session.commit()
+        if password:
+            new_user.set_password(password)
+
+        db.session.add(new_user)
+        try:
+            db.session.commit()
+            break
+        except IntegrityError:
+            db.session.rollback()
+    else:
+        flash(f'Could not create user "{username}". Please try again.', 'error')
+        return redirect(url_for('ui.users_list'))
 
     flash(f'User "{username}" created successfully.', 'success')
     return redirect(url_for('ui.users_list'))
@@ -577,27 +646,19 @@ def update_user():
         flash('User ID is required.', 'error')
         return redirect(url_for('ui.users_list'))
 
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         flash('User not found.', 'error')
         return redirect(url_for('ui.users_list'))
 
-    if username:
-        # Check if username is taken by another user
-        existing = User.query.filter(User.username == username, User.id != user_id).first()
-        if existing:
-            flash(f'Username "{username}" is already taken.', 'error')
-            return redirect(url_for('ui.users_list'))
-        user.username = username
-
-    if role and role in ('parent', 'kid'):
-        # If changing from parent to kid, initialize points
-        if user.role == 'parent' and role == 'kid':
-            user.points = 0
-        user.role = role
-
-    if password:
-        user.set_password(password)
+    # One UPDATE, skipped if the username belongs to another user
+    if not user.update_profile(
+        username=username or None,
+        role=role if role in ('parent', 'kid') else None,
+        password=password or None
+    ):
+        flash(f'Username "{username}" is already taken.', 'error')
+        return redirect(url_for('ui.users_list'))
 
     db.session.commit()
 
@@ -631,6 +692,25 @@ def diagnostic():
     return render_template('diagnostic.html')
 
 
+def _claimable_instances(extra: bool) -> list:
+    """Assigned instances of active chores, with what the claim pages read.
+
+    Claims (work-together eligibility), chore assignments and assignees are
+    loaded up front with one IN query each instead of once per instance.
+    """
+    return ChoreInstance.query.join(Chore).options(*with_raiseload(
+        contains_eager(ChoreInstance.chore)
+        .selectinload(Chore.assignments)
+        .joinedload(ChoreAssignment.user),
+        selectinload(ChoreInstance.claims),
+        joinedload(ChoreInstance.assignee)
+    )).filter(
+        ChoreInstance.status == 'assigned',
+        Chore.is_active == True,  # noqa: E712
+        Chore.extra == extra
+    ).all()
+
+
 @ui_bp.route('/today')
 @ha_auth_required
 def today_page():
@@ -659,12 +739,9 @@ def today_page():
             else:
                 return kids  # No assignments = all kids
 
-        # Individual chores
-        if instance.assignee:
-            return [instance.assignee]
-        elif instance.assigned_to:
-            assignee = User.query.get(instance.assigned_to)
-            return [assignee] if assignee else []
+        # Individual chores (assignee is loaded with the instance)
+        if instance.assigned_to:
+            return [instance.assignee] if instance.assignee else []
         else:
             return [a.user for a in instance.chore.assignments]
 
@@ -712,11 +789,16 @@ def today_page():
                 return (None, {})
 
     # Get all assigned, active instances (excluding extra chores)
-    all_instances = ChoreInstance.query.join(Chore).filter(
-        ChoreInstance.status == 'assigned',
-        Chore.is_active == True,  # noqa: E712
-        Chore.extra == False  # noqa: E712
-    ).all()
+    all_instances = _claimable_instances(extra=False)
+
+    # Categorize each instance and resolve who may claim it once, rather than
+    # once per kid row below
+    claimable = []
+    for instance in all_instances:
+        category, extra_data = categorize_instance(instance)
+        if category is None:
+            continue  # Skip instances outside windows
+        claimable.append((instance, category, extra_data, get_eligible_kids(instance)))
 
     # Build kid-based data structure
     kids_data = []
@@ -729,18 +811,10 @@ def today_page():
         }
         has_chores = False
 
-        for instance in all_instances:
-            eligible_kids = get_eligible_kids(instance)
-
+        for instance, category, extra_data, eligible_kids in claimable:
             if kid not in eligible_kids:
                 continue
 
-            # Categorize the instance
-            category, extra_data = categorize_instance(instance)
-
-            if category is None:
-                continue  # Skip instances outside windows
-
             # Build chore data for this kid
             chore_data = {
                 'instance': instance,
@@ -844,12 +918,9 @@ def extra_page():
             else:
                 return users  # No assignments = all users
 
-        # Individual chores
-        if instance.assignee:
-            return [instance.assignee]
-        elif instance.assigned_to:
-            assignee = User.query.get(instance.assigned_to)
-            return [assignee] if assignee else []
+        # Individual chores (assignee is loaded with the instance)
+        if instance.assigned_to:
+            return [instance.assignee] if instance.assignee else []
         else:
             return [a.user for a in instance.chore.assignments]
 
@@ -897,11 +968,16 @@ def extra_page():
                 return (None, {})
 
     # Get all assigned, active EXTRA instances
-    all_instances = ChoreInstance.query.join(Chore).filter(
-        ChoreInstance.status == 'assigned',
-        Chore.is_active == True,  # noqa: E712
-        Chore.extra == True  # noqa: E712
-    ).all()
+    all_instances = _claimable_instances(extra=True)
+
+    # Categorize each instance and resolve who may claim it once, rather than
+    # once per user row below
+    claimable = []
+    for instance in all_instances:
+        category, extra_data = categorize_instance(instance)
+        if category is None:
+            continue  # Skip instances outside windows
+        claimable.append((instance, category, extra_data, get_eligible_users(instance)))
 
     # Build user-based data structure
     users_data = []
@@ -914,18 +990,10 @@ def extra_page():
         }
         has_chores = False
 
-        for instance in all_instances:
-            eligible_users = get_eligible_users(instance)
-
+        for instance, category, extra_data, eligible_users in claimable:
             if user not in eligible_users:
                 continue
 
-            # Categorize the instance
-            category, extra_data = categorize_instance(instance)
-
-            if category is None:
-                continue  # Skip instances outside windows
-
             # Build chore data for this user
             chore_data = {
                 'instance': instance,
@@ -126,7 +126,7 @@ def update_mappings():
             continue
 
         # Get user
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             errors.append(f'User {user_id} not found')
             continue
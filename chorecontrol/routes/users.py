@@ -3,6 +3,7 @@
 from flask import Blueprint, jsonify, request, g
 from sqlalchemy import desc
 from models import db, User, PointsHistory
+from auth import require_role
 
 users_bp = Blueprint('users', __name__, url_prefix='/api/users')
 
@@ -50,22 +51,8 @@ def requires_auth(f):
     return decorated_function
 
 
-def requires_parent(f):
-    """Decorator to ensure user is a parent."""
-    from functools import wraps
-
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        user = get_current_user()
-        if user is None or user.role != 'parent':
-            return jsonify({
-                'error': 'Forbidden',
-                'message': 'This action requires parent privileges'
-            }), 403
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+# Parent-only API routes
+requires_parent = require_role('parent')
 
 
 @users_bp.route('', methods=['GET'])
@@ -226,7 +213,7 @@ def get_user(user_id):
     Returns:
         JSON response with user details including relationships
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -281,7 +268,7 @@ def update_user(user_id):
     Returns:
         JSON response with updated user data
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -369,7 +356,7 @@ def get_user_points(user_id):
     Returns:
         JSON response with current balance, calculated balance, and paginated history
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -436,7 +423,7 @@ def delete_user(user_id):
         - Points history
         - Reward claims
     """
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({
@@ -73,9 +73,13 @@ echo "Starting Flask application on port 8099..."
 # Use gunicorn for production (more robust than Flask dev server)
 if command -v gunicorn > /dev/null 2>&1; then
     echo "Using Gunicorn for production deployment"
+    # Threaded workers: a request waiting on SQLite or Home Assistant no
+    # longer holds up the rest of its worker's queue
     exec gunicorn \
         --bind 0.0.0.0:8099 \
         --workers 2 \
+        --worker-class gthread \
+        --threads "${GUNICORN_THREADS:-4}" \
         --timeout 120 \
         --log-level info \
         --access-logfile - \
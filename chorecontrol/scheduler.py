@@ -42,6 +42,7 @@ def init_scheduler(app):
     from jobs.missed_instances import mark_missed_instances
     from jobs.reward_expiration import expire_pending_rewards
     from jobs.points_audit import audit_points_balances
+    from jobs.db_maintenance import optimize_database
 
     # Configure scheduler timezone
     timezone = app.config.get('SCHEDULER_TIMEZONE', 'UTC')
@@ -105,6 +106,15 @@ def init_scheduler(app):
         replace_existing=True
     )
 
+    # Refresh query planner statistics nightly at 02:30
+    scheduler.add_job(
+        with_app_context(optimize_database),
+        trigger=CronTrigger(hour=2, minute=30, timezone=timezone),
+        id='optimize_database',
+        name='Refresh database query planner statistics',
+        replace_existing=True
+    )
+
     # Start the scheduler (only if not already running)
     if not scheduler.running:
         scheduler.start()
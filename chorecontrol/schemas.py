@@ -6,6 +6,7 @@ validation and parsing utilities.
 """
 
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import json
 
@@ -105,10 +106,28 @@ def validate_recurrence_pattern(pattern: Dict[str, Any]) -> tuple[bool, Optional
     if not isinstance(pattern, dict):
         return False, "Pattern must be a dictionary"
 
-    pattern_type = pattern.get('type')
-    if not pattern_type:
+    if not pattern.get('type'):
         return False, "Pattern must have a 'type' field"
 
+    # Forms resubmit the same few patterns, so validate each distinct
+    # pattern once and answer repeats from the cache
+    try:
+        pattern_key = json.dumps(pattern, sort_keys=True)
+    except (TypeError, ValueError):
+        return _validate_pattern(pattern)
+    return _validate_pattern_cached(pattern_key)
+
+
+@lru_cache(maxsize=1024)
+def _validate_pattern_cached(pattern_key: str) -> tuple[bool, Optional[str]]:
+    """Validate a pattern given as canonical (sort_keys) JSON."""
+    return _validate_pattern(json.loads(pattern_key))
+
+
+def _validate_pattern(pattern: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    """Run schema validation on a pattern that has a 'type' field."""
+    pattern_type = pattern.get('type')
+
     try:
         # Import jsonschema only when needed
         import jsonschema
@@ -19,7 +19,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 from models import db, User, Chore, ChoreAssignment, ChoreInstance
-from models import Reward, RewardClaim, PointsHistory
+from models import Reward, RewardClaim, RewardUserClaimCount, PointsHistory, Counter
 from app import create_app
 from utils.instance_generator import generate_instances_for_chore
 
@@ -87,6 +87,8 @@ class SeedDataGenerator:
 
         db.session.query(PointsHistory).delete()
         db.session.query(RewardClaim).delete()
+        db.session.query(RewardUserClaimCount).delete()
+        db.session.query(Counter).delete()
         db.session.query(Reward).delete()
         db.session.query(ChoreInstance).delete()
         db.session.query(ChoreAssignment).delete()
@@ -11,7 +11,7 @@ Routes should delegate to this service and handle HTTP responses.
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from models import db, ChoreInstance, ChoreInstanceClaim, User, ChoreAssignment
 from utils.timezone import local_today
@@ -21,7 +21,12 @@ logger = logging.getLogger(__name__)
 
 
 class InstanceServiceError(Exception):
-    """Base exception for instance service errors."""
+    """Base exception for instance service errors.
+
+    error_label is the "error" field routes return for this class.
+    """
+
+    error_label = 'InstanceService Error'
 
     def __init__(self, message: str, status_code: int = 400):
         self.message = message
@@ -30,16 +35,22 @@ class InstanceServiceError(Exception):
 
 
 class NotFoundError(InstanceServiceError):
+    error_label = 'NotFound Error'
+
     def __init__(self, message: str):
         super().__init__(message, 404)
 
 
 class ForbiddenError(InstanceServiceError):
+    error_label = 'Forbidden Error'
+
     def __init__(self, message: str):
         super().__init__(message, 403)
 
 
 class BadRequestError(InstanceServiceError):
+    error_label = 'BadRequest Error'
+
     def __init__(self, message: str):
         super().__init__(message, 400)
 
@@ -86,12 +97,12 @@ class InstanceService:
                     'Only "assigned" chores can be claimed.'
                 )
             else:
-                assignment = ChoreAssignment.query.filter_by(
+                assigned = db.session.query(ChoreAssignment.query.filter_by(
                     chore_id=instance.chore_id,
                     user_id=user_id
-                ).first()
+                ).exists()).scalar()
 
-                if not assignment:
+                if not assigned:
                     raise ForbiddenError('You are not assigned to this chore')
 
         instance.status = 'claimed'
@@ -123,11 +134,11 @@ class InstanceService:
             raise BadRequestError('Claiming is closed for this chore')
 
         # Check if user already claimed
-        existing = ChoreInstanceClaim.query.filter_by(
+        already_claimed = db.session.query(ChoreInstanceClaim.query.filter_by(
             chore_instance_id=instance.id,
             user_id=user_id
-        ).first()
-        if existing:
+        ).exists()).scalar()
+        if already_claimed:
             raise BadRequestError('You have already claimed this chore')
 
         # Verify user is assigned
@@ -138,15 +149,17 @@ class InstanceService:
         is_late = instance.due_date and local_today() > instance.due_date
 
         # Create claim record
+        # Setting the relationship appends to instance.claims even when that
+        # collection is already loaded, which a flush alone would not do
         claim = ChoreInstanceClaim(
-            chore_instance_id=instance.id,
+            instance=instance,
             user_id=user_id,
             claimed_at=datetime.utcnow(),
             claimed_late=is_late,
             status='claimed'
         )
         db.session.add(claim)
-        db.session.flush()  # Flush so claim appears in instance.claims relationship
+        db.session.flush()
 
         # Check if should auto-close (all assigned kids have claimed)
         instance.check_auto_close_claiming()
@@ -155,7 +168,7 @@ class InstanceService:
         logger.info(f"Work-together claim created for instance {instance.id} by user {user_id}")
 
         try:
-            fire_webhook('chore_instance_claimed', instance, {'claim': claim.to_dict()})
+            fire_webhook('chore_instance_claimed', instance, claim=claim.to_dict())
         except Exception as e:
             logger.error(f"Failed to fire webhook: {e}")
 
@@ -329,7 +342,8 @@ class InstanceService:
         return instance
 
     @staticmethod
-    def reassign(instance_id: int, new_user_id: int, reassigned_by_id: int) -> ChoreInstance:
+    def reassign(instance_id: int, new_user_id: int,
+                 reassigned_by_id: int) -> Tuple[ChoreInstance, str]:
         """Reassign a chore instance to a different kid.
 
         Args:
@@ -338,7 +352,7 @@ class InstanceService:
             reassigned_by_id: ID of the parent doing the reassignment
 
         Returns:
-            The updated ChoreInstance
+            Tuple of (updated ChoreInstance, new assignee's username)
 
         Raises:
             NotFoundError: Instance not found
@@ -375,9 +389,11 @@ class InstanceService:
             )
             db.session.add(assignment)
 
+        # Read before commit expires new_user, so callers need no extra query
+        new_username = new_user.username
         db.session.commit()
 
-        return instance
+        return instance, new_username
 
     # Work-together specific methods
 
@@ -465,7 +481,7 @@ class InstanceService:
         logger.info(f"Claim {claim_id} approved by user {approver_id}, {claim.points_awarded} points awarded")
 
         try:
-            fire_webhook('work_together_claim_approved', claim.instance, {'claim': claim.to_dict()})
+            fire_webhook('work_together_claim_approved', claim.instance, claim=claim.to_dict())
         except Exception as e:
             logger.error(f"Failed to fire webhook: {e}")
 
@@ -516,7 +532,7 @@ class InstanceService:
         logger.info(f"Claim {claim_id} rejected by user {rejecter_id}")
 
         try:
-            fire_webhook('work_together_claim_rejected', claim.instance, {'claim': claim.to_dict()})
+            fire_webhook('work_together_claim_rejected', claim.instance, claim=claim.to_dict())
         except Exception as e:
             logger.error(f"Failed to fire webhook: {e}")
 
@@ -13,7 +13,10 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlalchemy.orm import joinedload
+
 from models import db, Reward, RewardClaim, User
+from utils.loading import commit_keep_loaded
 from utils.webhooks import fire_webhook
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,8 @@ logger = logging.getLogger(__name__)
 class RewardServiceError(Exception):
     """Base exception for reward service errors."""
 
+    error_label = 'RewardService'
+
     def __init__(self, message: str, status_code: int = 400, details: Optional[dict] = None):
         self.message = message
         self.status_code = status_code
@@ -30,16 +35,22 @@ class RewardServiceError(Exception):
 
 
 class NotFoundError(RewardServiceError):
+    error_label = 'NotFound'
+
     def __init__(self, message: str):
         super().__init__(message, 404)
 
 
 class ForbiddenError(RewardServiceError):
+    error_label = 'Forbidden'
+
     def __init__(self, message: str):
         super().__init__(message, 403)
 
 
 class BadRequestError(RewardServiceError):
+    error_label = 'BadRequest'
+
     def __init__(self, message: str, details: Optional[dict] = None):
         super().__init__(message, 400, details)
 
@@ -57,8 +68,15 @@ class RewardService:
 
     @staticmethod
     def get_claim(claim_id: int) -> RewardClaim:
-        """Get a claim by ID or raise NotFoundError."""
-        claim = db.session.get(RewardClaim, claim_id)
+        """Get a claim by ID or raise NotFoundError.
+
+        The claim's reward and claimer are joined in, since every claim
+        transition reads them for the points refund, response or webhook.
+        """
+        claim = db.session.get(RewardClaim, claim_id, options=[
+            joinedload(RewardClaim.reward),
+            joinedload(RewardClaim.user)
+        ])
         if not claim:
             raise NotFoundError(f'Reward claim {claim_id} not found')
         return claim
@@ -88,19 +106,9 @@ class RewardService:
         if user.role not in ('kid', 'claim_only'):
             raise ForbiddenError('Only kids can claim rewards')
 
-        can_claim, reason = reward.can_claim(user_id)
+        can_claim, reason, details = reward.check_claim(user_id)
 
         if not can_claim:
-            details = {}
-            if 'Insufficient points' in reason:
-                details['required'] = reward.points_cost
-                details['current'] = user.points
-            elif 'cooldown' in reason.lower():
-                import re
-                match = re.search(r'(\d+)', reason)
-                if match:
-                    details['cooldown_days_remaining'] = int(match.group(1))
-
             raise BadRequestError(reason, details if details else None)
 
         claim = RewardClaim(
@@ -113,18 +121,24 @@ class RewardService:
         if reward.requires_approval:
             claim.expires_at = datetime.utcnow() + timedelta(days=7)
 
-        db.session.add(claim)
-        db.session.flush()
-
-        old_balance = user.points
-        user.adjust_points(
-            delta=-reward.points_cost,
+        # The balance check above can race another claim; spend_points
+        # re-checks it in the UPDATE itself. The claim reaches the session
+        # through its history entry, so both are inserted by the single
+        # flush in commit()
+        if not user.spend_points(
+            reward.points_cost,
             reason=f"Claimed reward: {reward.name}",
             created_by_id=user.id,
-            reward_claim_id=claim.id
-        )
+            reward_claim=claim
+        ):
+            db.session.refresh(user, ['points'])
+            raise BadRequestError(
+                f"Insufficient points (need {reward.points_cost}, have {user.points})",
+                {'required': reward.points_cost, 'current': user.points}
+            )
+        old_balance = user.points + reward.points_cost
 
-        db.session.commit()
+        commit_keep_loaded()
 
         fire_webhook('reward_claimed', claim)
 
@@ -169,7 +183,7 @@ class RewardService:
         claim_data = claim.to_dict()
 
         # Refund points to the claimer (not necessarily the current user)
-        claimer = db.session.get(User, claim.user_id)
+        claimer = claim.user
         claimer.adjust_points(
             delta=claim.points_spent,
             reason=f"Unclaimed reward: {reward.name}",
@@ -212,7 +226,7 @@ class RewardService:
         claim.approved_at = datetime.utcnow()
         claim.expires_at = None
 
-        db.session.commit()
+        commit_keep_loaded()
 
         fire_webhook('reward_approved', claim)
 
@@ -249,7 +263,7 @@ class RewardService:
         claim.expires_at = None
 
         # Refund points
-        claimer = db.session.get(User, claim.user_id)
+        claimer = claim.user
         reward = claim.reward
         claimer.adjust_points(
             delta=claim.points_spent,
@@ -258,7 +272,7 @@ class RewardService:
             reward_claim_id=claim.id
         )
 
-        db.session.commit()
+        commit_keep_loaded()
 
         fire_webhook('reward_rejected', claim, reason='manual')
 
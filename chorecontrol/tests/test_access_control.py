@@ -1,7 +1,7 @@
 """Tests for role-based access control."""
 
 import pytest
-from models import User
+from models import db, User, Settings
 
 
 class TestUIAccessControl:
@@ -224,6 +224,26 @@ class TestParentRequiredDecorator:
         assert response.status_code == 200
 
 
+class TestRequireRoleDecorator:
+    """Tests for the @require_role decorator on API routes."""
+
+    def test_kid_denied_with_route_message(self, client, kid_headers):
+        """Test that a kid gets the route's own 403 message."""
+        response = client.post('/api/points/adjust', headers=kid_headers,
+                               json={'user_id': 1, 'points_delta': 5, 'reason': 'x'})
+        assert response.status_code == 403
+        assert response.get_json() == {
+            'error': 'Forbidden',
+            'message': 'Only parents can manually adjust points'
+        }
+
+    def test_claim_only_denied_parent_api(self, client, claim_only_headers):
+        """Test that claim_only users cannot use parent-only API routes."""
+        response = client.delete('/api/rewards/1', headers=claim_only_headers)
+        assert response.status_code == 403
+        assert 'Only parents' in response.get_json()['message']
+
+
 class TestUnauthenticatedAccess:
     """Tests for unauthenticated access attempts."""
 
@@ -255,6 +275,77 @@ class TestUnauthenticatedAccess:
             assert '/login' in response.location
 
 
+class TestAPITokenSettings:
+    """Tests for API token lookups through the settings cache."""
+
+    def test_bearer_token_authenticates(self, client, db_session):
+        """Test that the stored API token is accepted."""
+        Settings.set('api_token', 'test-token')
+
+        response = client.get('/api/users', headers={'Authorization': 'Bearer test-token'})
+        assert response.status_code == 200
+
+    def test_settings_get_served_from_cache(self, db_session):
+        """Test that repeated lookups do not re-read the database."""
+        Settings.set('api_token', 'cached-token')
+
+        # Change the row behind the cache's back
+        db_session.execute(
+            db.update(Settings).where(Settings.key == 'api_token').values(value='other')
+        )
+        db_session.commit()
+
+        assert Settings.get('api_token') == 'cached-token'
+
+    def test_settings_set_refreshes_cache(self, client, db_session):
+        """Test that a new token replaces the old one immediately."""
+        Settings.set('api_token', 'old-token')
+        assert Settings.get('api_token') == 'old-token'
+
+        Settings.set('api_token', 'new-token')
+        assert Settings.get('api_token') == 'new-token'
+
+        response = client.get('/api/users', headers={'Authorization': 'Bearer old-token'})
+        assert response.status_code == 401
+
+    def test_settings_get_missing_returns_default(self, db_session):
+        """Test that a missing key returns the default."""
+        assert Settings.get('missing-key', 'fallback') == 'fallback'
+
+
+class TestPasswordLogin:
+    """Tests for local username/password login."""
+
+    @pytest.fixture
+    def local_user(self, db_session):
+        user = User(ha_user_id='local-parent', username='Local Parent', role='parent', points=0)
+        user.set_password('secret123')
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    def test_login_success_sets_session(self, client, local_user):
+        """Test that valid credentials log the user in."""
+        response = client.post('/login', data={'username': 'Local Parent', 'password': 'secret123'})
+        assert response.status_code == 302
+
+        with client.session_transaction() as sess:
+            assert sess['user_id'] == local_user.id
+            assert sess['ha_user_id'] == 'local-parent'
+
+    def test_login_wrong_password(self, client, local_user):
+        """Test that an invalid password is rejected."""
+        response = client.post('/login', data={'username': 'Local Parent', 'password': 'wrong'})
+        assert response.status_code == 200
+        assert b'Invalid username or password' in response.data
+
+    def test_login_user_without_password(self, client, parent_user):
+        """Test that HA-only users cannot log in with a password."""
+        response = client.post('/login', data={'username': 'Test Parent', 'password': 'anything'})
+        assert response.status_code == 200
+        assert b'cannot log in with a password' in response.data
+
+
 class TestRoleBasedUIElements:
     """Tests for role-based UI element visibility."""
 
@@ -10,6 +10,7 @@ from jobs.auto_approval import check_auto_approvals
 from jobs.missed_instances import mark_missed_instances
 from jobs.reward_expiration import expire_pending_rewards
 from jobs.points_audit import audit_points_balances
+from jobs.db_maintenance import optimize_database
 
 
 # =============================================================================
@@ -853,6 +854,21 @@ class TestAuditPointsBalances:
             assert kid.verify_points_balance()
 
 
+class TestOptimizeDatabase:
+    """Tests for optimize_database job."""
+
+    def test_optimize_runs_on_populated_database(self, app, db_session, kid_user, sample_chore):
+        """Test that the optimize pragma runs cleanly against the app database."""
+        with app.app_context():
+            db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(),
+                                         assigned_to=kid_user.id, status='assigned'))
+            db.session.commit()
+
+            optimize_database()
+
+            assert ChoreInstance.query.count() == 1
+
+
 # =============================================================================
 # Tests for Scheduler Module
 # =============================================================================
@@ -32,7 +32,7 @@ class TestListChores:
         assert response.status_code == 200
         data = response.get_json()
         assert data['data'] == []
-        assert data['total'] == 0
+        assert data['has_more'] is False
         assert data['limit'] == 50
         assert data['offset'] == 0
 
@@ -42,7 +42,7 @@ class TestListChores:
         assert response.status_code == 200
         data = response.get_json()
         assert len(data['data']) == 1
-        assert data['total'] == 1
+        assert data['has_more'] is False
         assert data['data'][0]['name'] == 'Take out trash'
         assert data['data'][0]['points'] == 5
 
@@ -139,7 +139,7 @@ class TestListChores:
         assert response.status_code == 200
         data = response.get_json()
         assert len(data['data']) == 2
-        assert data['total'] == 5
+        assert data['has_more'] is True
         assert data['limit'] == 2
         assert data['offset'] == 0
 
@@ -148,9 +148,51 @@ class TestListChores:
         assert response.status_code == 200
         data = response.get_json()
         assert len(data['data']) == 2
-        assert data['total'] == 5
+        assert data['has_more'] is True
 
 
+    def test_list_chores_cursor_pagination(self, client, parent_headers, db_session, parent_user):
+        """Test walking the chore list with next_cursor."""
+        for i in range(5):
+            db_session.add(Chore(name=f'Chore {i}', points=i, created_by=parent_user.id))
+        db_session.commit()
+
+        seen = []
+        url = '/api/chores?limit=2'
+        while True:
+            data = client.get(url, headers=parent_headers).get_json()
+            seen.extend(chore['id'] for chore in data['data'])
+            if not data['next_cursor']:
+                break
+            url = f"/api/chores?limit=2&cursor={data['next_cursor']}"
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_list_chores_invalid_limit(self, client, parent_headers, sample_chore):
+        """Test a limit below 1 is rejected."""
+        for limit in (0, -1):
+            response = client.get(f'/api/chores?limit={limit}', headers=parent_headers)
+            assert response.status_code == 400
+            assert 'limit' in response.get_json()['message']
+
+    def test_raiseload_blocks_unplanned_lazy_loads(self, app, db_session, sample_chore):
+        """Test that chore queries raise on relationships without a loader in testing."""
+        from sqlalchemy.exc import InvalidRequestError
+        from utils.loading import with_raiseload
+
+        chore_id = sample_chore.id
+        db_session.expunge_all()
+        with app.test_request_context():
+            chore = Chore.query.options(*with_raiseload()).get(chore_id)
+            with pytest.raises(InvalidRequestError):
+                _ = chore.instances
+
+    def test_list_chores_invalid_cursor(self, client, parent_headers):
+        """Test that a malformed cursor is rejected."""
+        response = client.get('/api/chores?cursor=not-a-cursor', headers=parent_headers)
+        assert response.status_code == 400
+
 class TestCreateChore:
     """Tests for POST /api/chores endpoint."""
 
@@ -214,6 +256,34 @@ class TestCreateChore:
         assert data['data']['assignments'][0]['user_id'] == kid_user.id
         assert data['data']['assignments'][1]['user_id'] == kid_user_2.id
 
+    def test_write_responses_match_fresh_read(self, client, parent_headers, kid_user, kid_user_2):
+        """Test that assignments built from the insert match a reload."""
+        response = client.post('/api/chores', json={
+            'name': 'Clean room', 'points': 10, 'assigned_to': [kid_user.id, kid_user_2.id]
+        }, headers=parent_headers)
+        assert response.status_code == 201
+        created = response.get_json()['data']
+        assert [a['username'] for a in created['assignments']] == [kid_user.username, kid_user_2.username]
+
+        response = client.put(f"/api/chores/{created['id']}", json={'assigned_to': [kid_user_2.id]},
+                              headers=parent_headers)
+        updated = response.get_json()['data']
+        fetched = client.get(f"/api/chores/{created['id']}", headers=parent_headers).get_json()['data']
+        assert updated['assignments'] == fetched['assignments']
+        assert updated['assignments'][0]['id'] == created['assignments'][1]['id']
+
+    def test_create_chore_with_unknown_users(self, client, parent_headers, kid_user):
+        """Test that all unknown assignees are reported and nothing is created."""
+        chore_data = {
+            'name': 'Clean room',
+            'points': 10,
+            'assigned_to': [kid_user.id, 998, 999]
+        }
+        response = client.post('/api/chores', json=chore_data, headers=parent_headers)
+        assert response.status_code == 400
+        assert response.get_json()['message'] == 'Users not found: 998, 999'
+        assert Chore.query.filter_by(name='Clean room').count() == 0
+
     def test_create_chore_missing_name(self, client, parent_headers):
         """Test creating a chore without required name field."""
         chore_data = {'points': 5}
@@ -310,6 +380,14 @@ class TestGetChore:
         assert data['data']['name'] == 'Take out trash'
         assert data['data']['points'] == 5
 
+    def test_get_chore_dates_are_iso_strings(self, client, parent_headers, sample_chore):
+        """Test that date fields are rendered as ISO 8601 strings."""
+        response = client.get(f'/api/chores/{sample_chore.id}', headers=parent_headers)
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['created_at'] == sample_chore.created_at.isoformat()
+        assert data['updated_at'] == sample_chore.updated_at.isoformat()
+
     def test_get_chore_not_found(self, client, parent_headers):
         """Test getting a non-existent chore."""
         response = client.get('/api/chores/99999', headers=parent_headers)
@@ -351,6 +429,26 @@ class TestGetChore:
         data = response.get_json()
         assert data['data']['instance_count'] == 3
 
+    def test_list_chores_counts_per_chore(self, client, parent_headers, db_session,
+                                          sample_chore, parent_user, kid_user, kid_user_2):
+        """Test that list counts come from SQL and are reported per chore."""
+        other = Chore(name='Empty chore', points=1, created_by=parent_user.id, is_active=True)
+        db_session.add(other)
+        db_session.add_all([
+            ChoreAssignment(chore_id=sample_chore.id, user_id=kid_user.id),
+            ChoreAssignment(chore_id=sample_chore.id, user_id=kid_user_2.id),
+            ChoreInstance(chore_id=sample_chore.id, due_date=date(2025, 1, 1), status='assigned'),
+        ])
+        db_session.commit()
+
+        response = client.get('/api/chores', headers=parent_headers)
+        assert response.status_code == 200
+        by_id = {c['id']: c for c in response.get_json()['data']}
+        assert by_id[sample_chore.id]['assignment_count'] == 2
+        assert by_id[sample_chore.id]['instance_count'] == 1
+        assert by_id[other.id]['assignment_count'] == 0
+        assert by_id[other.id]['instance_count'] == 0
+
 
 class TestUpdateChore:
     """Tests for PUT /api/chores/{id} endpoint."""
@@ -460,6 +558,48 @@ class TestUpdateChore:
             days_diff = (second_due - first_due).days
             assert days_diff == 14, f"Expected 14 days between instances, got {days_diff}"
 
+    def test_update_chore_unchanged_assignments_skip_regeneration(self, client, parent_headers,
+                                                                  sample_chore, kid_user, monkeypatch):
+        """Test that resubmitting the same assignees writes nothing and keeps instances."""
+        assignment = ChoreAssignment(chore_id=sample_chore.id, user_id=kid_user.id)
+        db.session.add(assignment)
+        db.session.commit()
+        assignment_id = assignment.id
+
+        calls = []
+        monkeypatch.setattr('routes.chores.regenerate_instances_for_chore',
+                            lambda chore: calls.append(chore.id) or [])
+
+        response = client.put(f'/api/chores/{sample_chore.id}',
+                             json={'assigned_to': [kid_user.id]},
+                             headers=parent_headers)
+        assert response.status_code == 200
+        assert calls == []
+        assert [a.id for a in ChoreAssignment.query.filter_by(chore_id=sample_chore.id)] == [assignment_id]
+
+    def test_update_chore_assignments_applies_diff(self, client, parent_headers,
+                                                    sample_chore, kid_user, kid_user_2):
+        """Test that only added/removed assignees are written."""
+        kept = ChoreAssignment(chore_id=sample_chore.id, user_id=kid_user.id)
+        db.session.add(kept)
+        db.session.commit()
+        kept_id = kept.id
+
+        response = client.put(f'/api/chores/{sample_chore.id}',
+                             json={'assigned_to': [kid_user.id, kid_user_2.id]},
+                             headers=parent_headers)
+        assert response.status_code == 200
+        rows = {a.user_id: a.id for a in ChoreAssignment.query.filter_by(chore_id=sample_chore.id)}
+        assert set(rows) == {kid_user.id, kid_user_2.id}
+        assert rows[kid_user.id] == kept_id
+
+        response = client.put(f'/api/chores/{sample_chore.id}',
+                             json={'assigned_to': [kid_user_2.id]},
+                             headers=parent_headers)
+        assert response.status_code == 200
+        rows = [a.user_id for a in ChoreAssignment.query.filter_by(chore_id=sample_chore.id)]
+        assert rows == [kid_user_2.id]
+
     def test_update_chore_invalid_recurrence_pattern(self, client, parent_headers, sample_chore):
         """Test updating with invalid recurrence pattern."""
         update_data = {
@@ -543,7 +683,7 @@ class TestGetChoreInstances:
         assert response.status_code == 200
         data = response.get_json()
         assert data['data'] == []
-        assert data['total'] == 0
+        assert data['has_more'] is False
 
     def test_get_chore_instances_with_data(self, client, parent_headers, db_session, sample_chore, kid_user):
         """Test getting chore instances."""
@@ -563,7 +703,7 @@ class TestGetChoreInstances:
         assert response.status_code == 200
         data = response.get_json()
         assert len(data['data']) == 3
-        assert data['total'] == 3
+        assert data['has_more'] is False
 
     def test_get_chore_instances_filter_by_status(self, client, parent_headers, db_session, sample_chore, kid_user):
         """Test filtering instances by status."""
@@ -605,13 +745,45 @@ class TestGetChoreInstances:
         assert response.status_code == 200
         data = response.get_json()
         assert len(data['data']) == 2
-        assert data['total'] == 5
+        assert data['has_more'] is True
+
+    def test_get_chore_instances_cursor_pagination(self, client, parent_headers, sample_chore, db_session):
+        """Test walking instances with next_cursor, including undated ones."""
+        for i in range(4):
+            db_session.add(ChoreInstance(
+                chore_id=sample_chore.id,
+                due_date=date(2025, 1, i + 1) if i < 3 else None,
+                status='assigned'
+            ))
+        db_session.commit()
+
+        due_dates = []
+        url = f'/api/chores/{sample_chore.id}/instances?limit=3'
+        while True:
+            data = client.get(url, headers=parent_headers).get_json()
+            due_dates.extend(instance['due_date'] for instance in data['data'])
+            if not data['next_cursor']:
+                break
+            url = f"/api/chores/{sample_chore.id}/instances?limit=3&cursor={data['next_cursor']}"
+
+        assert due_dates == ['2025-01-03', '2025-01-02', '2025-01-01', None]
 
     def test_get_chore_instances_nonexistent_chore(self, client, parent_headers):
         """Test getting instances for non-existent chore."""
         response = client.get('/api/chores/99999/instances', headers=parent_headers)
         assert response.status_code == 404
 
+    def test_get_chore_instances_invalid_limit(self, client, parent_headers, db_session, sample_chore):
+        """Test a limit below 1 is rejected rather than streamed."""
+        db_session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date(2025, 1, 1), status='assigned'))
+        db_session.commit()
+
+        for limit in (0, -1):
+            response = client.get(f'/api/chores/{sample_chore.id}/instances?limit={limit}',
+                                 headers=parent_headers)
+            assert response.status_code == 400
+            assert 'limit' in response.get_json()['message']
+
     def test_get_chore_instances_invalid_status(self, client, parent_headers, sample_chore):
         """Test filtering with invalid status value."""
         response = client.get(f'/api/chores/{sample_chore.id}/instances?status=invalid',
@@ -671,6 +843,34 @@ class TestChoreNewFields:
                              headers=parent_headers)
         assert response.status_code == 400
 
+    def test_integer_field_validation_messages(self, client, parent_headers, sample_chore):
+        """Test the shared integer field rules on create and update."""
+        cases = [
+            ({'early_claim_days': 'abc'}, 'early_claim_days must be a valid integer'),
+            ({'grace_period_days': -2}, 'grace_period_days must be non-negative'),
+            ({'expires_after_days': 0}, 'expires_after_days must be at least 1'),
+        ]
+        for fields, message in cases:
+            response = client.post('/api/chores', json={'name': 'X', 'points': 1, **fields},
+                                   headers=parent_headers)
+            assert response.status_code == 400
+            assert response.get_json()['message'] == message
+
+            response = client.put(f'/api/chores/{sample_chore.id}', json=fields,
+                                  headers=parent_headers)
+            assert response.status_code == 400
+            assert response.get_json()['message'] == message
+
+    def test_update_chore_blank_integer_fields(self, client, parent_headers, sample_chore):
+        """Test that blank form values reset integer fields to their empty defaults."""
+        response = client.put(f'/api/chores/{sample_chore.id}',
+                              json={'late_points': '', 'grace_period_days': '', 'expires_after_days': '3'},
+                              headers=parent_headers)
+        assert response.status_code == 200
+        assert sample_chore.late_points is None
+        assert sample_chore.grace_period_days == 0
+        assert sample_chore.expires_after_days == 3
+
 
 class TestChoreInstanceGeneration:
     """Tests for automatic instance generation on chore creation."""
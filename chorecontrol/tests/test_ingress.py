@@ -153,3 +153,22 @@ class TestUrlGeneration:
         ):
             url = url_for('health')
             assert url == '/health'
+
+
+class TestDebugBlueprint:
+    """Test that the debug endpoints are only registered when DEBUG is true."""
+
+    def test_not_registered_when_debug_false(self, monkeypatch):
+        """run.sh exports DEBUG=false outside debug mode."""
+        from app import create_app
+        monkeypatch.setenv('DEBUG', 'false')
+        app = create_app('testing')
+        assert 'debug' not in app.blueprints
+        assert app.test_client().get('/debug/headers').status_code == 404
+
+    def test_registered_when_debug_true(self, monkeypatch):
+        """DEBUG=true exposes the header dump."""
+        from app import create_app
+        monkeypatch.setenv('DEBUG', 'true')
+        app = create_app('testing')
+        assert 'debug' in app.blueprints
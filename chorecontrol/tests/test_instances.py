@@ -218,6 +218,34 @@ def test_list_instances_invalid_date_format(client, kid_headers):
     assert 'Invalid start_date format' in data['message']
 
 
+def test_list_instances_invalid_integer_param(client, kid_headers):
+    """Test that a non-integer filter is reported instead of silently ignored."""
+    response = client.get('/api/instances?chore_id=abc', headers=kid_headers)
+
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Invalid chore_id. Must be an integer'
+
+
+def test_list_instances_rejects_zero_limit(client, kid_headers, db_session, sample_chore):
+    """Test limit=0 is a 400 up front, not an error partway through the streamed page."""
+    db_session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(), status='assigned'))
+    db_session.commit()
+
+    response = client.get('/api/instances?limit=0', headers=kid_headers)
+
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Invalid limit. Must be at least 1'
+
+
+def test_list_instances_rejects_compact_iso_date(client, kid_headers):
+    """Test that only YYYY-MM-DD is accepted, not other ISO 8601 date forms."""
+    response = client.get('/api/instances?end_date=20240115', headers=kid_headers)
+
+    assert response.status_code == 400
+    data = response.get_json()
+    assert 'Invalid end_date format' in data['message']
+
+
 def test_list_instances_pagination(client, kid_headers, db_session, sample_chore, kid_user):
     """Test pagination of instance listing."""
     # Create 10 instances
@@ -246,6 +274,115 @@ def test_list_instances_pagination(client, kid_headers, db_session, sample_chore
     assert data['offset'] == 5
 
 
+def test_list_instances_window_total_and_cursor(client, kid_headers, db_session, sample_chore):
+    """Test the window-count total and keyset cursor paging."""
+    for i in range(5):
+        db_session.add(ChoreInstance(
+            chore_id=sample_chore.id,
+            due_date=date.today() + timedelta(days=i % 3),
+            status='assigned'
+        ))
+    db_session.add(ChoreInstance(chore_id=sample_chore.id, due_date=None, status='assigned'))
+    db_session.commit()
+
+    response = client.get('/api/instances?limit=4', headers=kid_headers)
+    data = response.get_json()
+    assert data['total'] == 6
+    assert data['has_more'] is True
+    first_ids = [i['id'] for i in data['data']]
+
+    response = client.get(f"/api/instances?limit=4&cursor={data['next_cursor']}", headers=kid_headers)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert 'total' not in data
+    assert data['has_more'] is False
+    ids = first_ids + [i['id'] for i in data['data']]
+    assert len(ids) == len(set(ids)) == 6
+
+    response = client.get('/api/instances?limit=4&offset=10', headers=kid_headers)
+    data = response.get_json()
+    assert data['data'] == []
+    assert data['total'] == 6
+
+    response = client.get('/api/instances?cursor=bogus', headers=kid_headers)
+    assert response.status_code == 400
+
+
+def test_list_instances_rows_match_detail_serialization(client, kid_headers, db_session, sample_chore,
+                                                        kid_user, parent_user):
+    """Test the column-projected list rows match the ORM detail serializer."""
+    from models import ChoreInstanceClaim
+
+    sample_chore.assignment_type = 'shared'
+    sample_chore.allow_work_together = True
+    instance = ChoreInstance(
+        chore_id=sample_chore.id,
+        due_date=None,  # anytime, so it is also listed as due today
+        status='claimed',
+        claimed_by=kid_user.id,
+        claimed_at=datetime(2025, 1, 2, 3, 4, 5),
+        approved_by=parent_user.id
+    )
+    db_session.add(instance)
+    db_session.flush()
+    db_session.add(ChoreInstanceClaim(chore_instance_id=instance.id, user_id=kid_user.id,
+                                      claimed_at=datetime(2025, 1, 2, 3, 4, 5), status='claimed'))
+    db_session.commit()
+
+    listed = client.get('/api/instances', headers=kid_headers).get_json()['data']
+    detail = client.get(f'/api/instances/{instance.id}', headers=kid_headers).get_json()['data']
+    due_today = client.get('/api/instances/due-today', headers=kid_headers).get_json()['instances']
+
+    assert listed == [detail]
+    assert due_today == [detail]
+    assert detail['claims_count'] == 1
+    assert detail['claimer']['username'] == kid_user.username
+
+
+def test_list_instances_query_count_is_constant(client, kid_headers, db_session, sample_chore,
+                                                kid_user, parent_user):
+    """Test that listing instances does not issue per-row relationship queries."""
+    from sqlalchemy import event
+
+    # Work-together instances also serialize their claims collection
+    sample_chore.assignment_type = 'shared'
+    sample_chore.allow_work_together = True
+    db_session.commit()
+    chore_id, kid_id, parent_id = sample_chore.id, kid_user.id, parent_user.id
+
+    def add_instances(count):
+        for i in range(count):
+            db_session.add(ChoreInstance(
+                chore_id=chore_id,
+                due_date=date.today() + timedelta(days=i),
+                status='approved',
+                claimed_by=kid_id,
+                approved_by=parent_id
+            ))
+        db_session.commit()
+
+    def count_queries():
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db_session.expunge_all()
+        event.listen(db.engine, 'before_cursor_execute', before_execute)
+        try:
+            response = client.get('/api/instances', headers=kid_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_execute)
+        assert response.status_code == 200
+        return len(statements)
+
+    add_instances(2)
+    count_queries()  # warm up per-process caches (auth, settings)
+    few = count_queries()
+    add_instances(6)
+    assert count_queries() == few
+
+
 def test_list_instances_requires_auth(client):
     """Test that listing instances requires authentication."""
     response = client.get('/api/instances')
@@ -280,6 +417,26 @@ def test_get_instance_not_found(client, kid_headers):
     assert 'not found' in data['message'].lower()
 
 
+def test_get_instance_conditional_get(client, db_session, kid_headers, assigned_instance):
+    """Test that an unchanged instance is answered with 304 and edits to its chore are not."""
+    url = f'/api/instances/{assigned_instance.id}'
+    response = client.get(url, headers=kid_headers)
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+
+    response = client.get(url, headers={**kid_headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    assigned_instance.chore.name = 'Take out recycling'
+    db_session.commit()
+
+    response = client.get(url, headers={**kid_headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['data']['chore']['name'] == 'Take out recycling'
+    assert response.headers['ETag'] != etag
+
+
 def test_get_instance_requires_auth(client, assigned_instance):
     """Test that getting instance details requires authentication."""
     response = client.get(f'/api/instances/{assigned_instance.id}')
@@ -352,6 +509,7 @@ def test_claim_instance_not_assigned(client, kid_user_2, assigned_instance):
 
     assert response.status_code == 403
     data = response.get_json()
+    assert data['error'] == 'Forbidden Error'
     assert 'not assigned' in data['message'].lower()
 
 
@@ -364,6 +522,73 @@ def test_claim_instance_not_found(client, kid_headers, kid_user):
     )
 
     assert response.status_code == 404
+    assert response.get_json()['error'] == 'NotFound Error'
+
+
+def test_claim_instance_malformed_body(client, kid_headers, assigned_instance):
+    """Test that a body that is not a JSON object is rejected with 400."""
+    for body in ('{"user_id": ', '[1, 2]'):
+        response = client.post(
+            f'/api/instances/{assigned_instance.id}/claim',
+            headers={**kid_headers, 'Content-Type': 'application/json'},
+            data=body
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'BadRequest Error'
+
+
+def test_claim_instance_without_body(client, kid_headers, kid_user, assigned_instance):
+    """Test that a request with no body or Content-Type claims for the current user."""
+    response = client.post(f'/api/instances/{assigned_instance.id}/claim', headers=kid_headers)
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['claimed_by'] == kid_user.id
+
+
+def test_claim_instance_unexpected_error(client, kid_headers, kid_user, assigned_instance, monkeypatch):
+    """Test that unexpected failures are rolled back and reported as a 500."""
+    from services.instance_service import InstanceService
+
+    def explode(*args, **kwargs):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(InstanceService, 'claim', explode)
+
+    response = client.post(
+        f'/api/instances/{assigned_instance.id}/claim',
+        headers=kid_headers,
+        json={'user_id': kid_user.id}
+    )
+
+    assert response.status_code == 500
+    data = response.get_json()
+    assert data['error'] == 'Internal Server Error'
+    assert data['message'] == 'Failed to claim chore'
+    assert data['details'] == 'boom'
+
+
+def test_claim_instance_service_error_discards_staged_changes(client, kid_headers, kid_user,
+                                                            assigned_instance, monkeypatch):
+    """Test that changes staged before a service error are rolled back."""
+    from services.instance_service import InstanceService, BadRequestError
+
+    def refuse(instance_id, user_id):
+        instance = db.session.get(ChoreInstance, instance_id)
+        instance.status = 'claimed'
+        raise BadRequestError('Refused')
+
+    monkeypatch.setattr(InstanceService, 'claim', refuse)
+
+    response = client.post(
+        f'/api/instances/{assigned_instance.id}/claim',
+        headers=kid_headers,
+        json={'user_id': kid_user.id}
+    )
+
+    assert response.status_code == 400
+    assert not db.session.dirty
+    assert db.session.get(ChoreInstance, assigned_instance.id).status == 'assigned'
 
 
 def test_claim_instance_requires_auth(client, assigned_instance):
@@ -1131,6 +1356,7 @@ def test_reassign_instance_success(client, db_session, parent_user):
     assert response.status_code == 200
     data = response.get_json()
     assert data['data']['assigned_to'] == kid2.id
+    assert data['message'] == 'Chore reassigned to Kid 2'
 
     # Verify ChoreAssignment created
     assignment2 = ChoreAssignment.query.filter_by(
@@ -1305,6 +1531,28 @@ def test_get_instances_due_today_includes_null_due_date(client, db_session, kid_
     assert data['instances'][0]['due_date'] is None
 
 
+def test_get_instances_due_today_conditional_get(client, db_session, kid_headers, sample_chore, kid_user):
+    """Test that due-today answers 304 until one of its instances changes."""
+    instance = ChoreInstance(chore_id=sample_chore.id, due_date=None, assigned_to=kid_user.id,
+                             status='assigned')
+    db_session.add(instance)
+    db_session.commit()
+
+    response = client.get('/api/instances/due-today', headers=kid_headers)
+    etag = response.headers['ETag']
+
+    response = client.get('/api/instances/due-today', headers={**kid_headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = client.post(f'/api/instances/{instance.id}/claim', headers=kid_headers,
+                           json={'user_id': kid_user.id})
+    assert response.status_code == 200
+
+    response = client.get('/api/instances/due-today', headers={**kid_headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['instances'][0]['status'] == 'claimed'
+
+
 def test_get_instances_due_today_filter_by_user(client, db_session, kid_headers, parent_user, kid_user):
     """Test filtering instances by user_id."""
     from models import Chore, ChoreInstance, ChoreAssignment, User
@@ -0,0 +1,105 @@
+"""Tests for the orjson-backed JSON provider."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import jsonify
+from markupsafe import Markup
+
+from models import ChoreInstance
+from utils.json_provider import json_response, stream_json_page
+
+
+class TestOrjsonProvider:
+    """Tests for app.json and jsonify output."""
+
+    def test_dates_match_isoformat(self, app):
+        """Test naive dates and datetimes render exactly like .isoformat()."""
+        values = {
+            'date': date(2025, 1, 2),
+            'datetime': datetime(2025, 1, 2, 3, 4, 5),
+            'micro': datetime(2025, 1, 2, 3, 4, 5, 678901),
+        }
+        with app.test_request_context():
+            body = json.loads(jsonify(values).get_data())
+        assert body == {key: value.isoformat() for key, value in values.items()}
+
+    def test_keys_sorted_and_fallback_types(self, app):
+        """Test key order matches the stdlib provider and extra types encode."""
+        with app.test_request_context():
+            text = app.json.dumps({'b': Decimal('1.50'), 'a': Markup('<b>x</b>'), 1: None})
+        assert text == '{"1":null,"a":"<b>x</b>","b":"1.50"}'
+
+    def test_loads_with_kwargs_uses_stdlib(self, app):
+        """Test object_hook (used by the session serializer) still works."""
+        result = app.json.loads('{"a": 1}', object_hook=lambda d: ('hooked', d))
+        assert result == ('hooked', {'a': 1})
+
+    def test_json_response_keeps_insertion_order(self, app):
+        """Test the raw response helper skips key sorting."""
+        with app.test_request_context():
+            response = json_response({'b': 1, 'a': date(2025, 1, 2)}, status=201)
+        assert response.status_code == 201
+        assert response.mimetype == 'application/json'
+        assert response.get_data() == b'{"b":1,"a":"2025-01-02"}'
+
+    def test_instance_api_dates_are_iso_strings(self, client, kid_headers, db_session, sample_chore):
+        """Test raw date values from serialize_instance reach clients as ISO strings."""
+        instance = ChoreInstance(
+            chore_id=sample_chore.id,
+            due_date=date(2025, 1, 2),
+            status='assigned'
+        )
+        db_session.add(instance)
+        db_session.commit()
+
+        response = client.get(f'/api/instances/{instance.id}', headers=kid_headers)
+        data = response.get_json()['data']
+        assert data['due_date'] == '2025-01-02'
+        assert data['created_at'] == instance.created_at.isoformat()
+
+    def test_stdlib_fallback_matches_orjson(self, app, monkeypatch):
+        """Test output is unchanged on platforms without an orjson wheel."""
+        import utils.json_provider as json_provider
+        values = {'b': Decimal('1.50'), 'a': datetime(2025, 1, 2, 3, 4, 5, 678901),
+                  'c': [date(2025, 1, 2), 'é', None]}
+        with app.test_request_context():
+            expected = (app.json.dumps(values), json_response(values).get_data())
+            monkeypatch.setattr(json_provider, 'orjson', None)
+            assert (app.json.dumps(values), json_response(values).get_data()) == expected
+            assert app.json.loads(expected[0]) == json.loads(expected[0])
+
+    def test_stream_json_page_fetches_rows_before_responding(self, app):
+        """Test a failing row source raises in the route, not mid-response."""
+        def rows():
+            yield 1
+            raise RuntimeError('database went away')
+
+        with app.test_request_context(), pytest.raises(RuntimeError):
+            stream_json_page(rows(), lambda row: row, 10, lambda *args: {})
+
+    def test_stream_json_page_reads_one_extra_row(self, app):
+        """Test only limit + 1 rows are read and the extra one sets has_more."""
+        seen = []
+
+        def rows():
+            for i in range(10):
+                seen.append(i)
+                yield i
+
+        with app.test_request_context():
+            response = stream_json_page(rows(), lambda row: row, 2,
+                                        lambda count, has_more, last: {'more': has_more})
+            body = json.loads(response.get_data())
+        assert body == {'data': [0, 1], 'more': True}
+        assert seen == [0, 1, 2]
+
+    def test_stream_json_page_zero_limit_has_no_more(self, app):
+        """Test a zero limit sends an empty page without a last row to page from."""
+        with app.test_request_context():
+            response = stream_json_page(iter([0, 1]), lambda row: row, 0,
+                                        lambda count, has_more, last: {'more': has_more, 'last': last})
+            body = json.loads(response.get_data())
+        assert body == {'data': [], 'more': False, 'last': None}
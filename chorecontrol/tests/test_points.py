@@ -470,3 +470,31 @@ class TestPointsVerification:
 
         assert calculated == expected
         assert kid.points == expected
+
+
+class TestSpendPoints:
+    """Tests for User.spend_points."""
+
+    def test_spend_points_deducts_and_records_history(self, db_session, kid_user):
+        """Test spending within the balance deducts points and adds history."""
+        assert kid_user.spend_points(20, 'Spend test') is True
+        db_session.commit()
+
+        db_session.refresh(kid_user)
+        assert kid_user.points == 30
+        history = PointsHistory.query.filter_by(user_id=kid_user.id).one()
+        assert history.points_delta == -20
+
+    def test_spend_points_checks_balance_in_database(self, db_session, kid_user):
+        """Test the balance check uses the stored balance, not a stale in-memory one."""
+        # Another request spends points after this one loaded the user
+        db_session.execute(db.update(User).where(User.id == kid_user.id).values(points=10),
+                           execution_options={'synchronize_session': False})
+
+        assert kid_user.points == 50
+        assert kid_user.spend_points(20, 'Spend test') is False
+        db_session.commit()
+
+        db_session.refresh(kid_user)
+        assert kid_user.points == 10
+        assert PointsHistory.query.filter_by(user_id=kid_user.id).count() == 0
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta
-from models import db, Reward, RewardClaim, User
+from models import db, Reward, RewardClaim, RewardUserClaimCount, User
 
 
 class TestListRewards:
@@ -73,6 +73,77 @@ class TestListRewards:
         data = response.get_json()
         assert data['data'][0]['total_claims'] == 2
 
+    def test_list_rewards_uses_model_serialization(self, client, parent_headers, sample_reward):
+        """Test list entries are Reward.to_dict() plus the claim count."""
+        response = client.get('/api/rewards', headers=parent_headers)
+        assert response.status_code == 200
+
+        reward_data = response.get_json()['data'][0]
+        assert reward_data == sample_reward.to_dict() | {'total_claims': 0}
+
+    def test_list_rewards_includes_can_claim_for_kids(self, client, kid_headers, sample_reward, kid_user, db_session):
+        """Test that kids see whether each reward can be claimed."""
+        claim = RewardClaim(
+            reward_id=sample_reward.id,
+            user_id=kid_user.id,
+            points_spent=20,
+            status='approved',
+            claimed_at=datetime.utcnow() - timedelta(days=2)
+        )
+        db_session.add(claim)
+        db_session.commit()
+
+        response = client.get('/api/rewards', headers=kid_headers)
+        assert response.status_code == 200
+
+        reward_data = response.get_json()['data'][0]
+        assert reward_data['can_claim'] is False
+        assert 'cooldown' in reward_data['can_claim_reason']
+
+    def test_list_rewards_conditional_get(self, client, kid_headers, sample_reward, kid_user, db_session):
+        """Test an unchanged list answers If-None-Match with 304."""
+        response = client.get('/api/rewards', headers=kid_headers)
+        etag = response.headers['ETag']
+
+        response = client.get('/api/rewards', headers={**kid_headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # Other filters and other users get their own validators
+        response = client.get('/api/rewards?active=true', headers={**kid_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+
+        # Points and claims change what a kid can claim
+        kid_user.points = 5
+        db_session.commit()
+        response = client.get('/api/rewards', headers={**kid_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['data'][0]['can_claim'] is False
+        etag = response.headers['ETag']
+
+        db_session.add(RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                                   points_spent=20, status='approved'))
+        db_session.commit()
+        response = client.get('/api/rewards', headers={**kid_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['data'][0]['total_claims'] == 1
+
+    def test_list_rewards_etag_tracks_cooldown_countdown(self, client, kid_headers, sample_reward,
+                                                         kid_user, db_session):
+        """Test the validator changes when a cooldown ticks down a day."""
+        claim = RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id, points_spent=20,
+                            status='approved', claimed_at=datetime.utcnow() - timedelta(days=2, hours=1))
+        db_session.add(claim)
+        db_session.commit()
+        etag = client.get('/api/rewards', headers=kid_headers).headers['ETag']
+
+        # Same reward state, but a day further into the cooldown
+        claim.claimed_at -= timedelta(days=1)
+        db_session.commit()
+        response = client.get('/api/rewards', headers={**kid_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert '4 more days' in response.get_json()['data'][0]['can_claim_reason']
+
     def test_list_rewards_requires_auth(self, client):
         """Test that authentication is required."""
         response = client.get('/api/rewards')
@@ -136,6 +207,23 @@ class TestCreateReward:
         assert response.status_code == 400
         assert 'must be greater than 0' in response.get_json()['message']
 
+    def test_create_reward_does_not_reload_after_commit(self, client, parent_headers):
+        """Test the response is built without re-selecting the new reward."""
+        from sqlalchemy import event
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.post('/api/rewards', json={'name': 'Fresh', 'points_cost': 5},
+                                   headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 201
+        assert response.get_json()['data']['name'] == 'Fresh'
+        assert not any(s.startswith('SELECT') and 'FROM rewards' in s for s in statements)
+
     def test_create_reward_requires_parent(self, client, kid_headers):
         """Test that only parents can create rewards."""
         reward_data = {
@@ -179,6 +267,8 @@ class TestGetReward:
 
         data = response.get_json()
         assert data['data']['is_on_cooldown_for_user'] is True
+        assert data['data']['total_claims'] == 1
+        assert data['data']['user_claims'] == 1
         assert data['data']['cooldown_days_remaining'] == 5
 
     def test_get_reward_not_found(self, client, parent_headers):
@@ -187,6 +277,26 @@ class TestGetReward:
         assert response.status_code == 404
 
 
+class TestRewardToDict:
+    """Tests for Reward.to_dict caching."""
+
+    def test_to_dict_returns_independent_copies(self, sample_reward):
+        """Test callers can extend the result without affecting later calls."""
+        first = sample_reward.to_dict()
+        first['extra'] = 'value'
+
+        assert 'extra' not in sample_reward.to_dict()
+
+    def test_to_dict_reflects_updates(self, sample_reward, db_session):
+        """Test the cached representation is refreshed after an update."""
+        assert sample_reward.to_dict()['name'] == 'Ice cream trip'
+
+        sample_reward.name = 'Pizza night'
+        db_session.commit()
+
+        assert sample_reward.to_dict()['name'] == 'Pizza night'
+
+
 class TestUpdateReward:
     """Tests for PUT /api/rewards/{id} endpoint."""
 
@@ -217,6 +327,22 @@ class TestUpdateReward:
         assert data['data']['name'] == 'New name only'
         assert data['data']['points_cost'] == 20  # Unchanged
 
+    def test_update_reward_bumps_updated_at(self, client, parent_headers, sample_reward, db_session):
+        """Test that the database stamps updated_at when a reward changes."""
+        db_session.execute(
+            db.update(Reward).where(Reward.id == sample_reward.id)
+            .values(updated_at=datetime(2020, 1, 1)),
+            execution_options={'synchronize_session': False}
+        )
+        db_session.commit()
+
+        response = client.put(f'/api/rewards/{sample_reward.id}', json={'name': 'Renamed'}, headers=parent_headers)
+        assert response.status_code == 200
+
+        db_session.refresh(sample_reward)
+        assert sample_reward.updated_at > datetime(2020, 1, 1)
+        assert response.get_json()['data']['updated_at'] == sample_reward.updated_at.isoformat()
+
     def test_update_reward_requires_parent(self, client, kid_headers, sample_reward):
         """Test that only parents can update rewards."""
         response = client.put(f'/api/rewards/{sample_reward.id}', json={'name': 'Hacked'}, headers=kid_headers)
@@ -357,6 +483,20 @@ class TestClaimReward:
         assert response.status_code == 403
         assert 'Only kids' in response.get_json()['message']
 
+    def test_claim_reward_timestamps_set_by_database(self, sample_reward, kid_user, db_session):
+        """Test claimed_at is filled in by the database on insert."""
+        before = datetime.utcnow() - timedelta(seconds=1)
+        claim = RewardClaim(
+            reward_id=sample_reward.id,
+            user_id=kid_user.id,
+            points_spent=20
+        )
+        db_session.add(claim)
+        db_session.flush()
+
+        assert 'claimed_at' in claim.__dict__  # Fetched with the INSERT
+        assert before <= claim.claimed_at <= datetime.utcnow() + timedelta(seconds=1)
+
     def test_claim_reward_creates_points_history(self, client, kid_headers, sample_reward, kid_user, db_session):
         """Test that claiming reward creates points history entry."""
         response = client.post(f'/api/rewards/{sample_reward.id}/claim', headers=kid_headers)
@@ -370,6 +510,277 @@ class TestClaimReward:
         assert 'Ice cream trip' in history.reason
         assert history.reward_claim_id is not None
 
+    def test_claim_reward_skips_in_transaction_balance_check(self, sample_reward, kid_user, db_session):
+        """Test claiming writes everything in the commit flush without re-summing history."""
+        from sqlalchemy import event
+        from models import PointsHistory
+        from services.reward_service import RewardService
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', listener)
+        try:
+            claim = RewardService.claim_reward(sample_reward.id, kid_user.id)
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+
+        assert not any('sum(points_history.points_delta)' in s for s in statements)
+        history = PointsHistory.query.filter_by(reward_claim_id=claim.id).one()
+        assert history.points_delta == -20
+        assert kid_user.points == 30
+
+
+class TestClaimListings:
+    """Tests for GET /api/rewards/claims and /api/rewards/claims/history."""
+
+    def _add_claims(self, db_session, reward, kid, parent):
+        db_session.add_all([
+            RewardClaim(reward_id=reward.id, user_id=kid.id, points_spent=20,
+                        status='approved', approved_by=parent.id,
+                        approved_at=datetime.utcnow()),
+            RewardClaim(reward_id=reward.id, user_id=kid.id, points_spent=20,
+                        status='pending'),
+        ])
+        db_session.commit()
+
+    def test_list_claims_includes_related_names(self, client, parent_headers, parent_user,
+                                                kid_user, sample_reward, db_session):
+        """Test that claim listings carry reward, user and approver names."""
+        self._add_claims(db_session, sample_reward, kid_user, parent_user)
+
+        response = client.get('/api/rewards/claims', headers=parent_headers)
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert data['total'] == 2
+        by_status = {c['status']: c for c in data['data']}
+        assert by_status['approved']['reward_name'] == sample_reward.name
+        assert by_status['approved']['username'] == kid_user.username
+        assert by_status['approved']['approver_name'] == parent_user.username
+        assert by_status['pending']['approver_name'] is None
+
+        response = client.get('/api/rewards/claims?limit=1', headers=parent_headers)
+        data = response.get_json()
+        assert data['total'] == 2
+        assert len(data['data']) == 1
+
+        response = client.get('/api/rewards/claims?offset=5', headers=parent_headers)
+        data = response.get_json()
+        assert data['total'] == 2
+        assert data['data'] == []
+
+    def test_claim_history_includes_related_names(self, client, parent_headers, parent_user,
+                                                  kid_user, sample_reward, db_session):
+        """Test that claim history lists resolved claims with related names."""
+        self._add_claims(db_session, sample_reward, kid_user, parent_user)
+
+        response = client.get('/api/rewards/claims/history', headers=parent_headers)
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert data['pagination']['total'] == 1
+        claim = data['data'][0]
+        assert claim['reward_name'] == sample_reward.name
+        assert claim['username'] == kid_user.username
+        assert claim['approver_name'] == parent_user.username
+
+    def test_claim_history_pagination(self, client, parent_headers, kid_user, sample_reward, db_session):
+        """Test claim history pages carry the filtered total, including past the end."""
+        db_session.add_all([
+            RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id, points_spent=20,
+                        status='approved', claimed_at=datetime.utcnow() - timedelta(hours=i))
+            for i in range(3)
+        ])
+        db_session.commit()
+
+        response = client.get('/api/rewards/claims/history?per_page=2&page=2', headers=parent_headers)
+        data = response.get_json()
+        assert len(data['data']) == 1
+        assert data['pagination'] == {
+            'page': 2, 'per_page': 2, 'total': 3, 'pages': 2,
+            'has_prev': True, 'has_next': False, 'prev_page': 1, 'next_page': None
+        }
+        assert data['message'] == 'Found 1 claims'
+
+        response = client.get('/api/rewards/claims/history?per_page=2&page=5', headers=parent_headers)
+        data = response.get_json()
+        assert data['data'] == []
+        assert data['pagination']['total'] == 3
+
+
+class TestClaimTransitions:
+    """Tests for RewardService approve/reject/unclaim."""
+
+    def test_reject_loads_reward_with_claim(self, sample_reward, kid_user, parent_user, db_session):
+        """Test rejecting reads the reward and claimer from the claim query."""
+        from sqlalchemy import event
+        from services.reward_service import RewardService
+
+        claim = RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                            points_spent=20, status='pending')
+        db_session.add(claim)
+        db_session.commit()
+        claim_id, parent_id = claim.id, parent_user.id
+        db_session.expunge_all()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            rejected = RewardService.reject_claim(claim_id, parent_id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert rejected.status == 'rejected'
+        assert rejected.user.points == 70
+        assert not any(s.startswith('SELECT') and 'FROM rewards' in s for s in statements)
+        assert sum(s.startswith('SELECT') and 'FROM users' in s for s in statements) == 1
+
+    def test_approve_webhook_uses_loaded_claim(self, app, sample_reward, kid_user, parent_user, db_session):
+        """Test the approved webhook is built from the claim query without reloading."""
+        from unittest.mock import patch
+        from sqlalchemy import event
+        from services.reward_service import RewardService
+
+        claim = RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                            points_spent=20, status='pending')
+        db_session.add(claim)
+        db_session.commit()
+        claim_id, parent_id = claim.id, parent_user.id
+        names = (sample_reward.name, kid_user.username, parent_user.username)
+        db_session.expunge_all()
+
+        app.config['HA_WEBHOOK_URL'] = 'http://test.local/webhook'
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            with patch('utils.webhooks._deliver', return_value=True) as mock_deliver:
+                RewardService.approve_claim(claim_id, parent_id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        event_name, payload = mock_deliver.call_args.args[1:]
+        assert event_name == 'reward_approved'
+        data = payload['data']
+        assert (data['reward_name'], data['user_name'], data['approved_by_name']) == names
+        # One read for the claim with its reward and claimer, one for the approver
+        assert sum(s.startswith('SELECT') for s in statements) == 2
+
+
+class TestApprovedClaimCounters:
+    """Tests for the denormalized approved claim counters."""
+
+    def test_approved_insert_increments_counters(self, sample_reward, kid_user, db_session):
+        """Test inserting an approved claim bumps both counters."""
+        claim = RewardClaim(
+            reward_id=sample_reward.id,
+            user_id=kid_user.id,
+            points_spent=20,
+            status='approved'
+        )
+        db_session.add(claim)
+        db_session.commit()
+
+        assert sample_reward.approved_claims_count == 1
+        assert RewardUserClaimCount.get_count(sample_reward.id, kid_user.id) == 1
+
+    def test_pending_claim_counted_on_approval(self, sample_reward, kid_user, db_session):
+        """Test pending claims are only counted once approved."""
+        claim = RewardClaim(
+            reward_id=sample_reward.id,
+            user_id=kid_user.id,
+            points_spent=20,
+            status='pending'
+        )
+        db_session.add(claim)
+        db_session.commit()
+        assert sample_reward.approved_claims_count == 0
+        assert RewardUserClaimCount.get_count(sample_reward.id, kid_user.id) == 0
+
+        claim.status = 'approved'
+        db_session.commit()
+        assert sample_reward.approved_claims_count == 1
+        assert RewardUserClaimCount.get_count(sample_reward.id, kid_user.id) == 1
+
+    def test_unapproving_or_deleting_decrements_counters(self, sample_reward, kid_user, db_session):
+        """Test leaving the approved state removes the claim from the counters."""
+        claims = [
+            RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                        points_spent=20, status='approved')
+            for _ in range(2)
+        ]
+        db_session.add_all(claims)
+        db_session.commit()
+        assert sample_reward.approved_claims_count == 2
+
+        claims[0].status = 'rejected'
+        db_session.commit()
+        assert sample_reward.approved_claims_count == 1
+
+        db_session.delete(claims[1])
+        db_session.commit()
+        assert sample_reward.approved_claims_count == 0
+        assert RewardUserClaimCount.get_count(sample_reward.id, kid_user.id) == 0
+
+    def test_first_claim_skips_cooldown_lookup(self, sample_reward, kid_user, monkeypatch):
+        """Test can_claim does not look up cooldown for a user with no approved claims."""
+        def fail(*args, **kwargs):
+            raise AssertionError('cooldown lookup should be skipped')
+
+        monkeypatch.setattr(Reward, 'cooldown_days_remaining', fail)
+        assert sample_reward.can_claim(kid_user.id) == (True, None)
+
+    def test_listable_for_includes_user_stats(self, sample_reward, kid_user, kid_user_2, db_session):
+        """Test listable_for returns each reward with the user's claim stats."""
+        other_reward = Reward(name='Movie night', points_cost=15, is_active=True)
+        last_claimed_at = datetime.utcnow() - timedelta(days=1)
+        db_session.add_all([
+            other_reward,
+            RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id, points_spent=20,
+                        status='approved', claimed_at=last_claimed_at),
+            RewardClaim(reward_id=sample_reward.id, user_id=kid_user_2.id, points_spent=20,
+                        status='approved'),
+        ])
+        db_session.commit()
+
+        rows = Reward.listable_for(kid_user.id).order_by(Reward.points_cost).all()
+        assert rows == [(other_reward, 0, None), (sample_reward, 1, last_claimed_at)]
+        assert sample_reward.approved_claims_count == 2
+
+        # The prefetched stats give the same answer as the per-reward check
+        _reward, user_claims, last = rows[1]
+        assert sample_reward.check_claim_using(kid_user, user_claims, last) == \
+            sample_reward.check_claim(kid_user.id)
+
+    def test_cooldown_days_remaining_rounds_up(self, sample_reward, kid_user, db_session):
+        """Test a partial day left on a cooldown counts as a whole day."""
+        # Cooldown is 7 days; just under 3 days remain
+        claim = RewardClaim(
+            reward_id=sample_reward.id,
+            user_id=kid_user.id,
+            points_spent=20,
+            status='approved',
+            claimed_at=datetime.utcnow() - timedelta(days=4, seconds=5)
+        )
+        db_session.add(claim)
+        db_session.commit()
+
+        assert sample_reward.is_on_cooldown(kid_user.id) == \
+            (True, "Reward is on cooldown for 3 more days")
+        assert sample_reward.cooldown_days_remaining(kid_user.id) == 3
+        assert sample_reward.check_claim(kid_user.id) == \
+            (False, "Reward is on cooldown for 3 more days", {'cooldown_days_remaining': 3})
+
+    def test_claim_endpoint_maintains_counters(self, client, kid_headers, sample_reward, kid_user):
+        """Test claiming through the API updates the counters."""
+        response = client.post(f'/api/rewards/{sample_reward.id}/claim', headers=kid_headers)
+        assert response.status_code == 201
+
+        assert db.session.get(Reward, sample_reward.id).approved_claims_count == 1
+        assert RewardUserClaimCount.get_count(sample_reward.id, kid_user.id) == 1
+
 
 # Phase 1 Feature Tests: Reward Approval Workflow
 
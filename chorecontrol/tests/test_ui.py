@@ -37,6 +37,102 @@ class TestDashboard:
         assert response.status_code == 200
         assert b'Pending Approvals' in response.data
 
+    def test_dashboard_recent_activity_window(self, client, parent_headers, parent_user, kid_user, sample_chore):
+        """Test recent activity lists instances updated in the last week only."""
+        from models import db
+        now = datetime.utcnow()
+        for reason, updated_at in (('Fresh rejection', now - timedelta(days=1)),
+                                   ('Stale rejection', now - timedelta(days=10))):
+            db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(), status='rejected',
+                                         claimed_by=kid_user.id, rejected_at=updated_at,
+                                         rejection_reason=reason, updated_at=updated_at))
+        db.session.commit()
+
+        response = client.get('/', headers=parent_headers)
+        assert response.status_code == 200
+        assert b'Fresh rejection' in response.data
+        assert b'Stale rejection' not in response.data
+
+    def test_pending_count_in_one_query(self, parent_user, kid_user, sample_chore, sample_reward):
+        """Test the nav badge count covers chores and rewards in one statement."""
+        from models import db
+        from sqlalchemy import event
+        from routes.ui import get_pending_count
+        db.session.add(ChoreInstance(chore_id=sample_chore.id, status='claimed', claimed_by=kid_user.id))
+        db.session.add(RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                                   points_spent=sample_reward.points_cost, status='pending'))
+        db.session.add(RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                                   points_spent=sample_reward.points_cost, status='approved'))
+        db.session.commit()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            assert get_pending_count() == 2
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+        assert len(statements) == 1
+
+    def test_pending_count_follows_status_changes(self, parent_user, kid_user, sample_chore, sample_reward):
+        """Test the pending counters move with claims, approvals and deletes."""
+        from models import db
+        from routes.ui import get_pending_count
+        instance = ChoreInstance(chore_id=sample_chore.id, status='assigned')
+        claim = RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                            points_spent=sample_reward.points_cost, status='pending')
+        db.session.add_all([instance, claim])
+        db.session.commit()
+        assert get_pending_count() == 1
+
+        instance.status = 'claimed'
+        db.session.commit()
+        assert get_pending_count() == 2
+
+        # Written without reading the expired status first
+        instance.status = 'approved'
+        claim.status = 'rejected'
+        db.session.commit()
+        assert get_pending_count() == 0
+
+        claim.status = 'pending'
+        db.session.commit()
+        db.session.delete(claim)
+        db.session.commit()
+        assert get_pending_count() == 0
+
+    def test_permanent_chore_delete_updates_pending_count(self, client, parent_headers, kid_user, sample_chore):
+        """Test bulk-deleted claimed instances come off the pending count."""
+        from models import db
+        from routes.ui import get_pending_count
+        db.session.add_all([
+            ChoreInstance(chore_id=sample_chore.id, status='claimed', claimed_by=kid_user.id),
+            ChoreInstance(chore_id=sample_chore.id, status='assigned'),
+        ])
+        db.session.commit()
+        assert get_pending_count() == 1
+
+        response = client.delete(f'/api/chores/{sample_chore.id}/permanent', headers=parent_headers)
+        assert response.status_code == 200
+        assert get_pending_count() == 0
+
+    def test_pending_count_queried_once_per_render(self, client, parent_headers, kid_user, sample_chore):
+        """Test the nav badge count is looked up once though the nav shows it twice."""
+        from models import db
+        from sqlalchemy import event
+        db.session.add(ChoreInstance(chore_id=sample_chore.id, status='claimed', claimed_by=kid_user.id))
+        db.session.commit()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.get('/rewards', headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+        assert response.status_code == 200
+        assert len([s for s in statements if 'FROM counters' in s]) == 1
+
     def test_dashboard_requires_auth(self, client):
         """Test that dashboard requires authentication (redirects to login)."""
         response = client.get('/')
@@ -91,6 +187,59 @@ class TestChoresList:
         assert sample_chore.name.encode() in response.data
 
 
+    def test_chores_list_loads_assignments_in_one_query(self, client, parent_headers, parent_user,
+                                                       kid_user, kid_user_2):
+        """Test assignments for the whole page come from one batched query."""
+        from models import db
+        from sqlalchemy import event
+        for i in range(5):
+            chore = Chore(name=f"Assigned Chore {i}", points=5, created_by=parent_user.id,
+                          assignment_type='shared')
+            db.session.add(chore)
+            db.session.flush()
+            for kid in (kid_user, kid_user_2):
+                db.session.add(ChoreAssignment(chore_id=chore.id, user_id=kid.id))
+        db.session.commit()
+        db.session.expire_all()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.get('/chores', headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 200
+        assert kid_user_2.username.encode() in response.data
+        assert sum(s.startswith('SELECT') and 'FROM chore_assignments' in s for s in statements) == 1
+
+    def test_chores_list_skips_unused_columns(self, client, parent_headers, parent_user):
+        """Test the list selects only the columns it shows, without per-row reloads."""
+        from models import db
+        from sqlalchemy import event
+        for i in range(3):
+            db.session.add(Chore(name=f"Column Chore {i}", description=f"Details {i}", points=5,
+                                 late_points=2, created_by=parent_user.id))
+        db.session.commit()
+        db.session.expire_all()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.get('/chores', headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 200
+        assert b'Details 2' in response.data
+        chore_selects = [s for s in statements
+                         if s.startswith('SELECT chores.') and 'FROM chores' in s]
+        assert len(chore_selects) == 1
+        assert 'chores.start_date' not in chore_selects[0]
+
+
 class TestChoreDetail:
     """Tests for chore detail page."""
 
@@ -116,6 +265,22 @@ class TestChoreDetail:
         assert response.status_code == 200
         assert b'Chore Instances' in response.data
 
+    def test_chore_detail_shows_instance_stats(self, client, parent_headers, parent_user, sample_chore):
+        """Test the total and completed instance counts."""
+        import re
+        from models import db
+        db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(), status='assigned'))
+        for _ in range(2):
+            db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(), status='approved',
+                                         approved_at=datetime.utcnow()))
+        db.session.commit()
+
+        response = client.get(f'/chores/{sample_chore.id}', headers=parent_headers)
+        assert response.status_code == 200
+        page = response.get_data(as_text=True)
+        assert re.search(r'>\s*3\s*</div>\s*<div[^>]*>Total Instances<', page)
+        assert re.search(r'>\s*2\s*</div>\s*<div[^>]*>Completed<', page)
+
     def test_chore_detail_404_for_missing_chore(self, client, parent_headers, parent_user):
         """Test that 404 is returned for non-existent chore."""
         response = client.get('/chores/99999', headers=parent_headers)
@@ -178,6 +343,21 @@ class TestRewardsList:
         assert response.status_code == 200
         assert b'Pending Reward Claims' in response.data
 
+    def test_rewards_list_shows_claim_counts(self, client, parent_headers, parent_user, kid_user, sample_reward):
+        """Test per-reward total and pending claim counts."""
+        from models import db
+        db.session.add(Reward(name='Unclaimed reward', points_cost=5))
+        for status in ('pending', 'approved', 'approved'):
+            db.session.add(RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                                       points_spent=sample_reward.points_cost, status=status))
+        db.session.commit()
+
+        response = client.get('/rewards', headers=parent_headers)
+        assert response.status_code == 200
+        assert b'3 total' in response.data
+        assert b'1 pending' in response.data
+        assert b'0 total' in response.data
+
 
 class TestRewardForm:
     """Tests for reward create/edit form."""
@@ -241,6 +421,101 @@ class TestApprovalQueue:
         assert sample_reward.name.encode() in response.data
         assert b'Pending Reward Claims' in response.data
 
+    def test_approval_queue_shows_work_together_with_pending_claims(self, client, parent_headers, parent_user,
+                                                                     kid_user, kid_user_2):
+        """Test closed work-together chores are listed only while a claim awaits approval."""
+        from models import db, ChoreInstanceClaim
+        for name, claim_status in (('Rake leaves together', 'claimed'), ('Paint fence together', 'approved')):
+            chore = Chore(name=name, points=10, recurrence_type='none', assignment_type='shared',
+                          allow_work_together=True, created_by=parent_user.id, is_active=True)
+            db.session.add(chore)
+            db.session.flush()
+            instance = ChoreInstance(chore_id=chore.id, status='claiming_closed',
+                                     claiming_closed_at=datetime.utcnow())
+            db.session.add(instance)
+            db.session.flush()
+            for kid in (kid_user, kid_user_2):
+                db.session.add(ChoreInstanceClaim(chore_instance_id=instance.id, user_id=kid.id,
+                                                  claimed_at=datetime.utcnow(), status=claim_status))
+        db.session.commit()
+
+        response = client.get('/approvals', headers=parent_headers)
+        assert response.status_code == 200
+        assert b'Rake leaves together' in response.data
+        assert kid_user_2.username.encode() in response.data
+        assert b'Paint fence together' not in response.data
+
+
+class TestTodayPage:
+    """Tests for today's chores page."""
+
+    def test_today_page_lists_work_together_chore(self, client, parent_headers, parent_user,
+                                                  kid_user, kid_user_2):
+        """Test that a partly claimed work-together chore is still offered to other kids."""
+        from models import db, ChoreInstanceClaim
+        chore = Chore(
+            name='Wash the car together',
+            points=10,
+            recurrence_type='none',
+            assignment_type='shared',
+            allow_work_together=True,
+            created_by=parent_user.id,
+            is_active=True
+        )
+        db.session.add(chore)
+        db.session.flush()
+        db.session.add_all([
+            ChoreAssignment(chore_id=chore.id, user_id=kid_user.id),
+            ChoreAssignment(chore_id=chore.id, user_id=kid_user_2.id),
+        ])
+        instance = ChoreInstance(chore_id=chore.id, due_date=None, status='assigned')
+        db.session.add(instance)
+        db.session.flush()
+        db.session.add(ChoreInstanceClaim(
+            chore_instance_id=instance.id,
+            user_id=kid_user.id,
+            claimed_at=datetime.utcnow(),
+            status='claimed'
+        ))
+        db.session.commit()
+
+        response = client.get('/today', headers=parent_headers)
+        assert response.status_code == 200
+        assert b'Wash the car together' in response.data
+
+    def test_today_page_query_count_independent_of_instances(self, client, parent_headers, parent_user,
+                                                             kid_user, kid_user_2, sample_chore):
+        """Test that more instances do not add per-instance queries."""
+        from models import db
+        from sqlalchemy import event
+
+        def count_selects():
+            db.session.expire_all()
+            statements = []
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                response = client.get('/today', headers=parent_headers)
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+            assert response.status_code == 200
+            return sum(s.startswith('SELECT') for s in statements)
+
+        chore_id, kid_ids = sample_chore.id, (kid_user.id, kid_user_2.id)
+
+        def add_instances():
+            for kid_id in kid_ids:
+                db.session.add(ChoreInstance(chore_id=chore_id, due_date=None,
+                                             assigned_to=kid_id, status='assigned'))
+            db.session.commit()
+
+        add_instances()
+        count_selects()  # Warm the settings cache
+        baseline = count_selects()
+        for _ in range(3):
+            add_instances()
+        assert count_selects() == baseline
+
 
 class TestUsersList:
     """Tests for users list page."""
@@ -266,6 +541,66 @@ class TestUsersList:
         # Parent might still appear in nav, but should not be in the main list
 
 
+    def test_create_user_suffixes_colliding_ha_user_id(self, client, parent_headers, parent_user):
+        """Test usernames that map to the same local id still get distinct ha_user_ids."""
+        for username in ('sam', 'Sam'):
+            response = client.post('/users/create', data={'username': username, 'role': 'kid'},
+                                   headers=parent_headers)
+            assert response.status_code == 302
+
+        ha_user_ids = {u.username: u.ha_user_id for u in User.query.filter(User.username.in_(['sam', 'Sam']))}
+        assert ha_user_ids['sam'] == 'local-sam'
+        assert ha_user_ids['Sam'].startswith('local-sam-')
+
+    def test_create_user_rejects_duplicate_username(self, client, parent_headers, parent_user, kid_user):
+        """Test an existing username is refused."""
+        response = client.post('/users/create', data={'username': kid_user.username, 'role': 'kid'},
+                               headers=parent_headers)
+        assert response.status_code == 302
+        assert User.query.filter_by(username=kid_user.username).count() == 1
+
+    def test_update_user_changes_fields_in_one_update(self, client, parent_headers, parent_user):
+        """Test rename, role change and password land in a single UPDATE."""
+        from models import db
+        from sqlalchemy import event
+        user = User(ha_user_id='local-promoted', username='promoted', role='parent', points=7)
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        User.kid_options()  # warm the cached kid list
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.post('/users/update', data={
+                'user_id': user_id, 'username': 'renamed', 'role': 'kid', 'password': 'secret123'
+            }, headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 302
+        assert sum(s.startswith('UPDATE users') for s in statements) == 1
+        db.session.expire_all()
+        user = db.session.get(User, user_id)
+        assert (user.username, user.role, user.points) == ('renamed', 'kid', 0)
+        assert user.check_password('secret123')
+        assert (user_id, 'renamed') in User.kid_options()
+
+    def test_update_user_rejects_taken_username(self, client, parent_headers, parent_user, kid_user, kid_user_2):
+        """Test renaming to another user's username leaves the user unchanged."""
+        from models import db
+        kid_id, original, taken = kid_user.id, kid_user.username, kid_user_2.username
+        response = client.post('/users/update', data={
+            'user_id': kid_id, 'username': taken, 'role': 'parent'
+        }, headers=parent_headers)
+
+        assert response.status_code == 302
+        db.session.expire_all()
+        user = db.session.get(User, kid_id)
+        assert (user.username, user.role) == (original, 'kid')
+
+
 class TestUserDetail:
     """Tests for user detail page."""
 
@@ -285,6 +620,25 @@ class TestUserDetail:
         assert b'Current Points' in response.data
         assert b'50' in response.data
 
+    def test_user_detail_shows_kid_stats(self, client, parent_headers, parent_user, kid_user,
+                                         sample_chore, sample_reward):
+        """Test the completed chores, points earned and rewards claimed stats."""
+        import re
+        from models import db
+        kid_user.adjust_points(30, "Earned", created_by_id=parent_user.id)
+        kid_user.adjust_points(-5, "Spent", created_by_id=parent_user.id)
+        db.session.add(ChoreInstance(chore_id=sample_chore.id, status='approved', claimed_by=kid_user.id))
+        db.session.add(RewardClaim(reward_id=sample_reward.id, user_id=kid_user.id,
+                                   points_spent=sample_reward.points_cost, status='approved'))
+        db.session.commit()
+
+        response = client.get(f'/users/{kid_user.id}', headers=parent_headers)
+        assert response.status_code == 200
+        page = response.get_data(as_text=True)
+        assert re.search(r'>\s*1\s*</div>\s*<div[^>]*>Chores Completed<', page)
+        assert re.search(r'>\s*30\s*</div>\s*<div[^>]*>Points Earned<', page)
+        assert re.search(r'>\s*1\s*</div>\s*<div[^>]*>Rewards Claimed<', page)
+
     def test_user_detail_shows_points_history(self, client, parent_headers, parent_user, kid_user):
         """Test that points history is displayed."""
         kid_user.adjust_points(25, "Test adjustment", created_by_id=parent_user.id)
@@ -388,6 +742,53 @@ class TestUIPagination:
         response = client.get(f'/users/{kid_user.id}?page=2', headers=parent_headers)
         assert response.status_code == 200
 
+    @staticmethod
+    def _next_link(response):
+        """Return the Next link's query string from a rendered list page."""
+        import html
+        import re
+        match = re.search(r'href="(\?page=\d+&after=[^"]+)"', response.get_data(as_text=True))
+        assert match, 'page has no Next link'
+        return html.unescape(match.group(1))
+
+    def test_chores_next_link_seeks_past_cursor(self, client, parent_headers, parent_user):
+        """Test the Next link continues after the last chore, even with tied timestamps."""
+        import re
+        from models import db
+        created_at = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(25):
+            db.session.add(Chore(name=f"Seek Chore {i}", points=10,
+                                 created_by=parent_user.id, created_at=created_at))
+        db.session.commit()
+
+        first = client.get('/chores', headers=parent_headers)
+        second = client.get(f'/chores{self._next_link(first)}', headers=parent_headers)
+        assert second.status_code == 200
+
+        names = lambda r: set(re.findall(r'Seek Chore (\d+)\b', r.get_data(as_text=True)))
+        assert len(names(first)) == 20
+        assert names(second) == {str(i) for i in range(25)} - names(first)
+        assert b'Page 2' in second.data
+
+    def test_points_history_next_link_seeks_past_cursor(self, client, parent_headers, parent_user, kid_user):
+        """Test points history pages by cursor over database-stamped timestamps."""
+        import re
+        for i in range(25):
+            kid_user.adjust_points(1, f"Adjustment {i}", created_by_id=parent_user.id)
+
+        first = client.get(f'/users/{kid_user.id}', headers=parent_headers)
+        second = client.get(f'/users/{kid_user.id}{self._next_link(first)}', headers=parent_headers)
+        assert second.status_code == 200
+
+        reasons = lambda r: set(re.findall(r'Adjustment (\d+)\b', r.get_data(as_text=True)))
+        assert reasons(second) == {str(i) for i in range(5)}
+        assert not reasons(first) & reasons(second)
+
+    def test_invalid_cursor_falls_back_to_page(self, client, parent_headers, parent_user):
+        """Test a malformed after cursor is ignored in favour of ?page=."""
+        response = client.get('/chores?page=2&after=not-a-cursor', headers=parent_headers)
+        assert response.status_code == 200
+
 
 class TestUIEmptyStates:
     """Tests for empty state handling in UI."""
@@ -541,3 +942,94 @@ class TestCalendar:
         response = client.get('/calendar', headers=parent_headers)
         assert response.status_code == 200
         assert b'Unassigned' in response.data
+
+    def test_calendar_event_json_is_html_safe(self, client, parent_headers, parent_user, kid_user, sample_chore):
+        """Test that chore names cannot close the calendar's script block."""
+        from models import db
+        sample_chore.name = '</script><b>Dishes</b>'
+        db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=date.today(),
+                                     assigned_to=kid_user.id, status='claimed'))
+        db.session.commit()
+
+        response = client.get('/calendar', headers=parent_headers)
+        assert response.status_code == 200
+        assert b'</script><b>' not in response.data
+        assert b'\\u003c/script\\u003e\\u003cb\\u003eDishes' in response.data
+        assert b'#fb8c00' in response.data
+
+    def test_calendar_filters_by_kid(self, client, parent_headers, parent_user, kid_user, kid_user_2, sample_chore):
+        """Test that kid_id limits the calendar to that kid's instances."""
+        from models import db
+        db.session.add_all([
+            ChoreInstance(chore_id=sample_chore.id, due_date=date.today(),
+                          assigned_to=kid_user.id, status='assigned'),
+            ChoreInstance(chore_id=sample_chore.id, due_date=None,
+                          assigned_to=kid_user_2.id, status='assigned'),
+        ])
+        db.session.commit()
+
+        response = client.get(f'/calendar?kid_id={kid_user.id}', headers=parent_headers)
+        assert response.status_code == 200
+        assert f'{sample_chore.name} - {kid_user.username}'.encode() in response.data
+        assert b'Instances Without Due Date' in response.data
+        assert kid_user_2.username.encode() not in response.data.split(b'Instances Without Due Date', 1)[1]
+
+    def test_calendar_loads_relationships_up_front(self, client, parent_headers, parent_user,
+                                                   kid_user, kid_user_2, sample_chore):
+        """Test that the instance queries do not lazy load chores or assignees per row."""
+        from models import db
+        from sqlalchemy import event
+        for kid in (kid_user, kid_user_2):
+            db.session.add(ChoreAssignment(chore_id=sample_chore.id, user_id=kid.id))
+            for due in (date.today(), date.today() + timedelta(days=1), None):
+                db.session.add(ChoreInstance(chore_id=sample_chore.id, due_date=due,
+                                             assigned_to=kid.id, status='assigned'))
+        db.session.commit()
+        db.session.expunge_all()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.get('/calendar', headers=parent_headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 200
+        assert sum(s.startswith('SELECT') and 'FROM chores' in s for s in statements) == 0
+
+    def test_calendar_query_count_independent_of_instances(self, client, parent_headers, parent_user,
+                                                           kid_user, kid_user_2, sample_chore):
+        """Test that more instances do not add per-instance queries."""
+        from models import db
+        from sqlalchemy import event
+
+        chore_id, kid_ids = sample_chore.id, (kid_user.id, kid_user_2.id)
+        for kid_id in kid_ids:
+            db.session.add(ChoreAssignment(chore_id=chore_id, user_id=kid_id))
+
+        def count_selects():
+            db.session.expire_all()
+            statements = []
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                response = client.get('/calendar', headers=parent_headers)
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+            assert response.status_code == 200
+            return sum(s.startswith('SELECT') for s in statements)
+
+        def add_instances():
+            for kid_id in kid_ids:
+                for due in (date.today(), None):
+                    db.session.add(ChoreInstance(chore_id=chore_id, due_date=due,
+                                                 assigned_to=kid_id, status='assigned'))
+            db.session.commit()
+
+        add_instances()
+        count_selects()  # Warm the settings cache
+        baseline = count_selects()
+        for _ in range(3):
+            add_instances()
+        assert count_selects() == baseline
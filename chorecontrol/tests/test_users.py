@@ -740,3 +740,37 @@ class TestDeleteUser:
         data = response.get_json()
         assert 'error' in data
         assert data['error'] == 'Unauthorized'
+
+
+class TestKidOptions:
+    """Tests for the cached kid list behind the UI dropdowns."""
+
+    def test_kid_options_cached_until_users_change(self, db_session, parent_user, kid_user):
+        """Test repeat calls skip the query and user writes clear the cache."""
+        from sqlalchemy import event
+        from models import db
+
+        assert User.kid_options() == [(kid_user.id, kid_user.username)]
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            User.kid_options()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+        assert statements == []
+
+        # Points changes leave the list alone
+        kid_user.points += 5
+        db_session.commit()
+        assert User.kid_options() == [(kid_user.id, kid_user.username)]
+
+        kid_user.username = 'zz_renamed'
+        db_session.add(User(username='aa_new_kid', ha_user_id='new-kid-ha', role='kid'))
+        db_session.commit()
+        assert [kid.username for kid in User.kid_options()] == ['aa_new_kid', 'zz_renamed']
+
+        kid_user.role = 'parent'
+        db_session.commit()
+        assert [kid.username for kid in User.kid_options()] == ['aa_new_kid']
@@ -95,6 +95,27 @@ class TestWebhookUtility:
 
             assert result is False
 
+    @patch('utils.webhooks.requests.post')
+    def test_webhook_async_delivery(self, mock_post, app, db_session, kid_user):
+        """Test async mode snapshots the payload and posts from the thread pool."""
+        with app.app_context():
+            mock_post.return_value = MagicMock(status_code=200)
+            app.config['HA_WEBHOOK_URL'] = 'http://test.local/webhook'
+            app.config['WEBHOOK_ASYNC'] = True
+
+            from utils import webhooks
+            try:
+                result = webhooks.fire_webhook('test_event', kid_user)
+                kid_user.username = 'renamed'
+                webhooks._get_executor().shutdown(wait=True)
+            finally:
+                webhooks._executor = None
+                app.config['WEBHOOK_ASYNC'] = False
+
+            assert result is True
+            mock_post.assert_called_once()
+            assert mock_post.call_args[1]['json']['data']['username'] != 'renamed'
+
     def test_webhook_no_url_configured(self, app, db_session, kid_user):
         """Test webhook skips when no URL configured."""
         with app.app_context():
@@ -310,7 +331,7 @@ class TestPointsWebhooks:
 class TestChoreCreationWebhooks:
     """Tests for webhooks fired when chores are created."""
 
-    @patch('routes.chores.fire_webhook')
+    @patch('utils.webhooks.fire_webhook')
     def test_create_chore_fires_webhook_for_today_instances(self, mock_webhook, client, db_session, kid_user, parent_user, parent_headers):
         """Test creating a chore fires webhooks for instances due today."""
         response = client.post(
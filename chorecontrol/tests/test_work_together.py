@@ -107,6 +107,18 @@ class TestWorkTogetherClaiming:
         # Should auto-close since all assigned kids have claimed
         assert instance.status == 'claiming_closed'
 
+    def test_claim_fires_webhook_with_claim(self, app, db_session, work_together_instance, wt_kid1):
+        """The claimed webhook should carry the individual claim."""
+        from unittest.mock import patch
+
+        app.config['HA_WEBHOOK_URL'] = 'http://test.local/webhook'
+        with patch('utils.webhooks._deliver', return_value=True) as mock_deliver:
+            InstanceService.claim(work_together_instance.id, wt_kid1.id)
+
+        event_name, payload = mock_deliver.call_args.args[1:]
+        assert event_name == 'chore_instance_claimed'
+        assert payload['data']['claim']['user_id'] == wt_kid1.id
+
     def test_same_kid_cannot_claim_twice(self, db_session, work_together_instance, wt_kid1):
         """Same kid should not be able to claim twice."""
         InstanceService.claim(work_together_instance.id, wt_kid1.id)
@@ -302,3 +314,22 @@ class TestBackwardCompatibility:
         # Second kid cannot claim (already claimed)
         with pytest.raises(BadRequestError):
             InstanceService.claim(instance.id, wt_kid2.id)
+
+    def test_is_work_together_matches_in_python_and_sql(self, db_session, work_together_chore, wt_parent):
+        """Chore.is_work_together gives the same answer on instances and in queries."""
+        regular = Chore(
+            name='Regular Shared Chore',
+            points=10,
+            recurrence_type='none',
+            assignment_type='shared',
+            allow_work_together=False,
+            created_by=wt_parent.id,
+            is_active=True
+        )
+        db_session.add(regular)
+        db_session.commit()
+
+        assert work_together_chore.is_work_together is True
+        assert regular.is_work_together is False
+        matching = Chore.query.filter(Chore.is_work_together).all()
+        assert matching == [work_together_chore]
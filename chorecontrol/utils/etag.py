@@ -0,0 +1,53 @@
+"""
+Conditional GET helpers.
+
+Routes derive a weak ETag from the values their response depends on (ids,
+counts, updated_at timestamps) rather than from the response body, so a
+matching If-None-Match can be answered with 304 before anything is
+serialized.
+"""
+
+import hashlib
+from datetime import date, datetime
+from typing import Any, Optional
+
+from flask import current_app, request
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Build an opaque ETag value from the given version parts.
+
+    Args:
+        *parts: Values identifying this version of the resource
+
+    Returns:
+        Hex digest (without quotes or W/ prefix)
+    """
+    key = '|'.join(
+        p.isoformat() if isinstance(p, (date, datetime)) else repr(p) for p in parts
+    )
+    return hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+
+
+def not_modified(etag: str) -> Optional[Any]:
+    """
+    Return a 304 response if the request's If-None-Match matches etag.
+
+    Args:
+        etag: Value from compute_etag()
+
+    Returns:
+        304 response to return as-is, or None if the client copy is stale
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def with_etag(response: Any, etag: str) -> Any:
+    """Attach etag to a response as a weak validator and return it."""
+    response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,141 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Encodes every jsonify()/tojson call with orjson instead of the stdlib json
+module. Output matches what the API already returns: keys are sorted, and
+naive dates/datetimes become the same ISO 8601 strings .isoformat() produces,
+so serializers can pass date values through untouched.
+
+orjson has no wheel for every add-on architecture (armhf), so when it is not
+installed the same output is produced with the stdlib json module.
+"""
+
+import decimal
+import json
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from flask import current_app, stream_with_context
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the platform's wheels
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """Encode dates like orjson does, then fall back to _default."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return _default(obj)
+
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Encode obj as compact UTF-8 JSON, with orjson when it is installed.
+
+    Int keys are allowed, like the stdlib encoder; sort_keys matches Flask's
+    default key ordering.
+    """
+    if orjson is None:
+        return json.dumps(
+            obj, default=_stdlib_default, sort_keys=sort_keys,
+            separators=(',', ':'), ensure_ascii=False
+        ).encode()
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using orjson for encoding and decoding."""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return _dumps(obj, sort_keys=True).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        # The session serializer passes object_hook, which orjson does not support
+        if kwargs or orjson is None:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            _dumps(obj, sort_keys=True),
+            mimetype=self.mimetype
+        )
+
+
+def json_response(payload: Any, status: int = 200):
+    """Build a JSON response straight from encoded bytes.
+
+    Used by the large list endpoints: skips the provider's key sorting and
+    the str round-trip, so keys keep the order the serializer built them in.
+    """
+    return current_app.response_class(
+        _dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _iter_json_page(rows: Iterable[Any], serialize: Callable[[Any], Any], limit: Optional[int],
+                    build_meta: Callable[[int, bool, Optional[Any]], dict],
+                    key: str = 'data') -> Iterator[bytes]:
+    yield b'{' + _dumps(key) + b':['
+    count = 0
+    last = None
+    has_more = False
+    for row in rows:
+        if count == limit:
+            # Only a row past a sent one marks another page
+            has_more = last is not None
+            break
+        if count:
+            yield b','
+        yield _dumps(serialize(row))
+        last = row
+        count += 1
+
+    meta = build_meta(count, has_more, last)
+    if not meta:
+        yield b']}'
+        return
+    # Splice the metadata keys into the enclosing object
+    yield b'],' + _dumps(meta)[1:]
+
+
+def stream_json_page(rows: Iterable[Any], serialize: Callable[[Any], Any], limit: Optional[int],
+                     build_meta: Callable[[int, bool, Optional[Any]], dict], key: str = 'data'):
+    """Stream a {"data": [...], ...meta} page one row at a time.
+
+    rows should yield up to limit + 1 items (e.g. a query with
+    .limit(limit + 1).yield_per(n)); the extra row only marks that another
+    page exists. Pass limit=None to send every row. build_meta(count,
+    has_more, last_row) returns the keys that follow the list, so it can
+    build a cursor from the last row sent. key names the list field.
+
+    The rows are fetched before the response is returned, so a database
+    error is raised in the calling route, where its error handling still
+    applies, rather than after the 200 status has been sent; only the
+    encoding is streamed.
+    """
+    rows = list(rows if limit is None else islice(rows, limit + 1))
+    return current_app.response_class(
+        stream_with_context(_iter_json_page(rows, serialize, limit, build_meta, key)),
+        mimetype='application/json'
+    )
@@ -0,0 +1,37 @@
+"""
+Loading helpers shared by the routes and services.
+"""
+
+from flask import current_app
+from sqlalchemy.orm import raiseload
+
+from models import db
+
+
+def with_raiseload(*options):
+    """Add raiseload('*') to query options when SQLALCHEMY_RAISELOAD is enabled.
+
+    Any relationship not covered by an explicit loader then raises instead of
+    lazy loading, so missing eager loads show up in tests rather than as N+1
+    queries in production.
+    """
+    if current_app.config.get('SQLALCHEMY_RAISELOAD'):
+        options += (raiseload('*'),)
+    return options
+
+
+def commit_keep_loaded():
+    """Commit the request's session without expiring loaded attributes.
+
+    Write endpoints build their response from the objects they just saved;
+    with the default expire_on_commit every object read afterwards would be
+    reloaded with its own SELECT. Values generated by the database must
+    already be loaded (eager_defaults), or they are fetched on first access.
+    """
+    session = db.session()
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = previous
@@ -0,0 +1,136 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor holds the sort key of the last row on a page, JSON-encoded and
+base64url-wrapped so clients can treat it as an opaque token. The next page
+is fetched by filtering for rows that sort after that key instead of using
+OFFSET, so deep pages cost the same as the first one.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import String, and_, or_, tuple_, type_coerce
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a row's sort key as an opaque cursor string.
+
+    Args:
+        *values: Sort key values (dates/datetimes are stored as ISO strings)
+
+    Returns:
+        URL-safe cursor string
+    """
+    key = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+        size: Expected number of values in the sort key
+
+    Returns:
+        List of sort key values (dates still as ISO strings)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError('Invalid cursor')
+
+    return key
+
+
+def due_date_keyset_filter(model: Any, cursor: str):
+    """
+    Build the WHERE clause for the page after a (due_date, id) cursor.
+
+    Rows are ordered by due_date DESC, id DESC; due_date is nullable and
+    NULLs sort last in descending order.
+
+    Args:
+        model: Mapped class with due_date and id columns
+        cursor: Cursor from encode_cursor(due_date, id)
+
+    Returns:
+        SQL expression selecting rows after the cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        cursor_due_date, cursor_id = decode_cursor(cursor, 2)
+        cursor_id = int(cursor_id)
+        if cursor_due_date is not None:
+            cursor_due_date = date.fromisoformat(cursor_due_date)
+    except (TypeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if cursor_due_date is None:
+        return and_(model.due_date.is_(None), model.id < cursor_id)
+    return or_(
+        model.due_date < cursor_due_date,
+        and_(model.due_date == cursor_due_date, model.id < cursor_id),
+        model.due_date.is_(None)
+    )
+
+
+def created_at_sort_key(model: Any):
+    """
+    The model's created_at column compared as the text SQLite stores.
+
+    Timestamps written by Python and by the sql_utcnow() server default
+    differ in fractional-second precision, so a parsed datetime can compare
+    unequal to the row it was read from. Seeking on the stored text keeps
+    the cursor consistent with ORDER BY created_at.
+
+    Args:
+        model: Mapped class with a created_at column
+
+    Returns:
+        Column expression to select and order by
+    """
+    return type_coerce(model.created_at, String)
+
+
+def created_at_keyset_filter(model: Any, cursor: str):
+    """
+    Build the WHERE clause for the page after a (created_at, id) cursor.
+
+    Rows are ordered by created_at DESC, id DESC, and the cursor holds
+    created_at as returned by created_at_sort_key().
+
+    Args:
+        model: Mapped class with created_at and id columns
+        cursor: Cursor from encode_cursor(created_at text, id)
+
+    Returns:
+        SQL expression selecting rows after the cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        cursor_created_at, cursor_id = decode_cursor(cursor, 2)
+        cursor_id = int(cursor_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if not isinstance(cursor_created_at, str):
+        raise ValueError('Invalid cursor')
+
+    return tuple_(created_at_sort_key(model), model.id) < (cursor_created_at, cursor_id)
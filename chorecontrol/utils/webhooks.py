@@ -3,12 +3,31 @@ Webhook utilities for Home Assistant integration.
 """
 
 import requests
-from datetime import datetime
-from typing import Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Iterable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared webhook thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        from flask import current_app
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=current_app.config.get('WEBHOOK_WORKERS', 4),
+                    thread_name_prefix='webhook'
+                )
+    return _executor
+
 
 def get_webhook_url() -> Optional[str]:
     """Get the configured webhook URL."""
@@ -50,14 +69,20 @@ def fire_webhook(event_name: str, obj: Any, **kwargs) -> bool:
     """
     Fire a webhook to Home Assistant.
 
+    The payload is built immediately, while obj is still attached to the
+    request's session. With WEBHOOK_ASYNC enabled the HTTP POST is then
+    handed to a background thread pool so the caller does not wait on it.
+
     Args:
         event_name: Name of the event
         obj: Model instance
         **kwargs: Additional event-specific data
 
     Returns:
-        True if successful, False otherwise
+        True if delivered (or queued for delivery), False otherwise
     """
+    from flask import current_app
+
     webhook_url = get_webhook_url()
 
     if not webhook_url:
@@ -66,6 +91,15 @@ def fire_webhook(event_name: str, obj: Any, **kwargs) -> bool:
 
     payload = build_payload(event_name, obj, **kwargs)
 
+    if current_app.config.get('WEBHOOK_ASYNC'):
+        _get_executor().submit(_deliver, webhook_url, event_name, payload)
+        return True
+
+    return _deliver(webhook_url, event_name, payload)
+
+
+def _deliver(webhook_url: str, event_name: str, payload: dict) -> bool:
+    """POST a prepared payload to the webhook URL."""
     try:
         response = requests.post(
             webhook_url,
@@ -88,3 +122,23 @@ def fire_webhook(event_name: str, obj: Any, **kwargs) -> bool:
     except Exception as e:
         logger.error(f"Unexpected error firing webhook {event_name}: {e}")
         return False
+
+
+def fire_instance_created_webhooks(instances: Iterable[Any], today: date) -> int:
+    """
+    Fire chore_instance_created for newly generated instances that are
+    actionable now (due today or with no due date).
+
+    Args:
+        instances: Newly created ChoreInstance objects
+        today: Today's date in the configured timezone
+
+    Returns:
+        Number of webhooks fired
+    """
+    fired = 0
+    for instance in instances:
+        if instance.due_date is None or instance.due_date == today:
+            fire_webhook('chore_instance_created', instance)
+            fired += 1
+    return fired